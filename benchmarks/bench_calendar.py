@@ -0,0 +1,39 @@
+"""월별 영업일 조회 비용 측정
+
+1995 ~ 2020년(312개월)의 월별 영업일을 get_previous_business_days로 조회한다.
+거래일 달력이 이미 만들어진 상태(파일로 저장된 달력을 읽은 경우와 같음)에서
+요청 없이 반환되는 시간을 측정한다. 달력은 평일을 거래일로 하는 임의의 값이다.
+
+    python benchmarks/bench_calendar.py
+"""
+
+import time
+
+import pandas as pd
+
+from pykrx import stock
+from pykrx.website.krx.calendar import TradingCalendar, set_calendar
+
+
+def fake_fetch(start, end):
+    days = pd.bdate_range(
+        pd.Timestamp.fromordinal(start), pd.Timestamp.fromordinal(end)
+    )
+    return [day.toordinal() for day in days]
+
+
+if __name__ == "__main__":
+    TradingCalendar._fetch = staticmethod(fake_fetch)
+    calendar = TradingCalendar()
+    calendar.build("19950101", "20201231")
+    set_calendar(calendar)
+
+    months = [(year, month) for year in range(1995, 2021) for month in range(1, 13)]
+    start = time.perf_counter()
+    for year, month in months:
+        stock.get_previous_business_days(year=year, month=month)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(months)} months: {elapsed * 1000:.1f} ms "
+        f"({elapsed / len(months) * 1e6:.0f} us/month)"
+    )
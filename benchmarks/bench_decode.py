@@ -0,0 +1,66 @@
+"""KRX 응답 레코드 -> DataFrame 변환 비용 측정
+
+전종목시세(MDCSTAT01501) 전종목 응답(tests/cassettes에 기록된 2,531 종목)을
+대상으로 기존 방식(DataFrame(records) 후 컬럼 선택)과 build_frame의 컬럼 단위
+변환을 비교한다.
+
+    python benchmarks/bench_decode.py
+"""
+
+import json
+import timeit
+from functools import partial
+from pathlib import Path
+
+import yaml
+from pandas import DataFrame
+
+from pykrx.website.krx.decode import build_frame
+
+CASSETTE = (
+    Path(__file__).parent.parent
+    / "tests/cassettes/TestStockMarketCapByTicker.test_with_a_businessday.yaml"
+)
+
+# get_market_ohlcv_by_ticker 가 사용하는 컬럼
+COLUMNS = [
+    "ISU_SRT_CD",
+    "TDD_OPNPRC",
+    "TDD_HGPRC",
+    "TDD_LWPRC",
+    "TDD_CLSPRC",
+    "ACC_TRDVOL",
+    "ACC_TRDVAL",
+    "FLUC_RT",
+    "MKTCAP",
+]
+
+REPEAT = 50
+
+
+def load_records() -> list:
+    with open(CASSETTE, encoding="utf-8") as f:
+        cassette = yaml.safe_load(f)
+    for interaction in cassette["interactions"]:
+        body = interaction["response"]["body"]["string"]
+        if "OutBlock_1" in body:
+            return json.loads(body)["OutBlock_1"]
+    raise RuntimeError("OutBlock_1 response not found")
+
+
+def list_of_dicts(records):
+    return DataFrame(records)[COLUMNS]
+
+
+def columnar(records):
+    return build_frame(records, COLUMNS)
+
+
+if __name__ == "__main__":
+    records = load_records()
+    assert list_of_dicts(records).equals(columnar(records))
+
+    print(f"{len(records)} rows x {len(records[0])} columns -> {len(COLUMNS)} columns")
+    for func in (list_of_dicts, columnar):
+        elapsed = min(timeit.repeat(partial(func, records), number=REPEAT, repeat=5))
+        print(f"{func.__name__:<15}{elapsed / REPEAT * 1000:>8.2f} ms")
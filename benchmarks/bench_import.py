@@ -0,0 +1,58 @@
+"""`import pykrx.stock` 의 cold-start 비용 측정
+
+matplotlib 설정을 지연하기 전의 비용은 `import pykrx.stock` 직후
+`matplotlib.pyplot` 을 import 해서 재현한다 (폰트 등록은 pyplot import 시점에
+실행된다).
+
+    python benchmarks/bench_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+REPEAT = 7
+
+CASES = {
+    "import pykrx.stock": "import pykrx.stock",
+    "import pykrx.stock + pyplot (before)": (
+        "import pykrx.stock; import matplotlib.pyplot"
+    ),
+    "krx bond only": (
+        "from pykrx.website import krx; krx.get_otc_treasury_yields_by_date"
+    ),
+    "krx all subpackages": (
+        "from pykrx.website import krx; krx.market, krx.etx, krx.future, krx.bond"
+    ),
+}
+
+SNIPPET = """
+import resource, sys, time
+t = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - t
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss, len(sys.modules))
+"""
+
+
+def measure(stmt: str):
+    times, rss, modules = [], [], []
+    for _ in range(REPEAT):
+        out = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(stmt=stmt)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        rss.append(int(out[1]))
+        modules.append(int(out[2]))
+    return statistics.median(times), statistics.median(rss), modules[0]
+
+
+if __name__ == "__main__":
+    print(f"{'case':<40}{'time(ms)':>10}{'maxrss(KB)':>12}{'modules':>9}")
+    for name, stmt in CASES.items():
+        elapsed, rss, modules = measure(stmt)
+        print(f"{name:<40}{elapsed * 1000:>10.1f}{rss:>12}{modules:>9}")
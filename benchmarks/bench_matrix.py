@@ -0,0 +1,71 @@
+"""패널 로딩 비용 측정: pickle DataFrame vs PanelMatrix(memory-map)
+
+5년(1,250 거래일) x 2,500 종목의 OHLCV 패널을 임의로 만들어 (날짜, 티커)
+DataFrame pickle을 읽고 한 달 종가를 꺼내는 시간과, PanelMatrix를 열고 같은
+구간을 읽는 시간을 비교한다.
+
+    python benchmarks/bench_matrix.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pykrx.stock.matrix import PanelMatrix
+
+DAYS = 1250
+TICKERS = 2500
+
+
+def make_panel() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2017-01-02", periods=DAYS)
+    tickers = [f"{i:06d}" for i in range(TICKERS)]
+    index = pd.MultiIndex.from_product([dates, tickers], names=["날짜", "티커"])
+    n = len(index)
+    close = rng.integers(1000, 100000, n, dtype=np.int32)
+    return pd.DataFrame(
+        {
+            "시가": close,
+            "고가": close,
+            "저가": close,
+            "종가": close,
+            "거래량": rng.integers(0, 10**7, n, dtype=np.int32),
+            "거래대금": rng.integers(0, 10**11, n, dtype=np.int64),
+            "등락률": rng.standard_normal(n).astype(np.float32),
+        },
+        index=index,
+    )
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    panel = make_panel()
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle = Path(tmp) / "panel.pkl"
+        panel.to_pickle(pickle)
+        PanelMatrix.save(panel, Path(tmp) / "matrix")
+        del panel
+
+        def from_pickle():
+            df = pd.read_pickle(pickle)
+            return df["종가"].unstack().loc["2021-06-01":"2021-06-30"].to_numpy()
+
+        def from_matrix():
+            m = PanelMatrix(Path(tmp) / "matrix")
+            return np.asarray(m.values("종가", "20210601", "20210630"))
+
+        assert (from_pickle() == from_matrix()).all()
+        print(f"{DAYS} days x {TICKERS} tickers, 7 fields")
+        for func in (from_pickle, from_matrix):
+            print(
+                f"{func.__name__:<12}{min(elapsed(func) for _ in range(3)):>10.2f} ms"
+            )
@@ -0,0 +1,91 @@
+"""Naver 시세 XML 디코딩 비용 측정
+
+기존 방식(et.fromstring으로 전체 트리 생성 -> data 속성 split -> 문자열
+DataFrame -> astype(int64))과 _decode_sise(XMLPullParser로 조각 단위 파싱,
+레코드를 int64 배열에 바로 채움)로 get_market_ohlcv_by_date를 수행하는 시간을
+비교한다. 응답은 tests/cassettes 에 기록된 삼성전자 일봉(2,832개)과 같은
+형식으로 만든 30년(7,800개) 일봉을 사용한다.
+
+    python benchmarks/bench_naver.py
+"""
+
+import time
+import xml.etree.ElementTree as et
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+from pandas import DataFrame
+
+from pykrx.website.naver import core, wrap
+
+CASSETTE = (
+    Path(__file__).parent.parent
+    / "tests/cassettes/TestStockOhlcvByDateTest.test_ohlcv_with_adjusted.yaml"
+)
+
+
+def load_cassette() -> str:
+    with open(CASSETTE, encoding="utf-8") as f:
+        cassette = yaml.safe_load(f)
+    for interaction in cassette["interactions"]:
+        if "naver" in interaction["request"]["uri"]:
+            return interaction["response"]["body"]["string"].decode("euc-kr")
+    raise RuntimeError("Naver 응답이 없습니다.")
+
+
+def make_xml(days: int) -> str:
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range(end="2026-01-23", periods=days).strftime("%Y%m%d")
+    close = rng.integers(1000, 100000, days)
+    items = "\n".join(
+        f'\t\t\t\t<item data="{d}|{c}|{c + 100}|{c - 100}|{c}|{v}" />'
+        for d, c, v in zip(dates, close, rng.integers(0, 10**8, days), strict=True)
+    )
+    return (
+        '<?xml version="1.0" encoding="EUC-KR" ?>\n<protocol>\n'
+        f'\t<chartdata symbol="005930" name="삼성전자" count="{days}" '
+        f'timeframe="day" precision="0" origintime="19900103">\n{items}\n'
+        "\t</chartdata>\n</protocol>"
+    )
+
+
+def tree_decode(xml: str, fromdate: str, todate: str) -> DataFrame:
+    """기존 디코딩 방식 (전체 트리 생성 후 문자열 DataFrame 변환)"""
+    strtd, lastd = pd.to_datetime(fromdate), pd.to_datetime(todate)
+    result = []
+    for node in et.fromstring(xml).iter(tag="item"):
+        result.append(node.get("data").split("|"))
+    df = DataFrame(result, columns=["날짜", "시가", "고가", "저가", "종가", "거래량"])
+    df = df.set_index("날짜")
+    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df = df.astype(np.int64)
+    close_1d = df["종가"].shift(1)
+    df["등락률"] = (df["종가"] - close_1d) / close_1d * 100
+    return df.loc[(strtd <= df.index) & (df.index <= lastd)]
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    responses = {"cassette": load_cassette(), "30 years": make_xml(7800)}
+    ranges = {"full": ("19900101", "20261231"), "1 year": ("20200101", "20201231")}
+    for label, xml in responses.items():
+        core.Sise.fetch = lambda self, ticker, count, xml=xml: xml
+        for span, (fromdate, todate) in ranges.items():
+            cases = {
+                "tree": partial(tree_decode, xml, fromdate, todate),
+                "stream": partial(
+                    wrap.get_market_ohlcv_by_date, fromdate, todate, "005930"
+                ),
+            }
+            pd.testing.assert_frame_equal(cases["tree"](), cases["stream"]())
+            print(f"{label} / {span}")
+            for name, func in cases.items():
+                print(f"  {name:<10}{min(elapsed(func) for _ in range(5)):>10.2f} ms")
@@ -0,0 +1,49 @@
+"""KRX 숫자 문자열("1,234", "-", "", "-1.90") 변환 비용 측정
+
+get_market_ohlcv_by_ticker의 전종목 응답(2,531 종목)을 대상으로 기존의
+정규식 df.replace 연쇄 + astype과 parse_numeric을 비교한다.
+
+    python benchmarks/bench_parse.py
+"""
+
+import timeit
+from functools import partial
+
+import numpy as np
+from bench_decode import COLUMNS, load_records
+
+from pykrx.website.krx.decode import build_frame, parse_numeric
+
+DTYPES = {
+    "TDD_OPNPRC": np.int32,
+    "TDD_HGPRC": np.int32,
+    "TDD_LWPRC": np.int32,
+    "TDD_CLSPRC": np.int32,
+    "ACC_TRDVOL": np.int32,
+    "ACC_TRDVAL": np.int64,
+    "FLUC_RT": np.float32,
+    "MKTCAP": np.int64,
+}
+
+REPEAT = 20
+
+
+def regex_replace(df):
+    df = df.replace(r"[^-\w\.]", "", regex=True)
+    df = df.replace(r"\-$", "0", regex=True)
+    df = df.replace("", "0")
+    return df.astype(DTYPES)
+
+
+def single_pass(df):
+    return parse_numeric(df, DTYPES)
+
+
+if __name__ == "__main__":
+    df = build_frame(load_records(), COLUMNS).set_index("ISU_SRT_CD")
+    assert regex_replace(df).equals(single_pass(df))
+
+    print(f"{len(df)} rows x {len(df.columns)} numeric columns")
+    for func in (regex_replace, single_pass):
+        elapsed = min(timeit.repeat(partial(func, df), number=REPEAT, repeat=5))
+        print(f"{func.__name__:<15}{elapsed / REPEAT * 1000:>8.2f} ms")
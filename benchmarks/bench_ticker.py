@@ -0,0 +1,71 @@
+"""티커 -> ISIN 조회 비용 측정
+
+tests/cassettes/common/finder_init.yaml 에 기록된 상장/상장폐지 종목 목록으로
+StockTicker를 만들고, 상장 종목 전체의 ISIN을 조회하는 시간을 비교한다.
+
+  - loc       : 기존 방식 (index 포함 여부 확인 후 .loc, 중복 티커는 매번 정렬)
+  - lookup    : get_stock_ticker_isin(ticker)를 티커마다 호출
+  - resolve   : get_stock_ticker_isin(tickers) 한 번 호출
+
+    python benchmarks/bench_ticker.py
+"""
+
+import json
+import time
+from pathlib import Path
+
+import yaml
+from pandas import DataFrame
+
+from pykrx.website.krx.market import core
+from pykrx.website.krx.market.ticker import StockTicker, get_stock_ticker_isin
+
+CASSETTE = Path(__file__).parent.parent / "tests/cassettes/common/finder_init.yaml"
+
+
+def load_blocks() -> dict:
+    with open(CASSETTE, encoding="utf-8") as f:
+        cassette = yaml.safe_load(f)
+    blocks = {}
+    for interaction in cassette["interactions"]:
+        bld = (
+            "listdelisu" if "listdelisu" in interaction["request"]["body"] else "stkisu"
+        )
+        blocks[bld] = json.loads(interaction["response"]["body"]["string"])["block1"]
+    return blocks
+
+
+def loc_isin(st, ticker):
+    df = st.listed
+    if ticker not in df.index:
+        df = st.delisted
+        if ticker not in df.index:
+            return None
+        elif isinstance(df.loc[ticker], DataFrame):
+            df = df.loc[ticker].sort_values("ISIN").iloc[:1]
+    return df.loc[ticker]["ISIN"]
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    blocks = load_blocks()
+    for cls, bld in ((core.상장종목검색, "stkisu"), (core.상폐종목검색, "listdelisu")):
+        cls.fetch = lambda self, market, bld=bld: self.decode(blocks[bld])
+    st = StockTicker()
+
+    tickers = list(st.listed.index) + list(st.delisted.index[:1000])
+    cases = {
+        "loc": lambda: [loc_isin(st, t) for t in tickers],
+        "lookup": lambda: [get_stock_ticker_isin(t) for t in tickers],
+        "resolve": lambda: get_stock_ticker_isin(tickers),
+    }
+    expected = cases["loc"]()
+    print(f"{len(tickers)} tickers")
+    for name, func in cases.items():
+        assert func() == expected
+        print(f"{name:<10}{min(elapsed(func) for _ in range(3)):>10.2f} ms")
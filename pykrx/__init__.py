@@ -1,24 +1,10 @@
-import importlib.resources as resources
-import platform
+from . import _font, bond, stock
+from ._font import setup_korean_font
 
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
+# matplotlib 은 pyplot 을 처음 import 할 때 한글 폰트를 설정한다.
+_font.install()
 
-from . import bond, stock
-
-os = platform.system()
-
-if os == "Darwin":
-    plt.rc("font", family="AppleGothic")
-else:
-    with resources.path("pykrx", "NanumBarunGothic.ttf") as font_path:
-        fe = fm.FontEntry(fname=str(font_path), name="NanumBarunGothic")
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rc("font", family=fe.name)
-
-plt.rcParams["axes.unicode_minus"] = False
-
-__all__ = ["bond", "stock"]
+__all__ = ["bond", "stock", "setup_korean_font"]
 
 # Version is automatically managed by setuptools_scm from git tags
 try:
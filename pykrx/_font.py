@@ -0,0 +1,58 @@
+import importlib.abc
+import importlib.resources as resources
+import importlib.util
+import platform
+import sys
+
+
+def setup_korean_font() -> None:
+    """matplotlib 에서 한글이 깨지지 않도록 폰트를 설정
+
+    macOS는 AppleGothic, 그 외 OS는 pykrx에 포함된 NanumBarunGothic을
+    사용한다. matplotlib.pyplot 이 처음 import 될 때 자동으로 호출된다.
+    """
+    import matplotlib.font_manager as fm
+    import matplotlib.pyplot as plt
+
+    if platform.system() == "Darwin":
+        plt.rc("font", family="AppleGothic")
+    else:
+        with resources.path("pykrx", "NanumBarunGothic.ttf") as font_path:
+            fe = fm.FontEntry(fname=str(font_path), name="NanumBarunGothic")
+            fm.fontManager.ttflist.insert(0, fe)
+            plt.rc("font", family=fe.name)
+
+    plt.rcParams["axes.unicode_minus"] = False
+
+
+class _Loader(importlib.abc.Loader):
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        setup_korean_font()
+
+
+class _PyplotFinder(importlib.abc.MetaPathFinder):
+    """matplotlib.pyplot 이 import 된 직후 setup_korean_font()를 호출"""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "matplotlib.pyplot":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _Loader(spec.loader)
+        return spec
+
+
+def install() -> None:
+    """폰트 설정을 matplotlib.pyplot 의 첫 import 시점으로 미룬다."""
+    if "matplotlib.pyplot" in sys.modules:
+        setup_korean_font()
+    elif not any(isinstance(f, _PyplotFinder) for f in sys.meta_path):
+        sys.meta_path.insert(0, _PyplotFinder())
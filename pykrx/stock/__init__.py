@@ -1,2 +1,5 @@
 from .future_api import *
+from .matrix import PanelMatrix
 from .stock_api import *
+from .store import MarketStore
+from .universe import UniverseIndex, set_universe
@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pykrx.website.comm import propagate_errors
+
+# 티커/일자 리스트를 조회할 때 동시에 요청할 최대 개수 (요청 간격은 host 별
+# 요청 한도가 조절한다)
+TICKER_BATCH_WORKERS = 8
+
+
+def fetch_concurrently(fetch, keys: list) -> tuple:
+    """keys 각각에 대해 fetch(key)를 동시에 호출
+
+    wrap 함수의 예외는 빈 DataFrame으로 바뀌지 않고 키별 오류로 기록된다.
+
+    Returns:
+        tuple: ({key: DataFrame}, {key: 오류 사유})
+    """
+
+    def _fetch(key):
+        try:
+            with propagate_errors():
+                return fetch(key), None
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+
+    workers = max(1, min(TICKER_BATCH_WORKERS, len(keys)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_fetch, keys))
+
+    frames, errors = {}, {}
+    for key, (df, error) in zip(keys, results, strict=True):
+        if error is not None:
+            errors[key] = error
+        elif df.empty:
+            errors[key] = "empty result"
+        else:
+            frames[key] = df
+    return frames, errors
@@ -0,0 +1,205 @@
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+META = "meta.json"
+
+
+def _save_array(directory: Path, name: str, array: np.ndarray) -> None:
+    with open(directory / name, "wb") as f:
+        np.save(f, array, allow_pickle=False)
+
+
+def _write_build(directory: Path, df: DataFrame) -> dict:
+    """패널을 directory에 행렬 파일로 쓰고 {필드: 파일 이름}을 반환"""
+    date_codes, dates = pd.factorize(df.index.get_level_values(0), sort=True)
+    ticker_codes, tickers = pd.factorize(df.index.get_level_values(1), sort=True)
+    shape = (len(dates), len(tickers))
+
+    mask = np.zeros(shape, dtype=bool)
+    mask[date_codes, ticker_codes] = True
+    _save_array(directory, "mask.npy", mask)
+
+    fields = {}
+    for i, col in enumerate(df.columns):
+        dtype = df[col].dtype
+        if not (isinstance(dtype, np.dtype) and dtype.kind in "iufb"):
+            continue
+        values = np.zeros(shape, dtype=dtype)
+        values[date_codes, ticker_codes] = df[col].to_numpy()
+        file = f"field{i}.npy"
+        _save_array(directory, file, values)
+        fields[str(col)] = file
+
+    _save_array(
+        directory,
+        "dates.npy",
+        pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[D]"),
+    )
+    _save_array(directory, "tickers.npy", np.asarray(tickers, dtype=str))
+    return fields
+
+
+def _remove_old_builds(root: Path, keep: str) -> None:
+    # 직전 빌드는 교체 직전에 meta.json을 읽은 reader를 위해 남겨 둔다.
+    builds = sorted(
+        (x for x in root.glob("build-*") if x.is_dir() and x.name != keep),
+        key=lambda x: x.stat().st_mtime,
+    )
+    for build in builds[:-1]:
+        # 이미 memory-map으로 열린 파일은 삭제 후에도 읽을 수 있다 (POSIX).
+        shutil.rmtree(build, ignore_errors=True)
+
+
+class PanelMatrix:
+    """날짜 x 티커 행렬을 memory-map으로 읽는 패널 저장 형식
+
+    필드(시가, 종가, ...)마다 고정 dtype의 2차원 .npy 파일 하나를 저장하고,
+    행/열에 해당하는 거래일과 티커 목록을 함께 저장한다. 파일은 읽기 전용
+    memory-map으로 열리므로 DataFrame 역직렬화 비용이 없고, 같은 파일을 여는
+    여러 프로세스는 page cache의 물리 메모리 하나를 공유한다.
+
+    행렬은 날짜 순서의 C-order로 저장되므로 기간 조회는 복사 없이 view를
+    반환한다. 특정 티커만 고르는 경우에는 선택된 열만 복사된다. 데이터가 없는
+    칸은 0이며, 존재 여부는 mask로 구분한다.
+
+    >> PanelMatrix.save(stock.get_market_ohlcv_panel("20210104", "20211230"), path)
+    >> m = PanelMatrix(path)
+    >> close = m.values("종가", "20210601", "20210630")   # np.memmap view
+    >> m.frame("종가", tickers=["005930", "000660"])
+
+    Args:
+        path (str): save로 만든 디렉터리
+    """
+
+    def __init__(self, path):
+        self.path = Path(path).expanduser()
+        with open(self.path / META, encoding="utf-8") as f:
+            meta = json.load(f)
+        # meta.json이 가리키는 빌드의 배열을 한 번에 연다. 이후 save가 새 빌드로
+        # 교체해도 이 객체는 열 때의 빌드만 읽는다.
+        directory = self.path / meta["version"]
+        self.fields = meta["fields"]
+        self.dates = pd.DatetimeIndex(
+            np.load(directory / "dates.npy", allow_pickle=False), name="날짜"
+        )
+        self.tickers = pd.Index(
+            np.load(directory / "tickers.npy", allow_pickle=False), name="티커"
+        )
+        self._arrays = {
+            name: np.load(directory / name, mmap_mode="r", allow_pickle=False)
+            for name in ["mask.npy", *self.fields.values()]
+        }
+
+    @staticmethod
+    def save(df: DataFrame, path) -> "PanelMatrix":
+        """(날짜, 티커) MultiIndex 패널을 행렬 형식으로 저장
+
+        숫자 컬럼만 저장하며 dtype은 패널의 dtype을 그대로 사용한다. 빌드마다
+        새 하위 디렉터리에 저장한 후 meta.json을 교체하므로, 이미 열려 있는
+        PanelMatrix는 이전 빌드를 계속 읽는다.
+
+        Args:
+            df   (DataFrame): get_market_ohlcv_panel, MarketStore.read 등의 결과
+            path (str      ): 저장할 디렉터리
+
+        Returns:
+            PanelMatrix: 저장된 행렬
+        """
+        if not isinstance(df.index, pd.MultiIndex) or df.index.nlevels != 2:
+            raise ValueError("(날짜, 티커) MultiIndex DataFrame이 필요합니다.")
+
+        root = Path(path).expanduser()
+        root.mkdir(parents=True, exist_ok=True)
+        # 다른 사용자의 reader도 읽을 수 있도록 umask를 따르는 권한으로 만든다.
+        # 숨긴 디렉터리에 모두 쓴 후 build-* 이름으로 한 번에 옮긴다.
+        version = f"build-{uuid.uuid4().hex}"
+        directory = root / f".{version}.tmp"
+        os.makedirs(directory, mode=0o755)
+
+        try:
+            fields = _write_build(directory, df)
+            os.rename(directory, root / version)
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+
+        # 완성된 빌드를 가리키도록 meta.json을 한 번에 교체한다.
+        tmp = root / f".{META}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "fields": fields}, f, ensure_ascii=False)
+        os.replace(tmp, root / META)
+        _remove_old_builds(root, keep=version)
+        return PanelMatrix(root)
+
+    def _array(self, name: str) -> np.memmap:
+        return self._arrays[name]
+
+    def _rows(self, fromdate, todate) -> slice:
+        start = (
+            0 if fromdate is None else self.dates.searchsorted(pd.Timestamp(fromdate))
+        )
+        stop = (
+            len(self.dates)
+            if todate is None
+            else self.dates.searchsorted(pd.Timestamp(todate), side="right")
+        )
+        return slice(start, stop)
+
+    def _columns(self, tickers):
+        if tickers is None:
+            return slice(None)
+        columns = self.tickers.get_indexer(tickers)
+        if (columns < 0).any():
+            missing = [t for t, c in zip(tickers, columns, strict=True) if c < 0]
+            raise KeyError(f"저장되지 않은 티커입니다: {missing}")
+        return columns
+
+    def values(
+        self, field: str, fromdate=None, todate=None, tickers: list | None = None
+    ) -> np.ndarray:
+        """필드의 날짜 x 티커 행렬
+
+        Args:
+            field    (str           ): 필드 이름 (시가/고가/저가/종가/...)
+            fromdate (str,  optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str,  optional): 조회 종료 일자 (YYYYMMDD)
+            tickers  (list, optional): 조회할 티커 목록 (기본값: 전체)
+
+        Returns:
+            np.ndarray: tickers가 없으면 memory-map의 view
+        """
+        if field not in self.fields:
+            raise KeyError(f"저장되지 않은 필드입니다: {field}")
+        array = self._array(self.fields[field])[self._rows(fromdate, todate)]
+        if tickers is not None:
+            array = array[:, self._columns(tickers)]
+        return array
+
+    def mask(self, fromdate=None, todate=None, tickers: list | None = None):
+        """데이터 존재 여부 행렬 (값이 없어 0으로 채워진 칸은 False)"""
+        array = self._array("mask.npy")[self._rows(fromdate, todate)]
+        if tickers is not None:
+            array = array[:, self._columns(tickers)]
+        return array
+
+    def frame(
+        self, field: str, fromdate=None, todate=None, tickers: list | None = None
+    ) -> DataFrame:
+        """필드의 날짜 x 티커 DataFrame (values를 복사 없이 감싼다)"""
+        rows = self._rows(fromdate, todate)
+        columns = (
+            self.tickers if tickers is None else self.tickers[self._columns(tickers)]
+        )
+        return DataFrame(
+            self.values(field, fromdate, todate, tickers),
+            index=self.dates[rows],
+            columns=columns,
+            copy=False,
+        )
@@ -0,0 +1,138 @@
+import datetime
+
+import numpy as np
+
+from pykrx.website.krx.krxio import KrxWebIo
+
+BY_TICKER = "by_ticker"
+BY_DATE = "by_date"
+
+# 데이터셋별 (종목별 기간 조회, 일자별 전종목 조회) KRX 엔드포인트
+ENDPOINTS = {
+    "ohlcv": ("개별종목시세", "전종목시세"),
+    "cap": ("개별종목시세", "전종목시세"),
+    "fundamental": ("PER_PBR_배당수익률_개별", "PER_PBR_배당수익률_전종목"),
+    "foreign": ("외국인보유량_개별추이", "외국인보유량_전종목"),
+}
+
+# 수정주가 일봉은 Naver 시세를 종목마다 한 번에 조회한다.
+ADJUSTED_ENDPOINT = "Sise"
+
+
+class QueryPlan:
+    """여러 종목의 기간 조회를 수행할 방법
+
+    Attributes:
+        dataset  (str ): 조회 데이터 (ohlcv/cap/fundamental/foreign)
+        strategy (str ): by_ticker - 종목별 기간 조회 / by_date - 일자별 전종목 조회
+        costs    (dict): {strategy: 예상 요청 수}
+        reason   (str ): 선택 사유
+        adjusted (bool): 수정주가 조회 여부 (종목별 조회가 Naver를 사용)
+    """
+
+    def __init__(
+        self,
+        dataset: str,
+        strategy: str,
+        costs: dict,
+        reason: str,
+        adjusted: bool = False,
+    ):
+        self.dataset = dataset
+        self.strategy = strategy
+        self.costs = costs
+        self.reason = reason
+        self.adjusted = adjusted
+
+    @property
+    def endpoint(self) -> str:
+        """선택된 엔드포인트 (KRX 또는 Naver)"""
+        by_ticker, by_date = ENDPOINTS[self.dataset]
+        if self.strategy == BY_DATE:
+            return by_date
+        return ADJUSTED_ENDPOINT if self.adjusted else by_ticker
+
+    @property
+    def requests(self) -> int:
+        """선택된 방법의 예상 요청 수"""
+        return self.costs[self.strategy]
+
+    def __repr__(self):
+        costs = ", ".join(f"{k}={v}" for k, v in self.costs.items())
+        return (
+            f"QueryPlan(dataset={self.dataset!r}, strategy={self.strategy!r}, "
+            f"endpoint={self.endpoint!r}, {costs}, reason={self.reason!r})"
+        )
+
+
+def estimate_requests(
+    fromdate: str, todate: str, n_tickers: int, adjusted: bool = False
+) -> dict:
+    """종목별/일자별 조회의 예상 요청 수
+
+    종목별 조회는 종목마다 730일 단위 구간 수만큼 요청한다. 수정주가는 Naver
+    시세를 기간에 무관하게 종목마다 한 번 요청한다. 일자별 조회는 영업일마다
+    한 번씩 요청하며, 영업일 목록을 얻기 위한 요청이 하나 더 필요하다. 영업일
+    수는 요청 없이 평일 수로 추정한다.
+
+    Args:
+        fromdate  (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate    (str           ): 조회 종료 일자 (YYYYMMDD)
+        n_tickers (int           ): 조회할 종목 수
+        adjusted  (bool, optional): 수정주가 조회 여부
+
+    Returns:
+        dict: {"by_ticker": 요청 수, "by_date": 요청 수}
+    """
+    windows = 1 if adjusted else len(KrxWebIo._split_period(fromdate, todate))
+    start = datetime.datetime.strptime(fromdate, "%Y%m%d").date()
+    end = datetime.datetime.strptime(todate, "%Y%m%d").date()
+    weekdays = int(np.busday_count(start, end + datetime.timedelta(days=1)))
+    return {
+        BY_TICKER: n_tickers * windows,
+        BY_DATE: weekdays + 1 if weekdays else 0,
+    }
+
+
+def plan_query(
+    dataset: str,
+    fromdate: str,
+    todate: str,
+    tickers: list,
+    snapshot: bool = True,
+    adjusted: bool = False,
+) -> QueryPlan:
+    """여러 종목의 기간 조회에서 요청 수가 적은 방법을 선택
+
+    >> plan_query("ohlcv", "20210104", "20210108", ["005930", "000660", "035420"])
+    QueryPlan(dataset='ohlcv', strategy='by_ticker', endpoint='개별종목시세',
+              by_ticker=3, by_date=6, ...)
+
+    Args:
+        dataset  (str           ): ohlcv/cap/fundamental/foreign
+        fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str           ): 조회 종료 일자 (YYYYMMDD)
+        tickers  (list          ): 조회할 종목의 티커 리스트
+        snapshot (bool, optional): 일자별 전종목 조회로 같은 결과를 얻을 수 있는지
+            여부 (수정주가, 월/년 단위 조회 등은 종목별 조회만 가능)
+        adjusted (bool, optional): 수정주가 조회 여부 (Naver에서 종목별로 조회)
+
+    Returns:
+        QueryPlan: 선택된 조회 방법
+    """
+    if dataset not in ENDPOINTS:
+        raise ValueError(f"지원하지 않는 dataset 입니다: {dataset}")
+
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+    costs = estimate_requests(fromdate, todate, len(set(tickers)), adjusted)
+    if adjusted:
+        return QueryPlan(
+            dataset, BY_TICKER, costs, "수정주가는 종목별로만 조회 가능", adjusted
+        )
+    if not snapshot:
+        return QueryPlan(dataset, BY_TICKER, costs, "전종목 조회로 얻을 수 없는 옵션")
+    # 요청 수가 같으면 응답이 작은 종목별 조회를 사용한다.
+    if costs[BY_DATE] < costs[BY_TICKER]:
+        return QueryPlan(dataset, BY_DATE, costs, "일자별 전종목 조회의 요청 수가 적음")
+    return QueryPlan(dataset, BY_TICKER, costs, "종목별 기간 조회의 요청 수가 적음")
@@ -2,6 +2,7 @@ import datetime
 import functools
 import inspect
 import re
+from calendar import monthrange
 from typing import overload
 
 import pandas as pd
@@ -9,6 +10,9 @@ from deprecated import deprecated
 from multipledispatch import dispatch
 from pandas import DataFrame
 
+from pykrx.stock._batch import fetch_concurrently
+from pykrx.stock.planner import BY_DATE, plan_query
+from pykrx.stock.universe import get_universe
 from pykrx.website import krx, naver
 
 regex_yymmdd = re.compile(r"\d{4}[-/]?\d{2}[-/]?\d{2}")
@@ -39,6 +43,140 @@ def market_valid_check(param=None):
     return _market_valid_check
 
 
+# 일자별 전종목 조회: dataset -> (krx 함수 이름, 추가 인자, 컬럼, dtype)
+# 컬럼과 dtype은 종목별 기간 조회의 결과와 같게 맞춘다.
+_SNAPSHOTS = {
+    "ohlcv": (
+        "get_market_ohlcv_by_ticker",
+        (),
+        ["시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률"],
+        None,
+    ),
+    "cap": (
+        "get_market_cap_by_ticker",
+        (),
+        ["시가총액", "거래량", "거래대금", "상장주식수"],
+        None,
+    ),
+    "fundamental": (
+        "get_market_fundamental_by_ticker",
+        (),
+        ["BPS", "PER", "PBR", "EPS", "DIV", "DPS"],
+        {"PBR": "float32", "DIV": "float32"},
+    ),
+    "foreign": (
+        "get_exhaustion_rates_of_foreign_investment_by_ticker",
+        (False,),
+        ["상장주식수", "보유수량", "지분율", "한도수량", "한도소진률"],
+        None,
+    ),
+}
+
+
+def _fetch_snapshots(dataset: str, fromdate: str, todate: str, market: str) -> tuple:
+    """영업일마다 전종목 데이터를 조회해 (날짜, 티커) MultiIndex로 합친다.
+
+    Returns:
+        tuple: (DataFrame, {날짜: 오류 사유})
+    """
+    name, args, columns, dtype = _SNAPSHOTS[dataset]
+    fetch = getattr(krx, name)
+
+    # 거래일 달력에서 영업일을 구한다. 달력 조회 실패는 빈 결과로 바꾸지 않고
+    # 예외로 전달한다.
+    days = krx.get_calendar().days(fromdate, todate)
+    dates = [day.strftime("%Y%m%d") for day in days]
+
+    frames, errors = fetch_concurrently(
+        lambda date: fetch(date, market, *args)[columns], dates
+    )
+    if not frames:
+        return DataFrame(), errors
+
+    frames = {pd.Timestamp(date): df for date, df in frames.items()}
+    df = pd.concat(frames, names=["날짜", "티커"]).sort_index()
+    if dtype is not None:
+        df = df.astype(dtype)
+    return df, errors
+
+
+def ticker_batch(dataset: str):
+    """ticker에 티커 리스트를 전달하면 여러 종목을 조회해 하나로 합친다.
+
+    종목별 기간 조회와 일자별 전종목 조회 중 예상 요청 수가 적은 방법을
+    plan_query로 선택한다. 반환되는 DataFrame은 (날짜, 티커) MultiIndex를
+    가지며, 선택된 조회 방법은 df.attrs["plan"]에, 조회에 실패했거나 데이터가
+    없는 종목/일자는 df.attrs["errors"]에 {티커 또는 날짜: 사유}로 기록된다.
+
+    >> df = get_market_ohlcv_by_date("20210104", "20210108", ["005930", "000660"])
+    >> df.xs("005930", level="티커")
+    >> df["종가"].unstack()
+    >> df.attrs["plan"]
+
+    Args:
+        dataset (str): planner의 dataset 이름 (ohlcv/cap/fundamental/foreign)
+    """
+
+    def decorator(func):
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            tickers = bound.arguments.get("ticker")
+            if not isinstance(tickers, (list, tuple, set, pd.Index)):
+                return func(*args, **kwargs)
+
+            bound.apply_defaults()
+            arguments = bound.arguments
+            tickers = list(dict.fromkeys(tickers))
+            fromdate, todate = (
+                krx.datetime2string(d)
+                if isinstance(d, datetime.datetime)
+                else d.replace("-", "")
+                for d in (arguments["fromdate"], arguments["todate"])
+            )
+
+            # 수정주가, 월/년 단위, 종목명 표시는 전종목 조회로 얻을 수 없다.
+            adjusted = arguments.get("adjusted", False)
+            snapshot = (
+                arguments.get("freq", "d") == "d"
+                and not adjusted
+                and not arguments.get("name_display", False)
+            )
+            plan = plan_query(dataset, fromdate, todate, tickers, snapshot, adjusted)
+
+            if plan.strategy == BY_DATE:
+                df, errors = _fetch_snapshots(dataset, fromdate, todate, "ALL")
+                if df.empty:
+                    # 모든 일자가 실패했거나 영업일이 없으면 모든 종목을 실패로 기록한다.
+                    reason = next(iter(errors.values()), "empty result")
+                    errors.update((t, reason) for t in tickers)
+                else:
+                    df = df[df.index.get_level_values("티커").isin(tickers)]
+                    found = set(df.index.get_level_values("티커"))
+                    errors.update(
+                        (t, "empty result") for t in tickers if t not in found
+                    )
+            else:
+                frames, errors = fetch_concurrently(
+                    lambda ticker: func(**{**arguments, "ticker": ticker}), tickers
+                )
+                if frames:
+                    df = pd.concat(frames, names=["티커", "날짜"])
+                    df = df.swaplevel().sort_index()
+                    df.columns.name = None
+                else:
+                    df = DataFrame()
+            df.attrs["plan"] = plan
+            df.attrs["errors"] = errors
+            return df
+
+        return wrapper
+
+    return decorator
+
+
 def resample_ohlcv(df, freq, how):
     """
     :param df   : KRX OLCV format의 DataFrame
@@ -78,10 +216,18 @@ def get_market_ticker_list(date: str = None, market: str = "KOSPI") -> list:
 
     Returns:
         list: 티커가 담긴 리스트
+
+    Note:
+        set_universe로 상장 구간 인덱스가 설정되어 있고 date가 인덱스의 스냅샷
+        범위 안에 있으면 KRX에 요청하지 않고 인덱스로 응답한다.
     """
     if date is None:
         date = get_nearest_business_day_in_a_week()
 
+    universe = get_universe()
+    if universe is not None and universe.covers(date):
+        return universe.tickers(date, market)
+
     s = krx.get_market_ticker_and_name(date, market)
     return s.index.to_list()
 
@@ -98,40 +244,54 @@ def get_market_ticker_name(ticker: str) -> str:
     return krx.get_stock_name(ticker)
 
 
-def __get_business_days_0(year: int, month: int):
-    strt = f"{year}{month:02}01"
-    if month == 12:
-        last = f"{year + 1}0101"
+def __get_business_days_0(year: int, month: int | None = None):
+    if month is None:
+        strt, last = f"{year}0101", f"{year}1231"
     else:
-        last = f"{year}{month + 1:02}01"
-    df = krx.get_market_ohlcv_by_date(strt, last, "000020")
-    cond = df.index.month[0] == df.index.month
-    return df.index[cond].to_list()
+        strt = f"{year}{month:02}01"
+        last = f"{year}{month:02}{monthrange(year, month)[1]}"
+
+    trading_calendar = krx.get_calendar()
+    if not trading_calendar.covers(strt, last):
+        # 월 단위로 반복 조회하는 경우가 많으므로 연 단위로 한 번에 조회한다.
+        trading_calendar.build(f"{year}0101", f"{year}1231")
+    return trading_calendar.days(strt, last).to_list()
 
 
 def __get_business_days_1(strt: str, last: str):
-    df = krx.get_market_ohlcv_by_date(strt, last, "000020")
-    return df.index.to_list()
+    return krx.get_calendar().days(strt, last).to_list()
 
 
 def get_previous_business_days(**kwargs) -> list:
     """과거의 영업일 조회
 
+    KRX 거래일 달력(KOSPI 지수가 집계된 날)을 사용하며, 달력에 없는 구간만
+    조회한다. 연/월 단위 조회는 해당 연도 전체를 한 번에 조회하므로 같은
+    연도의 다른 달은 요청 없이 반환된다.
+
     Returns:
         list: 영업일을 pandas의 Timestamp로 저장해서 리스트로 반환
 
         >> get_previous_business_days(year=2020, month=10)
          -> 10월의 영업일을 조회
 
+        >> get_previous_business_days(year=2020)
+         -> 2020년의 영업일을 조회
+
         >> get_previous_business_days(fromdate="20200101", todate="20200115")
          -> 주어진 기간 동안의 영업일을 조회
 
     """
-    if "year" in kwargs and "month" in kwargs:
-        return __get_business_days_0(kwargs["year"], kwargs["month"])
+    if "year" in kwargs:
+        return __get_business_days_0(kwargs["year"], kwargs.get("month"))
 
     elif "fromdate" in kwargs and "todate" in kwargs:
-        return __get_business_days_1(kwargs["fromdate"], kwargs["todate"])
+        fromdate, todate = kwargs["fromdate"], kwargs["todate"]
+        if isinstance(fromdate, datetime.datetime):
+            fromdate = krx.datetime2string(fromdate)
+        if isinstance(todate, datetime.datetime):
+            todate = krx.datetime2string(todate)
+        return __get_business_days_1(fromdate, todate)
     else:
         print("This option is not supported.")
         return []
@@ -192,10 +352,11 @@ def get_market_ohlcv(*args, **kwargs):
         return get_market_ohlcv_by_ticker(*args, **kwargs)
 
 
+@ticker_batch("ohlcv")
 def get_market_ohlcv_by_date(
     fromdate: str,
     todate: str,
-    ticker: str,
+    ticker: str | list,
     freq: str = "d",
     adjusted: bool = True,
     name_display: bool = False,
@@ -205,7 +366,7 @@ def get_market_ohlcv_by_date(
     Args:
         fromdate     (str           ): 조회 시작 일자 (YYYYMMDD)
         todate       (str           ): 조회 종료 일자 (YYYYMMDD)
-        ticker       (str           ): 조회할 종목의 티커
+        ticker       (str, list     ): 조회할 종목의 티커 (리스트면 (날짜, 티커) 패널)
         freq         (str,  optional): d - 일 / m - 월 / y - 년
         adjusted     (bool, optional): 수정 종가 여부 (True/False)
         name_display (bool, optional): columns의 이름 출력 여부 (True/False)
@@ -301,6 +462,50 @@ def get_market_ohlcv_by_ticker(
     return df
 
 
+def get_market_ohlcv_panel(fromdate, todate, market: str = "ALL") -> DataFrame:
+    """일자별 전종목 시세를 모아 만든 기간 OHLCV 패널
+
+    영업일마다 전종목 시세를 한 번씩 조회해 (날짜, 티커) MultiIndex로 합친다.
+    종목별 기간 조회(get_market_ohlcv_by_date)를 전종목에 대해 반복하는 것보다
+    요청 수가 훨씬 적다. 컬럼은 get_market_ohlcv_by_date(adjusted=False)와 같으며
+    수정주가는 반영되지 않는다. 조회에 실패한 일자는 df.attrs["errors"]에
+    {날짜: 사유}로 기록된다.
+
+    Args:
+        fromdate (str          ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str          ): 조회 종료 일자 (YYYYMMDD)
+        market   (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+
+    Returns:
+        DataFrame:
+
+            >> df = get_market_ohlcv_panel("20210118", "20210122", "KOSPI")
+
+                                시가   고가   저가   종가  거래량    거래대금  등락률
+            날짜       티커
+            ...
+            2021-01-22 000020  16600  16650  16250  16400  288262  4722681250  -1.80
+                       000040   1030   1035   1010   1030  784917   803933130   0.98
+                       000050  13300  13350  12850  12850   45796   595711450  -3.38
+
+            >> df["종가"].unstack()              # 날짜 x 티커
+            >> df.xs("005930", level="티커")     # 종목별 일자 OHLCV
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    if isinstance(fromdate, datetime.datetime):
+        fromdate = krx.datetime2string(fromdate)
+
+    if isinstance(todate, datetime.datetime):
+        todate = krx.datetime2string(todate)
+
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+
+    df, errors = _fetch_snapshots("ohlcv", fromdate, todate, market)
+    df.attrs["errors"] = errors
+    return df
+
+
 def get_market_cap(*args, **kwargs):
     """시가총액 조회
 
@@ -353,15 +558,16 @@ def get_market_cap(*args, **kwargs):
         return get_market_cap_by_ticker(*args, **kwargs)
 
 
+@ticker_batch("cap")
 def get_market_cap_by_date(
-    fromdate: str, todate: str, ticker: str, freq: str = "d"
+    fromdate: str, todate: str, ticker: str | list, freq: str = "d"
 ) -> DataFrame:
     """일자별로 정렬된 시가총액
 
     Args:
         fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
         todate   (str           ): 조회 종료 일자 (YYYYMMDD)
-        ticker   (str           ): 티커
+        ticker   (str, list     ): 티커 (리스트면 (날짜, 티커) 패널)
         freq     (str,  optional):  d - 일 / m - 월 / y - 년
 
     Returns:
@@ -482,15 +688,16 @@ def get_exhaustion_rates_of_foreign_investment(*args, **kwargs):
         return get_exhaustion_rates_of_foreign_investment_by_ticker(*args, **kwargs)
 
 
+@ticker_batch("foreign")
 def get_exhaustion_rates_of_foreign_investment_by_date(
-    fromdate: str, todate: str, ticker: str
+    fromdate: str, todate: str, ticker: str | list
 ) -> DataFrame:
     """지정된 종목의 일자별로 정렬된 외국인 보유 수량 및 한도 수량
 
     Args:
-        fromdate (str): 조회 시작 일자 (YYYYMMDD)
-        todate   (str): 조회 종료 일자 (YYYYMMDD)
-        ticker   (str): 종목의 티커
+        fromdate (str      ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str      ): 조회 종료 일자 (YYYYMMDD)
+        ticker   (str, list): 종목의 티커 (리스트면 (날짜, 티커) 패널)
 
     Returns:
         DataFrame:
@@ -680,15 +887,20 @@ def get_market_fundamental(*args, **kwargs):
         return get_market_fundamental_by_ticker(*args, **kwargs)
 
 
+@ticker_batch("fundamental")
 def get_market_fundamental_by_date(
-    fromdate: str, todate: str, ticker: str, freq: str = "d", name_display: bool = False
+    fromdate: str,
+    todate: str,
+    ticker: str | list,
+    freq: str = "d",
+    name_display: bool = False,
 ) -> DataFrame:
     """기간별 특정 종목의 PER/PBR/배당수익률 조회
 
     Args:
         fromdate     (str           ): 조회 시작 일자 (YYYYMMDD)
         todate       (str           ): 조회 종료 일자 (YYYYMMDD)
-        ticker       (str           ): 조회 종목 티커
+        ticker       (str, list     ): 조회 종목 티커 (리스트면 (날짜, 티커) 패널)
         freq         (str , optional): d - 일 / m - 월 / y - 년
         name_display (bool, optional): 종목 이름 출력 여부 (True/False)
 
@@ -2350,7 +2562,7 @@ def get_etf_ticker_name(ticker: str) -> str:
             KODEX 200
     """
 
-    return krx.get_etx_name(ticker)
+    return krx.get_etx_name(ticker, "ETF")
 
 
 def get_etn_ticker_name(ticker: str) -> str:
@@ -2366,7 +2578,7 @@ def get_etn_ticker_name(ticker: str) -> str:
             QV Big Vol ETN
     """
 
-    return krx.get_etx_name(ticker)
+    return krx.get_etx_name(ticker, "ETN")
 
 
 def get_elw_ticker_name(ticker: str) -> str:
@@ -2382,7 +2594,7 @@ def get_elw_ticker_name(ticker: str) -> str:
             KODEX 200
     """
 
-    return krx.get_etx_name(ticker)
+    return krx.get_etx_name(ticker, "ELW")
 
 
 def get_etf_isin(ticker: str) -> str:
@@ -2398,7 +2610,7 @@ def get_etf_isin(ticker: str) -> str:
             KR7069500007
     """
 
-    return krx.get_etx_isin(ticker)
+    return krx.get_etx_isin(ticker, "ETF")
 
 
 def get_etf_ohlcv_by_date(
@@ -2663,7 +2875,6 @@ def get_etf_trading_volume_and_value(fromdate: str, todate: str) -> DataFrame:
     """주어진 기간의 투자자별 거래실적 합계
 
 
-
     Args:
         fromdate    (str): 조회 시작 일자 (YYMMDD)
         todate      (str): 조회 종료 일자 (YYMMDD)
@@ -0,0 +1,285 @@
+import datetime
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.stock._batch import fetch_concurrently
+from pykrx.stock.matrix import PanelMatrix
+from pykrx.stock.universe import MARKETS, UniverseIndex
+from pykrx.website import krx
+from pykrx.website.comm.cache import KST
+
+
+def _fetch_shorting_balance(date: str) -> DataFrame:
+    # 공매도 잔고는 전체 시장(ALL) 조회를 지원하지 않는다.
+    frames = [
+        krx.get_shorting_balance_by_ticker(date, market)
+        for market in ("KOSPI", "KOSDAQ", "KONEX")
+    ]
+    frames = [df for df in frames if not df.empty]
+    return pd.concat(frames).sort_index() if frames else DataFrame()
+
+
+def _fetch_universe(date: str) -> DataFrame:
+    # 시장 구분이 필요하므로 시장별로 조회한다.
+    frames = []
+    for market in MARKETS:
+        names = krx.get_market_ticker_and_name(date, market)
+        if not names.empty:
+            frames.append(DataFrame({"종목명": names, "시장": market}))
+    return pd.concat(frames).sort_index() if frames else DataFrame()
+
+
+# dataset -> (일자별 전종목 조회 함수, 확정까지 걸리는 거래일 수)
+DATASETS = {
+    "ohlcv": (lambda date: krx.get_market_ohlcv_by_ticker(date, "ALL"), 0),
+    "cap": (lambda date: krx.get_market_cap_by_ticker(date, "ALL"), 0),
+    "fundamental": (
+        lambda date: krx.get_market_fundamental_by_ticker(date, "ALL"),
+        0,
+    ),
+    "foreign": (
+        lambda date: krx.get_exhaustion_rates_of_foreign_investment_by_ticker(
+            date, "ALL", False
+        ),
+        0,
+    ),
+    # 공매도 잔고는 T+2일에 공시된다.
+    "shorting_balance": (_fetch_shorting_balance, 2),
+    # 일자별 상장 종목 (UniverseIndex의 원천 데이터)
+    "universe": (_fetch_universe, 0),
+}
+
+# 한 번에 동시에 조회하고 저장하는 일자 수
+SYNC_CHUNK = 32
+
+
+class MarketStore:
+    """일자별 전종목 데이터를 저장하는 로컬 저장소
+
+    거래일마다 전종목 조회 결과를 {path}/{dataset}/{YYYYMMDD}.pkl 파일 하나로
+    저장한다. 저장된 파일은 바뀌지 않으며, sync는 마지막으로 저장된 일자
+    이후의 거래일만 조회해 파일을 추가한다. 결과가 비어 있는 일자는 저장하지
+    않는다. read는 네트워크 요청 없이 저장된 파일만 읽는다.
+
+    >> store = MarketStore("~/.pykrx/store")
+    >> store.sync(since="20200102")          # 최초 1회
+    >> store.sync()                          # 이후에는 새 거래일만 조회
+    >> df = store.read("ohlcv", "20210104", "20210108", ["005930", "000660"])
+
+    Args:
+        path     (str           ): 저장소 디렉터리
+        datasets (list, optional): 저장할 dataset 목록 (기본값: 전체)
+            - ohlcv / cap / fundamental / foreign / shorting_balance / universe
+    """
+
+    def __init__(self, path, datasets: list | None = None):
+        datasets = list(DATASETS) if datasets is None else list(datasets)
+        unknown = [x for x in datasets if x not in DATASETS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 dataset 입니다: {unknown}")
+        self.path = Path(path).expanduser()
+        self.datasets = datasets
+
+    def _dir(self, dataset: str) -> Path:
+        if dataset not in DATASETS:
+            raise ValueError(f"지원하지 않는 dataset 입니다: {dataset}")
+        return self.path / dataset
+
+    def dates(self, dataset: str) -> list:
+        """저장된 일자 목록 (YYYYMMDD, 오름차순)"""
+        return sorted(file.stem for file in self._dir(dataset).glob("*.pkl"))
+
+    def last_date(self, dataset: str) -> str | None:
+        """마지막으로 저장된 일자 (없으면 None)"""
+        dates = self.dates(dataset)
+        return dates[-1] if dates else None
+
+    def _write(self, dataset: str, date: str, df: DataFrame) -> None:
+        directory = self._dir(dataset)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_pickle(tmp)
+            os.replace(tmp, directory / f"{date}.pkl")
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def sync(self, until: str | None = None, since: str | None = None) -> dict:
+        """마지막 저장 일자 이후의 거래일을 조회해 저장
+
+        일자 순서대로 저장하며, 조회에 실패하면 그 이전 일자까지 저장한 후
+        예외를 전달한다. 다시 sync를 호출하면 실패한 일자부터 이어서 조회한다.
+        저장된 데이터 이후에 결과가 비어 있는 일자가 있으면 그 일자에서
+        멈추고 다음 sync에서 다시 조회한다. 저장된 데이터가 없는 dataset의
+        앞쪽 빈 일자(데이터 제공 이전)는 건너뛴다.
+
+        Args:
+            until (str, optional): 저장할 마지막 일자 (YYYYMMDD, 기본값: 전일)
+            since (str, optional): 저장된 데이터가 없을 때 시작 일자 (YYYYMMDD)
+
+        Returns:
+            dict: {dataset: 새로 저장한 일자 수}
+        """
+        if until is None:
+            yesterday = datetime.datetime.now(KST) - datetime.timedelta(days=1)
+            until = yesterday.strftime("%Y%m%d")
+        until = until.replace("-", "")
+
+        starts = {}
+        for dataset in self.datasets:
+            last = self.last_date(dataset)
+            if last is None:
+                if since is None:
+                    raise ValueError(f"{dataset}: 최초 sync에는 since가 필요합니다.")
+                starts[dataset] = since.replace("-", "")
+            else:
+                following = pd.Timestamp(last) + pd.Timedelta(days=1)
+                starts[dataset] = following.strftime("%Y%m%d")
+
+        fromdate = min(starts.values())
+        if fromdate > until:
+            return dict.fromkeys(self.datasets, 0)
+
+        cal = krx.get_calendar()
+        calendar = [day.strftime("%Y%m%d") for day in cal.days(fromdate, until)]
+
+        stored = {}
+        for dataset in self.datasets:
+            fetch, settle = DATASETS[dataset]
+            dates = [x for x in calendar if x >= starts[dataset]]
+            if settle:
+                # 당일 이전에 마감된 최근 settle개 거래일은 아직 확정되지 않았다.
+                cutoff = datetime.datetime.now(KST).strftime("%Y%m%d")
+                for _ in range(settle):
+                    cutoff = cal.prev(cutoff, inclusive=False)
+                dates = [x for x in dates if x < cutoff]
+            stored[dataset] = self._sync_dates(dataset, fetch, dates)
+        return stored
+
+    def _sync_dates(self, dataset: str, fetch, dates: list) -> int:
+        count = 0
+        leading = self.last_date(dataset) is None
+        for i in range(0, len(dates), SYNC_CHUNK):
+            chunk = dates[i : i + SYNC_CHUNK]
+            frames, errors = fetch_concurrently(fetch, chunk)
+            for date in chunk:
+                if date in frames:
+                    self._write(dataset, date, frames[date])
+                    leading = False
+                    count += 1
+                elif errors[date] != "empty result":
+                    raise RuntimeError(f"{dataset} {date} 조회 실패: {errors[date]}")
+                elif not leading:
+                    # 아직 공시되지 않은 일자일 수 있으므로 다음 sync에서 다시 조회한다.
+                    return count
+        return count
+
+    def read(
+        self,
+        dataset: str,
+        fromdate: str | None = None,
+        todate: str | None = None,
+        tickers: list | None = None,
+    ) -> DataFrame:
+        """저장된 데이터를 (날짜, 티커) MultiIndex DataFrame으로 조회
+
+        Args:
+            dataset  (str           ): 조회할 dataset
+            fromdate (str,  optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str,  optional): 조회 종료 일자 (YYYYMMDD)
+            tickers  (list, optional): 조회할 티커 목록 (기본값: 전체)
+
+        Returns:
+            DataFrame:
+
+                >> store.read("ohlcv", "20210104", "20210105", ["005930"])
+
+                                    시가   고가   저가   종가    거래량  ...
+                날짜       티커
+                2021-01-04 005930  81000  84400  80200  83000  38655276  ...
+                2021-01-05 005930  81600  83900  81600  83900  35335669  ...
+        """
+        fromdate = fromdate.replace("-", "") if fromdate else ""
+        todate = todate.replace("-", "") if todate else "99999999"
+        directory = self._dir(dataset)
+
+        frames = {}
+        for date in self.dates(dataset):
+            if fromdate <= date <= todate:
+                df = pd.read_pickle(directory / f"{date}.pkl")
+                if tickers is not None:
+                    df = df[df.index.isin(tickers)]
+                if not df.empty:
+                    frames[pd.Timestamp(date)] = df
+        if not frames:
+            return DataFrame()
+        return pd.concat(frames, names=["날짜", "티커"])
+
+    def build_matrix(self, dataset: str) -> PanelMatrix:
+        """저장된 데이터 전체를 memory-map 행렬로 변환
+
+        {path}/matrix/{dataset} 에 PanelMatrix 형식으로 저장한다. sync 후 다시
+        호출하면 새 거래일을 포함해 다시 만든다.
+
+        >> store.sync()
+        >> m = store.build_matrix("ohlcv")
+        >> m.values("종가", "20210104", "20210108")
+
+        Args:
+            dataset (str): 변환할 dataset
+
+        Returns:
+            PanelMatrix: 변환된 행렬
+        """
+        df = self.read(dataset)
+        if df.empty:
+            raise ValueError(f"{dataset}: 저장된 데이터가 없습니다.")
+        return PanelMatrix.save(df, self.path / "matrix" / dataset)
+
+    def matrix(self, dataset: str) -> PanelMatrix:
+        """build_matrix로 만든 행렬을 연다."""
+        self._dir(dataset)
+        return PanelMatrix(self.path / "matrix" / dataset)
+
+    def universe(self) -> UniverseIndex:
+        """저장된 universe 스냅샷으로 상장 구간 인덱스를 만든다.
+
+        {path}/index/universe.pkl 에 저장해 두고, sync로 새 일자가 추가된
+        경우에만 다시 만든다.
+
+        >> store.sync()
+        >> set_universe(store.universe())
+        >> stock.get_market_ticker_list("20150105", "KOSPI")   # 요청 없음
+
+        Returns:
+            UniverseIndex: 상장 구간 인덱스
+        """
+        dates = self.dates("universe")
+        if not dates:
+            raise ValueError("universe: 저장된 데이터가 없습니다.")
+
+        path = self.path / "index" / "universe.pkl"
+        days = pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[D]")
+        if path.exists():
+            index = UniverseIndex.load(path)
+            if np.array_equal(index.dates, days):
+                return index
+
+        index = UniverseIndex.from_snapshots(dates, self.read("universe"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            index.save(tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return index
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+MARKETS = ("KOSPI", "KOSDAQ", "KONEX")
+
+
+class UniverseIndex:
+    """시점별 상장 종목(universe)을 조회하는 상장 구간 인덱스
+
+    일자별 시장 스냅샷에서 티커가 연속으로 나타난 구간을 (티커, 시장, 시작,
+    끝) 구간 하나로 압축해 저장한다. 스냅샷 사이의 휴일은 직전 스냅샷 일자를
+    기준으로 조회하며, 이전 상장 종목과 시장 이전(코스닥 -> 코스피)도 구간
+    단위로 구분된다.
+
+    >> index = MarketStore("~/.pykrx/store", ["universe"]).universe()
+    >> index.tickers("20150105", "KOSPI")
+    >> index.members(pd.bdate_range("2005-01-01", "2020-12-31", freq="BME"))
+
+    Args:
+        dates     (np.ndarray): 스냅샷 일자 (datetime64[D], 오름차순)
+        intervals (DataFrame ): 티커/시장/시작/끝 컬럼의 구간 (시작/끝은 dates의 위치)
+    """
+
+    def __init__(self, dates: np.ndarray, intervals: DataFrame):
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        intervals = intervals.sort_values(["티커", "시작"], kind="stable")
+        self.intervals = intervals.reset_index(drop=True)
+        self._tickers = self.intervals["티커"].to_numpy()
+        self._markets = self.intervals["시장"].to_numpy()
+        self._start = self.intervals["시작"].to_numpy()
+        self._end = self.intervals["끝"].to_numpy()
+
+    @staticmethod
+    def from_snapshots(dates, snapshots: DataFrame) -> "UniverseIndex":
+        """일자별 스냅샷에서 상장 구간을 만든다.
+
+        Args:
+            dates     (list     ): 스냅샷 일자 (종목이 없는 일자 포함)
+            snapshots (DataFrame): (날짜, 티커) MultiIndex와 시장 컬럼
+
+        Returns:
+            UniverseIndex: 상장 구간 인덱스
+        """
+        dates = np.unique(pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[D]"))
+        if snapshots.empty:
+            return UniverseIndex(
+                dates, DataFrame({"티커": [], "시장": [], "시작": [], "끝": []})
+            )
+
+        days = snapshots.index.get_level_values(0).to_numpy(dtype="datetime64[D]")
+        df = DataFrame(
+            {
+                "티커": snapshots.index.get_level_values(1).to_numpy(),
+                "시장": snapshots["시장"].to_numpy(),
+                "위치": np.searchsorted(dates, days),
+            }
+        ).sort_values(["티커", "시장", "위치"], kind="stable")
+
+        ticker = df["티커"].to_numpy()
+        market = df["시장"].to_numpy()
+        position = df["위치"].to_numpy()
+        # 티커나 시장이 바뀌거나 스냅샷이 끊기면 새 구간이 시작된다.
+        new = np.ones(len(df), dtype=bool)
+        new[1:] = (
+            (ticker[1:] != ticker[:-1])
+            | (market[1:] != market[:-1])
+            | (position[1:] != position[:-1] + 1)
+        )
+        first = np.flatnonzero(new)
+        last = np.append(first[1:], len(df)) - 1
+        intervals = DataFrame(
+            {
+                "티커": ticker[first],
+                "시장": market[first],
+                "시작": position[first],
+                "끝": position[last],
+            }
+        )
+        return UniverseIndex(dates, intervals)
+
+    def covers(self, date) -> bool:
+        """스냅샷 범위 안의 일자인지 여부"""
+        if not len(self.dates):
+            return False
+        day = pd.Timestamp(date).to_datetime64().astype("datetime64[D]")
+        return self.dates[0] <= day <= self.dates[-1]
+
+    def _positions(self, dates) -> np.ndarray:
+        days = pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[D]")
+        positions = np.searchsorted(self.dates, days, side="right") - 1
+        # 스냅샷 범위 밖의 일자(-1)는 어떤 구간에도 속하지 않는다.
+        if len(self.dates):
+            positions[days > self.dates[-1]] = -1
+        return positions
+
+    def _select(self, market: str) -> np.ndarray:
+        if market == "ALL":
+            return np.arange(len(self._tickers))
+        return np.flatnonzero(self._markets == market)
+
+    def tickers(self, date, market: str = "ALL") -> list:
+        """date 기준 상장 종목의 티커 (오름차순)
+
+        Args:
+            date   (str          ): 조회 일자 (YYYYMMDD)
+            market (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        """
+        position = self._positions([date])[0]
+        rows = self._select(market)
+        hit = (self._start[rows] <= position) & (position <= self._end[rows])
+        # 같은 날 한 티커는 한 구간에만 속한다.
+        return self._tickers[rows[hit]].tolist()
+
+    def members(self, dates, market: str = "ALL") -> DataFrame:
+        """여러 일자의 상장 여부를 한 번에 조회
+
+        Args:
+            dates  (list         ): 조회 일자 목록
+            market (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+
+        Returns:
+            DataFrame: 일자 x 티커 bool 행렬
+
+                >> index.members(["20210104", "20210105"], "KOSPI")
+
+                티커        000020  000040  000050  ...
+                2021-01-04    True    True    True  ...
+                2021-01-05    True    True    True  ...
+        """
+        index = pd.DatetimeIndex(dates)
+        positions = self._positions(index)[:, None]
+        rows = self._select(market)
+        hit = (self._start[rows] <= positions) & (positions <= self._end[rows])
+
+        # 구간은 티커 순으로 정렬되어 있으므로 티커별로 연속된 열을 OR로 합친다.
+        tickers = self._tickers[rows]
+        if not len(tickers):
+            return DataFrame(index=index, columns=pd.Index([], name="티커"), dtype=bool)
+        first = np.flatnonzero(np.append(True, tickers[1:] != tickers[:-1]))
+        values = np.logical_or.reduceat(hit, first, axis=1)
+        return DataFrame(
+            values, index=index, columns=pd.Index(tickers[first], name="티커")
+        )
+
+    def save(self, path) -> None:
+        pd.to_pickle({"dates": self.dates, "intervals": self.intervals}, path)
+
+    @staticmethod
+    def load(path) -> "UniverseIndex":
+        data = pd.read_pickle(path)
+        return UniverseIndex(data["dates"], data["intervals"])
+
+
+_universe: UniverseIndex | None = None
+
+
+def set_universe(index: UniverseIndex | None) -> None:
+    """get_market_ticker_list가 사용할 상장 구간 인덱스를 설정
+
+    설정된 인덱스의 스냅샷 범위 안의 일자는 KRX에 요청하지 않고 인덱스로
+    응답한다. None이면 항상 KRX에 요청한다.
+    """
+    global _universe
+    _universe = index
+
+
+def get_universe() -> UniverseIndex | None:
+    """현재 설정된 상장 구간 인덱스를 반환"""
+    return _universe
@@ -2,13 +2,27 @@ from pykrx.website.comm.auth import (
     build_krx_session,
     get_auth_session,
     login_krx,
+    prewarm_krx_session,
     warmup_krx_session,
 )
-from pykrx.website.comm.util import dataframe_empty_handler, singleton
-from pykrx.website.comm.webio import get_session, set_session
+from pykrx.website.comm.cache import DiskCache, ResponseCache, get_cache, set_cache
+from pykrx.website.comm.ratelimit import TokenBucket, get_rate_limiter, set_rate_limit
+from pykrx.website.comm.retry import (
+    CircuitBreaker,
+    RetryPolicy,
+    TransportError,
+    set_retry_policy,
+)
+from pykrx.website.comm.util import (
+    dataframe_empty_handler,
+    propagate_errors,
+    singleton,
+)
+from pykrx.website.comm.webio import configure_http, get_session, set_session
 
 __all__ = [
     "dataframe_empty_handler",
+    "propagate_errors",
     "singleton",
     "get_auth_session",
     "get_session",
@@ -16,4 +30,17 @@ __all__ = [
     "build_krx_session",
     "login_krx",
     "warmup_krx_session",
+    "prewarm_krx_session",
+    "DiskCache",
+    "ResponseCache",
+    "get_cache",
+    "set_cache",
+    "TokenBucket",
+    "get_rate_limiter",
+    "set_rate_limit",
+    "configure_http",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "TransportError",
+    "set_retry_policy",
 ]
@@ -1,4 +1,5 @@
 import os
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Optional
@@ -15,6 +16,10 @@ USER_AGENT = (
 
 # Global session reference (set by webio.py)
 _auth_session: Optional["KRXSession"] = None
+_auth_lock = threading.Lock()
+# 로그인 실패 후 재시도까지 대기할 시간(초)
+LOGIN_RETRY_INTERVAL = 60
+_last_login_failure = 0.0
 
 
 @dataclass
@@ -210,30 +215,48 @@ def get_auth_session() -> KRXSession | None:
     현재 활성화된 KRX 세션을 반환합니다.
 
     환경 변수 KRX_ID, KRX_PW 가 설정되어 있지 않으면 None 을 반환합니다.
+    세션은 처음 호출될 때 로그인하여 생성되며, 이후 모든 스레드가 공유합니다.
     세션이 만료되었을 경우 자동으로 재로그인을 시도합니다.
     """
-    global _auth_session
+    global _auth_session, _last_login_failure
 
-    if _auth_session is None:
-        # 환경 변수에서 다시 시도
-        login_id = os.getenv("KRX_ID")
-        login_pw = os.getenv("KRX_PW")
-        if login_id and login_pw:
-            _auth_session = build_krx_session(login_id, login_pw)
-        return _auth_session
-
-    # 세션 만료 확인 및 재로그인
-    if not _auth_session.is_valid():
-        login_id = os.getenv("KRX_ID")
-        login_pw = os.getenv("KRX_PW")
-        if login_id and login_pw:
-            print("KRX 세션 만료, 재로그인 시도...")
-            if _auth_session.refresh(login_id, login_pw):
-                print("KRX 세션 갱신 완료.")
-            else:
-                print("KRX 세션 갱신 실패.")
-                return None
-        else:
+    session = _auth_session
+    if session is not None and session.is_valid():
+        return session
+
+    login_id = os.getenv("KRX_ID")
+    login_pw = os.getenv("KRX_PW")
+    if not (login_id and login_pw):
+        return None
+
+    with _auth_lock:
+        # 다른 스레드가 먼저 로그인했을 수 있다.
+        if _auth_session is not None and _auth_session.is_valid():
+            return _auth_session
+        if time.time() - _last_login_failure < LOGIN_RETRY_INTERVAL:
             return None
 
-    return _auth_session
+        if _auth_session is None:
+            _auth_session = build_krx_session(login_id, login_pw)
+            if _auth_session is None:
+                _last_login_failure = time.time()
+            return _auth_session
+
+        # 세션 만료 확인 및 재로그인
+        print("KRX 세션 만료, 재로그인 시도...")
+        if _auth_session.refresh(login_id, login_pw):
+            print("KRX 세션 갱신 완료.")
+            return _auth_session
+        print("KRX 세션 갱신 실패.")
+        _last_login_failure = time.time()
+        return None
+
+
+def prewarm_krx_session() -> KRXSession | None:
+    """
+    KRX 로그인 세션을 미리 생성합니다.
+
+    로그인은 첫 KRX 요청 시점까지 지연되므로, 첫 요청의 지연을 피하고 싶은
+    장기 실행 서비스에서는 시작 시 이 함수를 호출합니다.
+    """
+    return get_auth_session()
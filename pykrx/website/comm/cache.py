@@ -0,0 +1,231 @@
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+# 조회 기준이 되는 일자 파라미터 (기간 조회는 endDd, 단일 일자 조회는 trdDd)
+DATE_PARAMS = ("trdDd", "endDd")
+
+# bld -> 확정까지 걸리는 영업일 수 (공매도 잔고는 T+2일에 공시된다)
+SETTLE_DAYS = {
+    "dbms/MDC/STAT/srt/MDCSTAT30001": 2,  # 개별종목 공매도 종합정보 (잔고 포함)
+    "dbms/MDC/STAT/srt/MDCSTAT30501": 2,  # 전종목 공매도 잔고
+    "dbms/MDC/STAT/srt/MDCSTAT30502": 2,  # 개별종목 공매도 잔고
+    "dbms/MDC/STAT/srt/MDCSTAT30801": 2,  # 공매도 잔고 상위 50 종목
+}
+
+# 수정주가 요청 파라미터. 이후의 액면분할, 증자 등으로 과거 값이 바뀐다.
+ADJUSTED_PARAM = ("adjStkPrc", "2")
+
+
+def canonicalize_params(params: dict) -> list:
+    """요청 파라미터를 순서/타입에 무관한 형태로 정규화
+
+    Args:
+        params (dict): POST form 파라미터
+
+    Returns:
+        list: [(key, value), ...] 형태로 정렬된 리스트
+    """
+    items = []
+    for key, value in params.items():
+        if key == "bld":
+            continue
+        if isinstance(value, (list, tuple)):
+            value = [str(x) for x in value]
+        else:
+            value = str(value)
+        items.append((key, value))
+    return sorted(items)
+
+
+def make_cache_key(bld: str, params: dict) -> str:
+    """bld와 정규화된 파라미터로 캐시 키를 생성
+
+    Args:
+        bld    (str ): KRX bld 경로
+        params (dict): POST form 파라미터
+
+    Returns:
+        str: sha256 hex digest
+    """
+    raw = json.dumps([bld, canonicalize_params(params)], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _is_empty(data) -> bool:
+    # 레코드 목록이 모두 비어 있는 응답 (휴일, 아직 공시되지 않은 일자 등)
+    if not isinstance(data, dict):
+        return False
+    blocks = [v for v in data.values() if isinstance(v, list)]
+    return bool(blocks) and not any(blocks)
+
+
+# 확정 일자를 구하는 중인 스레드 표시 (거래일 달력 조회 자체의 응답 저장)
+_settling = threading.local()
+
+
+class ResponseCache(ABC):
+    """KrxWebIo 응답 캐시의 기본 클래스
+
+    하위 클래스는 _load/_store를 구현한다. 만료 정책은 다음과 같다.
+      - 당일 이전 일자의 조회는 데이터가 바뀌지 않으므로 만료 없이 저장한다.
+        공매도 잔고처럼 늦게 공시되는 bld는 KRX 거래일 달력에서 최근에 마감된
+        SETTLE_DAYS개 거래일도 아직 확정되지 않은 것으로 본다.
+      - 수정주가(adjStkPrc=2) 조회는 이후의 기업 이벤트로 과거 값이 바뀌므로
+        adjusted_ttl 초 동안만 유효하다.
+      - 당일/미래 일자, 일자 파라미터가 없는 조회(종목 검색 등), 결과가 비어
+        있는 응답은 ttl 초 동안만 유효하다.
+
+    Args:
+        ttl          (int, optional): 변경 가능한 데이터의 유효 시간(초)
+        settle_days  (int, optional): 모든 bld에 적용할 최소 확정 대기 영업일 수
+        adjusted_ttl (int, optional): 수정주가 조회의 유효 시간(초)
+    """
+
+    def __init__(self, ttl: int = 600, settle_days: int = 0, adjusted_ttl: int = 86400):
+        self.ttl = ttl
+        self.settle_days = settle_days
+        self.adjusted_ttl = adjusted_ttl
+
+    def settle_lag(self, bld: str) -> int:
+        """bld의 데이터가 확정되기까지 걸리는 영업일 수"""
+        return max(self.settle_days, SETTLE_DAYS.get(bld, 0))
+
+    def settle_date(self, lag: int) -> str | None:
+        """lag개의 거래일이 더 마감되어야 확정되는 첫 일자 (YYYYMMDD)
+
+        당일 이전에 마감된 거래일 중 lag번째로 최근인 거래일이다. 거래일을
+        알 수 없으면 None을 반환한다.
+        """
+        today = datetime.datetime.now(KST).strftime("%Y%m%d")
+        if not lag:
+            return today
+        if getattr(_settling, "active", False):
+            # 거래일 달력을 채우는 요청은 확정 여부를 판단하지 않는다.
+            return None
+
+        from pykrx.website.krx.calendar import get_calendar
+
+        _settling.active = True
+        try:
+            day = today
+            for _ in range(lag):
+                day = get_calendar().prev(day, inclusive=False)
+            return day
+        except (OSError, ValueError):
+            return None
+        finally:
+            _settling.active = False
+
+    def is_immutable(self, bld: str, params: dict) -> bool:
+        dates = [str(params[k]) for k in DATE_PARAMS if k in params]
+        if not dates:
+            return False
+        cutoff = self.settle_date(self.settle_lag(bld))
+        return cutoff is not None and max(dates).replace("-", "") < cutoff
+
+    def expiry(self, bld: str, params: dict, data) -> float | None:
+        """저장할 응답의 만료 시각 (None이면 만료 없음, 0이면 저장하지 않음)"""
+        if str(params.get(ADJUSTED_PARAM[0])) == ADJUSTED_PARAM[1]:
+            ttl = self.adjusted_ttl
+        elif self.is_immutable(bld, params) and not _is_empty(data):
+            return None
+        else:
+            ttl = self.ttl
+        return time.time() + ttl if ttl > 0 else 0
+
+    def get(self, bld: str, params: dict):
+        entry = self._load(make_cache_key(bld, params))
+        if entry is None:
+            return None
+        expires = entry.get("expires")
+        if expires is not None and expires < time.time():
+            return None
+        return entry["data"]
+
+    def set(self, bld: str, params: dict, data) -> None:
+        expires = self.expiry(bld, params, data)
+        if expires == 0:
+            return
+        entry = {"bld": bld, "stored": time.time(), "expires": expires, "data": data}
+        self._store(make_cache_key(bld, params), entry)
+
+    @abstractmethod
+    def _load(self, key: str):
+        """key의 저장 항목을 반환 (없으면 None)"""
+
+    @abstractmethod
+    def _store(self, key: str, entry: dict) -> None:
+        """key에 저장 항목을 기록"""
+
+
+class DiskCache(ResponseCache):
+    """디스크 기반 응답 캐시
+
+    키 하나당 JSON 파일 하나를 {path}/{key[:2]}/{key}.json 에 저장한다.
+    파일은 임시 파일에 쓴 후 rename하므로 여러 프로세스가 같은 디렉터리를
+    공유해도 안전하다.
+
+    Args:
+        path (str): 캐시 디렉터리
+    """
+
+    def __init__(
+        self, path, ttl: int = 600, settle_days: int = 0, adjusted_ttl: int = 86400
+    ):
+        super().__init__(ttl, settle_days, adjusted_ttl)
+        self.path = Path(path).expanduser()
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def _load(self, key: str):
+        try:
+            with open(self._file(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, entry: dict) -> None:
+        file = self._file(key)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, file)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+# 환경 변수 PYKRX_CACHE_DIR 이 설정되어 있으면 디스크 캐시를 사용한다.
+_cache: ResponseCache | None = (
+    DiskCache(os.environ["PYKRX_CACHE_DIR"]) if os.getenv("PYKRX_CACHE_DIR") else None
+)
+
+
+def set_cache(cache: ResponseCache | None) -> None:
+    """KrxWebIo 응답 캐시를 설정 (None이면 캐시 사용 안 함)
+
+    >> set_cache(DiskCache("~/.cache/pykrx"))
+    """
+    global _cache
+    _cache = cache
+
+
+def get_cache() -> ResponseCache | None:
+    """현재 설정된 KrxWebIo 응답 캐시를 반환"""
+    return _cache
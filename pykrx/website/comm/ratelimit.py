@@ -0,0 +1,69 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷
+
+    초당 rate개의 토큰이 채워지며 최대 burst개까지 쌓인다. acquire()는
+    토큰을 하나 얻을 때까지 대기한다.
+
+    Args:
+        rate  (float): 초당 허용 요청 수
+        burst (int  ): 연속으로 허용하는 최대 요청 수
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# host 별 기본 요청 한도 (초당 요청 수, burst)
+DEFAULT_LIMITS = {
+    "data.krx.co.kr": (2.0, 4),
+    "fchart.stock.naver.com": (5.0, 10),
+}
+
+_limiters: dict[str, TokenBucket | None] = {}
+_limiters_lock = threading.Lock()
+
+
+def set_rate_limit(host: str, rate: float | None, burst: int = 1) -> None:
+    """host 별 요청 한도를 설정
+
+    Args:
+        host  (str  ): 대상 host (예: data.krx.co.kr)
+        rate  (float): 초당 허용 요청 수. None이면 제한하지 않는다.
+        burst (int  ): 연속으로 허용하는 최대 요청 수
+    """
+    with _limiters_lock:
+        _limiters[host] = None if rate is None else TokenBucket(rate, burst)
+
+
+def get_rate_limiter(host: str) -> TokenBucket | None:
+    """host 에 해당하는 TokenBucket을 반환 (제한이 없으면 None)"""
+    with _limiters_lock:
+        if host not in _limiters:
+            limit = DEFAULT_LIMITS.get(host)
+            _limiters[host] = None if limit is None else TokenBucket(*limit)
+        return _limiters[host]
@@ -0,0 +1,138 @@
+import random
+import threading
+import time
+
+import requests
+
+
+class TransportError(requests.exceptions.RequestException):
+    """재시도 후에도 정상 응답을 받지 못한 경우
+
+    dataframe_empty_handler가 잡지 않으므로 대량 수집 작업에서 일부 구간이 빈
+    DataFrame으로 누락되지 않고 호출자에게 전달된다.
+    """
+
+
+class RetryPolicy:
+    """일시적인 전송 오류에 대한 재시도 정책
+
+    n번째 재시도 전 대기 시간은 min(max_backoff, backoff * 2 ** (n - 1)) 이며
+    여러 스레드가 동시에 재시도하지 않도록 jitter 비율만큼 무작위로 줄인다.
+
+    Args:
+        max_attempts (int  ): 최초 요청을 포함한 최대 시도 횟수
+        backoff      (float): 첫 재시도 전 대기 시간(초)
+        max_backoff  (float): 재시도 대기 시간의 상한(초)
+        jitter       (float): 대기 시간에서 무작위로 줄일 최대 비율 (0 ~ 1)
+        status       (set  ): 재시도할 HTTP 상태 코드
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: float = 0.5,
+        status: set = frozenset({429, 500, 502, 503, 504}),
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status = frozenset(status)
+
+    def delay(self, attempt: int) -> float:
+        """attempt 번째 시도가 실패한 후 대기할 시간(초)"""
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+class CircuitBreaker:
+    """host 단위 circuit breaker
+
+    연속 실패가 threshold 회에 도달하면 cooldown 초 동안 열리며, 열려 있는 동안
+    해당 host 로 요청하려는 모든 스레드가 대기한다. cooldown 이후의 첫 요청이
+    실패하면 다시 열리고, 성공하면 실패 횟수가 초기화된다.
+
+    Args:
+        threshold (int  ): circuit을 여는 연속 실패 횟수
+        cooldown  (float): circuit이 열려 있는 시간(초)
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._open_until > time.monotonic()
+
+    def wait(self) -> None:
+        """circuit이 닫힐 때까지 대기"""
+        while True:
+            with self._lock:
+                remaining = self._open_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._open_until = time.monotonic() + self.cooldown
+                # cooldown 이후 한 번만 더 실패해도 다시 열린다.
+                self._failures = self.threshold - 1
+
+
+_policy = RetryPolicy()
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_breaker_config = {"threshold": 5, "cooldown": 30.0}
+
+
+def set_retry_policy(
+    policy: RetryPolicy | None = None,
+    breaker_threshold: int | None = None,
+    breaker_cooldown: float | None = None,
+) -> None:
+    """전송 계층의 재시도 정책과 circuit breaker 설정을 변경
+
+    >> set_retry_policy(RetryPolicy(max_attempts=8, max_backoff=60))
+
+    Args:
+        policy            (RetryPolicy, optional): 재시도 정책
+        breaker_threshold (int,         optional): circuit을 여는 연속 실패 횟수
+        breaker_cooldown  (float,       optional): circuit이 열려 있는 시간(초)
+    """
+    global _policy
+    if policy is not None:
+        _policy = policy
+    with _breakers_lock:
+        if breaker_threshold is not None:
+            _breaker_config["threshold"] = breaker_threshold
+        if breaker_cooldown is not None:
+            _breaker_config["cooldown"] = breaker_cooldown
+        _breakers.clear()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """현재 재시도 정책을 반환"""
+    return _policy
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """host 에 해당하는 CircuitBreaker를 반환 (없으면 생성)"""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(**_breaker_config)
+        return breaker
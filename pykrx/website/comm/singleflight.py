@@ -0,0 +1,45 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나로 합친다.
+
+    먼저 도착한 호출만 func를 실행하고, 실행 중에 같은 키로 들어온 호출은
+    완료될 때까지 기다렸다가 같은 결과(또는 예외)를 받는다. 완료된 호출은
+    기억하지 않으므로 이후 호출은 다시 실행된다.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -1,10 +1,31 @@
+import contextlib
+import contextvars
+import functools
 import json
 import logging
 
 from pandas import DataFrame
 
+# True이면 dataframe_empty_handler가 예외를 삼키지 않고 다시 발생시킨다.
+_propagate_errors = contextvars.ContextVar("propagate_errors", default=False)
+
+
+@contextlib.contextmanager
+def propagate_errors():
+    """블록 안에서 호출된 wrap 함수의 예외를 빈 DataFrame 대신 그대로 전달
+
+    >> with propagate_errors():
+    ..     df = krx.get_market_ohlcv_by_date("20210104", "20210108", "005930")
+    """
+    token = _propagate_errors.set(True)
+    try:
+        yield
+    finally:
+        _propagate_errors.reset(token)
+
 
 def dataframe_empty_handler(func):
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -15,6 +36,8 @@ def dataframe_empty_handler(func):
             ValueError,
             json.JSONDecodeError,
         ) as e:
+            if _propagate_errors.get():
+                raise
             print(f"Error occurred in {func.__name__}: {e}")
             logging.info(args, kwargs)
             logging.info(e)
@@ -1,17 +1,23 @@
+import threading
+import time
 from abc import abstractmethod
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from pykrx.website.comm.auth import (
-    build_krx_session,
-    get_auth_session,
-    set_auth_session,
+from pykrx.website.comm.auth import get_auth_session
+from pykrx.website.comm.ratelimit import get_rate_limiter
+from pykrx.website.comm.retry import (
+    TransportError,
+    get_circuit_breaker,
+    get_retry_policy,
 )
 
-# Initialize session at module load time
-_session = build_krx_session()
-# Set the auth session for get_auth_session() to work
-set_auth_session(_session)
+# KRX 로그인 세션은 첫 KRX 요청 시점에 get_auth_session()이 생성한다.
+_session = None
+
+KRX_HOST = "data.krx.co.kr"
 
 
 def set_session(session) -> requests.Session | None:
@@ -20,11 +26,164 @@ def set_session(session) -> requests.Session | None:
     _session = session
 
 
-def get_session() -> requests.Session | None:
-    """Get the current KRX session with automatic refresh if expired."""
+def get_session(url: str | None = None) -> requests.Session | None:
+    """Get the current KRX session with automatic refresh if expired.
+
+    url 이 KRX 가 아닌 host 를 가리키면 로그인 없이 None 을 반환한다.
+    """
+    if url is not None and urlsplit(url).hostname != KRX_HOST:
+        return None
     return get_auth_session()
 
 
+# 연결 풀 설정
+#  - pool_size  : host 별로 유지할 최대 연결 수 (동시 요청 스레드 수 이상 권장)
+#  - keep_alive : 요청 후 연결을 유지할지 여부
+#  - timeout    : (connect, read) 타임아웃(초)
+_http_config = {"pool_size": 16, "keep_alive": True, "timeout": (10, 60)}
+_pools: dict[str, requests.Session] = {}
+_pools_lock = threading.Lock()
+# configure_http를 호출할 때마다 증가한다. 세션에 장착된 풀의 세대가 다르면
+# (로그인 세션 포함) 다음 요청에서 새 설정으로 다시 장착한다.
+_pool_generation = 0
+
+
+def configure_http(
+    pool_size: int | None = None,
+    keep_alive: bool | None = None,
+    timeout: float | tuple | None = None,
+) -> None:
+    """host 별 HTTP 연결 풀 설정을 변경
+
+    이미 생성된 연결 풀은 닫히고 다음 요청부터 새 설정으로 다시 생성된다.
+    KRX 로그인 세션의 연결 풀과 헤더도 다음 요청에서 새 설정으로 바뀐다.
+
+    Args:
+        pool_size  (int,   optional): host 별 최대 연결 수
+        keep_alive (bool,  optional): keep-alive 사용 여부
+        timeout    (tuple, optional): (connect, read) 타임아웃(초)
+    """
+    global _pool_generation
+    with _pools_lock:
+        _pool_generation += 1
+        if pool_size is not None:
+            _http_config["pool_size"] = pool_size
+        if keep_alive is not None:
+            _http_config["keep_alive"] = keep_alive
+        if timeout is not None:
+            _http_config["timeout"] = timeout
+        for session in _pools.values():
+            session.close()
+        _pools.clear()
+
+
+def mount_pool(session: requests.Session) -> requests.Session:
+    """session 에 현재 설정의 연결 풀 어댑터를 장착 (이전 어댑터는 닫는다)"""
+    for adapter in list(session.adapters.values()):
+        adapter.close()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_http_config["pool_size"])
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    keep_alive = _http_config["keep_alive"]
+    session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+    session.pykrx_pooled = _pool_generation
+    return session
+
+
+def ensure_pool(session: requests.Session) -> requests.Session:
+    """session 에 현재 설정의 연결 풀이 없으면 다시 장착"""
+    if getattr(session, "pykrx_pooled", None) != _pool_generation:
+        mount_pool(session)
+    return session
+
+
+def get_pooled_session(url: str) -> requests.Session:
+    """url 의 host 에 대한 공유 requests.Session을 반환 (없으면 생성)"""
+    host = urlsplit(url).hostname
+    with _pools_lock:
+        session = _pools.get(host)
+        if session is None:
+            session = _pools[host] = mount_pool(requests.Session())
+        return session
+
+
+def throttle(url: str) -> None:
+    """url 의 host 에 설정된 요청 한도를 넘지 않도록 대기"""
+    limiter = get_rate_limiter(urlsplit(url).hostname)
+    if limiter is not None:
+        limiter.acquire()
+
+
+# 재시도할 전송 계층 예외
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def _retry_after(resp: requests.Response) -> float | None:
+    """429/503 응답의 Retry-After 헤더(초)를 반환"""
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _response_error(resp: requests.Response, status: frozenset):
+    """재시도해야 하는 응답이면 그 사유를, 아니면 None을 반환
+
+    본문이 JSON이 아닌 정상 응답은 재시도하지 않는다. 호출자의 JSON 디코딩
+    오류는 dataframe_empty_handler가 빈 결과로 처리한다.
+    """
+    if resp.status_code in status:
+        return f"HTTP {resp.status_code}"
+    return None
+
+
+def send_with_retry(url: str, send) -> requests.Response:
+    """재시도 정책과 host 별 circuit breaker를 적용해 요청을 보낸다.
+
+    연결 오류와 정책의 상태 코드(5xx, 429) 응답만 재시도한다. Retry-After
+    헤더의 대기 시간도 정책의 max_backoff를 넘지 않는다.
+
+    Args:
+        url  (str     ): 요청 URL (host 별 요청 한도/circuit breaker 기준)
+        send (callable): 요청을 한 번 보내고 Response를 반환하는 함수
+
+    Returns:
+        requests.Response: 재시도 대상이 아닌 응답
+
+    Raises:
+        TransportError: 최대 시도 횟수 안에 정상 응답을 받지 못한 경우
+    """
+    policy = get_retry_policy()
+    breaker = get_circuit_breaker(urlsplit(url).hostname)
+    for attempt in range(1, policy.max_attempts + 1):
+        breaker.wait()
+        throttle(url)
+        wait = None
+        try:
+            resp = send()
+        except RETRYABLE_ERRORS as e:
+            error = repr(e)
+        else:
+            error = _response_error(resp, policy.status)
+            if error is None:
+                breaker.record_success()
+                return resp
+            wait = _retry_after(resp)
+            if wait is not None:
+                wait = min(wait, policy.max_backoff)
+        breaker.record_failure()
+        if attempt < policy.max_attempts:
+            time.sleep(policy.delay(attempt) if wait is None else wait)
+    raise TransportError(f"{url}: {error} after {policy.max_attempts} attempts")
+
+
 class Get:
     def __init__(self):
         self.headers = {
@@ -34,12 +193,18 @@ class Get:
         }
 
     def read(self, **params):
-        krxs = get_session()
+        return send_with_retry(self.url, lambda: self._send(params))
 
+    def _send(self, params: dict) -> requests.Response:
+        krxs = get_session(self.url)
+
+        timeout = _http_config["timeout"]
         if krxs is None:
-            # 세션이 없으면 새 요청 생성
-            session = requests.Session()
-            resp = session.get(self.url, headers=self.headers, params=params)
+            # 세션이 없으면 host 별 공유 연결 풀 사용
+            session = get_pooled_session(self.url)
+            resp = session.get(
+                self.url, headers=self.headers, params=params, timeout=timeout
+            )
         else:
             # KRXSession 의 헤더 사용 (쿠키 포함)
             headers = krxs.get_headers()
@@ -47,7 +212,10 @@ class Get:
             for key, value in self.headers.items():
                 headers[key] = value
 
-            resp = krxs.session.get(self.url, headers=headers, params=params)
+            ensure_pool(krxs.session)
+            resp = krxs.session.get(
+                self.url, headers=headers, params=params, timeout=timeout
+            )
 
         return resp
 
@@ -68,12 +236,18 @@ class Post:
             self.headers.update(headers)
 
     def read(self, **params):
-        krxs = get_session()
+        return send_with_retry(self.url, lambda: self._send(params))
+
+    def _send(self, params: dict) -> requests.Response:
+        krxs = get_session(self.url)
 
+        timeout = _http_config["timeout"]
         if krxs is None:
-            # 세션이 없으면 새 요청 생성
-            session = requests.Session()
-            resp = session.post(self.url, headers=self.headers, data=params)
+            # 세션이 없으면 host 별 공유 연결 풀 사용
+            session = get_pooled_session(self.url)
+            resp = session.post(
+                self.url, headers=self.headers, data=params, timeout=timeout
+            )
         else:
             # KRXSession 의 헤더 사용 (쿠키 포함)
             headers = krxs.get_headers()
@@ -81,7 +255,10 @@ class Post:
             for key, value in self.headers.items():
                 headers[key] = value
 
-            resp = krxs.session.post(self.url, headers=headers, data=params)
+            ensure_pool(krxs.session)
+            resp = krxs.session.post(
+                self.url, headers=headers, data=params, timeout=timeout
+            )
 
         return resp
 
@@ -1,9 +1,48 @@
-import datetime
+import ast
+import importlib
+from pathlib import Path
 
-from .bond import *
-from .etx import *
-from .future import *
-from .market import *
+# 하위 패키지는 처음 접근할 때 import 한다. 채권 수익률만 조회하는 경우에는
+# market/etx/future의 wrap/core 모듈을 읽지 않는다.
+_SUBMODULES = ("bond", "etx", "future", "market")
+
+# 하위 패키지/모듈별 공개 이름. 하위 패키지를 import 하지 않도록 __init__.py
+# (또는 모듈)의 __all__ 을 소스에서 읽는다.
+_MODULES = (*_SUBMODULES, "calendar", "master")
+
+
+def _read_all(sub: str) -> tuple:
+    path = Path(__file__).parent / sub / "__init__.py"
+    if not path.exists():
+        path = path.parent.with_suffix(".py")
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__"
+            for target in node.targets
+        ):
+            return tuple(ast.literal_eval(node.value))
+    return ()
+
+
+_EXPORTS = {sub: _read_all(sub) for sub in _MODULES}
+
+_LAZY_ATTRS = {name: sub for sub, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    sub = _LAZY_ATTRS.get(name)
+    if sub is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{sub}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_LAZY_ATTRS))
 
 
 def datetime2string(dt, freq="d"):
@@ -26,20 +65,9 @@ def get_nearest_business_day_in_a_week(date: str = None, prev: bool = True) -> s
     Returns:
         str: 날짜 (YYMMDD)
     """
-    if date is None:
-        curr = datetime.datetime.now()
-    else:
-        curr = datetime.datetime.strptime(date, "%Y%m%d")
-
-    if prev:
-        prev = curr - datetime.timedelta(days=7)
-        curr = curr.strftime("%Y%m%d")
-        prev = prev.strftime("%Y%m%d")
-        df = get_index_ohlcv_by_date(prev, curr, "1001")
-        return df.index[-1].strftime("%Y%m%d")
-    else:
-        next = curr + datetime.timedelta(days=7)
-        next = next.strftime("%Y%m%d")
-        curr = curr.strftime("%Y%m%d")
-        df = get_index_ohlcv_by_date(curr, next, "1001")
-        return df.index[0].strftime("%Y%m%d")
+    from .calendar import get_calendar
+
+    if date is not None:
+        date = date.replace("-", "")
+    calendar = get_calendar()
+    return calendar.prev(date) if prev else calendar.next(date)
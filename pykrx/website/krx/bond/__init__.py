@@ -1,2 +1,9 @@
 from .ticker import *
 from .wrap import *
+
+__all__ = [
+    "개별추이_장외채권수익률",
+    "전종목_장외채권수익률",
+    "get_otc_treasury_yields_by_ticker",
+    "get_otc_treasury_yields_by_date",
+]
@@ -57,7 +57,7 @@ class 전종목_장외채권수익률(KrxWebIo):
 
         """
         result = self.read(inqTpCd="T", trdDd=trdDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 개별추이_장외채권수익률(KrxWebIo):
@@ -101,7 +101,7 @@ class 개별추이_장외채권수익률(KrxWebIo):
         result = self.read(
             inqTpCd="E", strtDd=strtDd, endDd=endDd, bndKindTpCd=bndKindTpCd
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,289 @@
+import bisect
+import datetime
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pykrx.website.comm.cache import KST
+
+__all__ = [
+    "TradingCalendar",
+    "get_calendar",
+    "set_calendar",
+]
+
+
+def _ordinal(date) -> int:
+    """YYYYMMDD 문자열, datetime, Timestamp를 날짜 서수로 변환"""
+    if isinstance(date, str):
+        date = date.replace("-", "").replace("/", "")
+        date = datetime.date(int(date[:4]), int(date[4:6]), int(date[6:8]))
+    return date.toordinal()
+
+
+def _yyyymmdd(ordinal: int) -> str:
+    return datetime.date.fromordinal(ordinal).strftime("%Y%m%d")
+
+
+class TradingCalendar:
+    """KOSPI 지수(1001)가 집계된 날을 거래일로 사용하는 KRX 거래일 달력
+
+    조회한 구간을 기억해 두고, 아직 조회하지 않은 구간만 KRX에 요청한다.
+    마감된 구간은 바뀌지 않으므로 path가 주어지면 파일에 저장해 다음
+    실행에서도 다시 요청하지 않는다. 당일의 거래일 여부는 장 시작 전후로
+    바뀔 수 있으므로 ttl 초 동안만 기억한다.
+
+    >> cal = TradingCalendar("~/.cache/pykrx/calendar.json")
+    >> cal.build("20000101")               # 선택: 전체 이력을 한 번에 조회
+    >> cal.prev("20210101")                # '20201230'
+    >> cal.is_trading_day("20210104")      # True
+
+    Args:
+        path (str, optional): 달력을 저장할 JSON 파일
+        ttl  (int, optional): 당일 거래일 여부를 기억하는 시간(초)
+    """
+
+    # 인접 거래일을 찾을 때 한 번에 조회하는 일 수
+    window = 7
+    # 인접 거래일을 찾을 때 window를 이동하는 최대 횟수
+    max_windows = 8
+
+    def __init__(self, path=None, ttl: int = 600):
+        self.path = None if path is None else Path(path).expanduser()
+        self.ttl = ttl
+        self._days = []  # 거래일 서수 (오름차순)
+        self._day_set = set()
+        self._covered = []  # 조회를 마친 [시작, 끝] 서수 구간 (오름차순, 겹치지 않음)
+        self._today = None  # (서수, 조회 시각)
+        self._array = None
+        self._lock = threading.RLock()
+        if self.path is not None:
+            self._load()
+
+    # ------------------------------------------------------------------ 저장
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._add_days(_ordinal(x) for x in data.get("days", []))
+        for start, end in data.get("covered", []):
+            self._add_covered(_ordinal(start), _ordinal(end))
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "days": [_yyyymmdd(x) for x in self._days],
+            "covered": [[_yyyymmdd(s), _yyyymmdd(e)] for s, e in self._covered],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    # ------------------------------------------------------------------ 구간
+    def _add_days(self, days) -> None:
+        new = set(days) - self._day_set
+        if new:
+            self._day_set |= new
+            self._days = sorted(self._day_set)
+            self._array = None
+
+    def _add_covered(self, start: int, end: int) -> None:
+        merged = []
+        for s, e in self._covered:
+            if e + 1 < start or end + 1 < s:
+                merged.append((s, e))
+            else:
+                start, end = min(s, start), max(e, end)
+        merged.append((start, end))
+        self._covered = sorted(merged)
+
+    def _missing(self, start: int, end: int) -> list:
+        pieces = []
+        for s, e in self._covered:
+            if e < start:
+                continue
+            if s > end:
+                break
+            if s > start:
+                pieces.append((start, s - 1))
+            start = e + 1
+        if start <= end:
+            pieces.append((start, end))
+        return pieces
+
+    def _today_ordinal(self) -> int:
+        return datetime.datetime.now(KST).date().toordinal()
+
+    @staticmethod
+    def _fetch(start: int, end: int) -> list:
+        from pykrx.website.krx.market.core import 개별지수시세
+
+        # wrap 함수를 거치지 않으므로 요청 실패는 예외로 전달되고, 거래일이 없는
+        # 구간(주말, 연휴)의 빈 응답은 빈 목록이 된다.
+        df = 개별지수시세(columns=["TRD_DD"]).fetch(
+            "001", "1", _yyyymmdd(start), _yyyymmdd(end)
+        )
+        if df.empty:
+            return []
+        return [_ordinal(day) for day in df["TRD_DD"]]
+
+    def _ensure(self, start: int, end: int) -> list:
+        """[start, end] 구간의 거래일을 알 수 있도록 필요한 구간만 조회
+
+        Returns:
+            list: 이번에 새로 조회한 거래일 서수
+        """
+        with self._lock:
+            today = self._today_ordinal()
+            end = min(end, today)
+            if start > end:
+                return []
+
+            pieces = self._missing(start, min(end, today - 1))
+            if end == today:
+                fresh = (
+                    self._today is not None
+                    and self._today[0] == today
+                    and time.monotonic() - self._today[1] < self.ttl
+                )
+                if not fresh:
+                    # 전일까지의 조회 구간과 당일을 한 번에 요청한다.
+                    if pieces and pieces[-1][1] == today - 1:
+                        pieces[-1] = (pieces[-1][0], today)
+                    else:
+                        pieces.append((today, today))
+
+            fetched = []
+            for s, e in pieces:
+                days = self._fetch(s, e)
+                fetched.extend(days)
+                self._add_days(days)
+                if e >= today:
+                    self._today = (today, time.monotonic())
+                    e = today - 1
+                if s <= e:
+                    self._add_covered(s, e)
+            if pieces:
+                self._save()
+            return fetched
+
+    # ------------------------------------------------------------------ 조회
+    def build(self, fromdate: str = "19950502", todate: str | None = None) -> None:
+        """fromdate부터 todate(기본값: 당일)까지 조회하지 않은 구간을 한 번에 조회"""
+        end = self._today_ordinal() if todate is None else _ordinal(todate)
+        self._ensure(_ordinal(fromdate), end)
+
+    def covers(self, fromdate, todate) -> bool:
+        """fromdate ~ todate 구간을 요청 없이 알 수 있는지 여부"""
+        start, end = _ordinal(fromdate), _ordinal(todate)
+        with self._lock:
+            return not self._missing(start, min(end, self._today_ordinal() - 1))
+
+    def is_trading_day(self, date) -> bool:
+        """거래일 여부"""
+        day = _ordinal(date)
+        self._ensure(day, day)
+        return day in self._day_set
+
+    def prev(self, date=None, inclusive: bool = True) -> str:
+        """date 이전(inclusive이면 date 포함)의 가장 가까운 거래일 (YYYYMMDD)"""
+        day = self._today_ordinal() if date is None else _ordinal(date)
+        if not inclusive:
+            day -= 1
+        end = day
+        for _ in range(self.max_windows):
+            start = end - self.window
+            # 조회 응답의 거래일과 이미 알고 있는 거래일 중 가장 가까운 날
+            found = [x for x in self._ensure(start, end) if x <= day]
+            i = bisect.bisect_right(self._days, day)
+            if i and self._days[i - 1] >= start:
+                found.append(self._days[i - 1])
+            if found:
+                return _yyyymmdd(max(found))
+            end = start - 1
+        raise ValueError(f"{_yyyymmdd(day)} 이전의 거래일을 찾을 수 없습니다.")
+
+    def next(self, date=None, inclusive: bool = True) -> str:
+        """date 이후(inclusive이면 date 포함)의 가장 가까운 거래일 (YYYYMMDD)"""
+        day = self._today_ordinal() if date is None else _ordinal(date)
+        if not inclusive:
+            day += 1
+        start = day
+        for _ in range(self.max_windows):
+            end = start + self.window
+            found = [x for x in self._ensure(start, end) if x >= day]
+            i = bisect.bisect_left(self._days, day)
+            if i < len(self._days) and self._days[i] <= end:
+                found.append(self._days[i])
+            if found:
+                return _yyyymmdd(min(found))
+            if end >= self._today_ordinal():
+                break
+            start = end + 1
+        raise ValueError(f"{_yyyymmdd(day)} 이후의 거래일을 찾을 수 없습니다.")
+
+    def days(self, fromdate, todate) -> pd.DatetimeIndex:
+        """fromdate ~ todate 사이의 거래일"""
+        start, end = _ordinal(fromdate), _ordinal(todate)
+        self._ensure(start, end)
+        with self._lock:
+            lo = bisect.bisect_left(self._days, start)
+            hi = bisect.bisect_right(self._days, end)
+            days = self.to_numpy()[lo:hi]
+        return pd.DatetimeIndex(days.astype("datetime64[ns]"))
+
+    def to_numpy(self) -> np.ndarray:
+        """지금까지 조회된 거래일 (datetime64[D] 배열)"""
+        with self._lock:
+            if self._array is None:
+                # 서수 1 = 0001-01-01, datetime64[D]의 0 = 1970-01-01
+                epoch = datetime.date(1970, 1, 1).toordinal()
+                ordinals = np.asarray(self._days, dtype=np.int64) - epoch
+                self._array = ordinals.astype("datetime64[D]")
+            return self._array
+
+
+def _default_calendar() -> TradingCalendar:
+    # 응답 캐시와 같은 디렉터리에 거래일 달력을 저장한다.
+    cache_dir = os.getenv("PYKRX_CACHE_DIR")
+    if cache_dir:
+        return TradingCalendar(Path(cache_dir).expanduser() / "calendar.json")
+    return TradingCalendar()
+
+
+_calendar = None
+_calendar_lock = threading.Lock()
+
+
+def get_calendar() -> TradingCalendar:
+    """get_nearest_business_day_in_a_week 등이 사용하는 거래일 달력을 반환"""
+    global _calendar
+    with _calendar_lock:
+        if _calendar is None:
+            _calendar = _default_calendar()
+        return _calendar
+
+
+def set_calendar(calendar: TradingCalendar | None) -> None:
+    """거래일 달력을 설정 (None이면 기본 달력을 다시 만든다)
+
+    >> set_calendar(TradingCalendar("~/.cache/pykrx/calendar.json"))
+    """
+    global _calendar
+    with _calendar_lock:
+        _calendar = calendar
@@ -0,0 +1,103 @@
+import re
+from operator import itemgetter
+
+import numpy as np
+from pandas import DataFrame
+
+# 숫자/부호/소수점 이외의 문자 (천 단위 구분자, 공백, % 등)
+_NON_NUMERIC = re.compile(r"[^-\d.]")
+
+
+def build_frame(records: list, columns: list | None = None) -> DataFrame:
+    """KRX JSON 응답의 레코드 목록을 컬럼 단위로 DataFrame으로 변환
+
+    columns가 주어지면 해당 컬럼의 값만 하나의 2차원 배열로 모아 DataFrame을
+    만든다. 행 단위 dict 전체를 DataFrame이 해석하지 않으므로 전종목 조회처럼
+    행/컬럼이 많은 응답에서 사용하지 않는 컬럼을 만드는 비용이 없다.
+
+    Args:
+        records (list          ): [{"ISU_SRT_CD": "005930", ...}, ...]
+        columns (list, optional): 만들 컬럼 목록. None이면 전체 컬럼
+
+    Returns:
+        DataFrame: 레코드가 없으면 빈 DataFrame
+
+    Raises:
+        KeyError: 요청한 컬럼이 응답에 없는 경우
+    """
+    if columns is None or not records:
+        return DataFrame(records)
+
+    values = np.empty((len(records), len(columns)), dtype=object)
+    try:
+        getter = itemgetter(*columns)
+        if len(columns) == 1:
+            values[:, 0] = [getter(row) for row in records]
+        else:
+            values[:] = [getter(row) for row in records]
+    except KeyError:
+        # 일부 행에만 있는 컬럼은 None으로 채운다.
+        for i, col in enumerate(columns):
+            if not any(col in row for row in records):
+                raise
+            values[:, i] = [row.get(col) for row in records]
+    return DataFrame(values, columns=columns, copy=False).infer_objects()
+
+
+def parse_number(values, dtype) -> np.ndarray:
+    """KRX 형식의 숫자 문자열을 한 번의 순회로 dtype 배열로 변환
+
+    천 단위 구분자와 공백 등은 제거하고, 값이 없음을 의미하는 "" 와 "-" 는
+    0으로 변환한다.
+
+    >> parse_number(["1,234", "-", "", "-1.90"], np.float32)
+    array([ 1234. ,     0. ,     0. ,    -1.9], dtype=float32)
+
+    Args:
+        values (sequence): 변환할 값
+        dtype  (dtype   ): 변환할 numpy dtype
+
+    Returns:
+        np.ndarray: dtype 배열
+    """
+    dtype = np.dtype(dtype)
+    conv = int if dtype.kind in "iu" else float
+
+    def _parse(x):
+        if not isinstance(x, str):
+            return x
+        x = x.replace(",", "")
+        if x == "" or x == "-":
+            return 0
+        try:
+            return conv(x)
+        except ValueError:
+            x = _NON_NUMERIC.sub("", x)
+            return 0 if x == "" or x == "-" else conv(x)
+
+    return np.fromiter(map(_parse, values), dtype=dtype, count=len(values))
+
+
+def parse_numeric(df: DataFrame, dtype) -> DataFrame:
+    """KRX 형식의 숫자 컬럼을 지정한 dtype으로 변환
+
+    df.astype과 같은 형식으로 dtype을 지정하며, 지정하지 않은 컬럼은 그대로
+    둔다. 숫자 컬럼은 parse_number로 한 번만 순회하고, 그 외 dtype은 astype으로
+    변환한다.
+
+    Args:
+        df    (DataFrame  ): 변환할 DataFrame
+        dtype (dtype, dict): 전체 컬럼의 dtype 또는 {컬럼: dtype}
+
+    Returns:
+        DataFrame: 변환된 DataFrame
+    """
+    if not isinstance(dtype, dict):
+        dtype = dict.fromkeys(df.columns, dtype)
+    df = df.copy(deep=False)
+    for col, col_dtype in dtype.items():
+        if np.dtype(col_dtype).kind in "iuf":
+            df[col] = parse_number(df[col].to_numpy(), col_dtype)
+        else:
+            df[col] = df[col].astype(col_dtype)
+    return df
@@ -1,2 +1,37 @@
 from .ticker import *
 from .wrap import *
+
+__all__ = [
+    "ELW_전종목기본종목",
+    "ETF_전종목기본종목",
+    "ETN_전종목기본종목",
+    "EtxTicker",
+    "get_etx_name",
+    "get_etx_ticker_list",
+    "is_etf",
+    "is_etn",
+    "is_elw",
+    "get_etx_isin",
+    "ETF_투자자별거래실적_개별종목_기간합계",
+    "ETF_투자자별거래실적_개별종목_일별추이",
+    "ETF_투자자별거래실적_기간합계",
+    "ETF_투자자별거래실적_일별추이",
+    "ETN_투자자별거래실적_개별종목_기간합계",
+    "ETN_투자자별거래실적_개별종목_일별추이",
+    "PDF",
+    "개별종목시세_ETF",
+    "전종목등락률_ETF",
+    "전종목시세_ETF",
+    "괴리율추이",
+    "추적오차율추이",
+    "get_etf_ohlcv_by_date",
+    "get_etf_ohlcv_by_ticker",
+    "get_etf_price_change_by_ticker",
+    "get_etf_portfolio_deposit_file",
+    "get_etf_price_deviation",
+    "get_etf_tracking_error",
+    "get_trading_volume_and_value_by_investor",
+    "get_trading_volume_and_value_by_date",
+    "get_indivisual_trading_volume_and_value_by_investor",
+    "get_indivisual_trading_volume_and_value_by_date",
+]
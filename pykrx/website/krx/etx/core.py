@@ -27,7 +27,7 @@ class 상장종목검색(KrxWebIo):
                 4  KR7278420005     278420      ARIRANG ESG우수기업
         """
         result = self.read(mktsel=market, searchText=name)
-        return DataFrame(result["block1"])
+        return self.decode(result["block1"])
 
 
 class ETF_전종목기본종목(KrxWebIo):
@@ -49,7 +49,7 @@ class ETF_전종목기본종목(KrxWebIo):
                 4        KR7287300008     287300                         KB KBSTAR 200건설증권상장지수투자신탁(주식)                   KBSTAR 200건설                    KB KBSTAR 200 Constructions ETF  2017/12/22                     코스피 200 건설                KRX                일반 (1)                    실물            국내             주식       560,000   케이비자산운용   20,000       0.190                    비과세
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read()
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ETN_전종목기본종목(KrxWebIo):
@@ -71,7 +71,7 @@ class ETN_전종목기본종목(KrxWebIo):
                 4    KRG581100069     580006               KB증권 KB KTOP30 파생결합증권(상장지수증권) 제6호           KB KTOP30 ETN                             KB KB KTOP30 ETN 6  2016/10/27  2026/10/23                 KTOP 30              KRX                 일반            ETN            국내             주식   5,000,000    KB증권       0.39      비과세
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read()
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ELW_전종목기본종목(KrxWebIo):
@@ -93,7 +93,7 @@ class ELW_전종목기본종목(KrxWebIo):
                 4     KRA5811A0A44     58F407    KB증권(주) 주식워런트증권 제F407호      KBF407LG화학콜    KB SECURITIES ELW F407  2020/04/28  2021/02/10  2021/02/16          주식       LG화학  16,000,000    KB증권        0.002         콜      유럽형  322,500  KB증권          15           현금결제
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read()
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 개별종목시세_ETF(KrxWebIo):
@@ -118,7 +118,7 @@ class 개별종목시세_ETF(KrxWebIo):
                 3  2021/01/14     43,835          2            30   -0.07  43,942.97     43,725    43,995    43,585    196,552   8,602,863,505  861,357,750,000          845,902,227,451  19,650,000    코스피 200         429.85           2          0.53       -0.12
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(isuCd=isin, strtDd=strtDd, endDd=endDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전종목시세_ETF(KrxWebIo):
@@ -143,7 +143,7 @@ class 전종목시세_ETF(KrxWebIo):
                 4       278420      ARIRANG ESG우수기업      8,950           145          1    1.65    8,952.56      8,815     8,975     8,810     39,513    352,947,304    4,027,500,000                        0     450,000    WISE ESG우수기업 지수       1,210.07         19.83           1     1.67
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=date)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전종목등락률_ETF(KrxWebIo):
@@ -171,7 +171,7 @@ class 전종목등락률_ETF(KrxWebIo):
                     4       278420       ARIRANG ESG우수기업    9,095    9,385          1     290    3.19      9,114      84,463,155
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(strtDd=strtDd, endDd=endDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class PDF(KrxWebIo):
@@ -198,7 +198,7 @@ class PDF(KrxWebIo):
                 NOTE: 웹 서버가 COMPST_ISU_CD에 ISIN과 축향형을 혼합해서 반환한다. Why?>
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=date, isuCd=isin)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 추적오차율추이(KrxWebIo):
@@ -225,7 +225,7 @@ class 추적오차율추이(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isin)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 괴리율추이(KrxWebIo):
@@ -252,7 +252,7 @@ class 괴리율추이(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ETF_투자자별거래실적_기간합계(KrxWebIo):
@@ -286,7 +286,7 @@ class ETF_투자자별거래실적_기간합계(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=strtDd, endDd=endDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ETF_투자자별거래실적_일별추이(KrxWebIo):
@@ -323,7 +323,7 @@ class ETF_투자자별거래실적_일별추이(KrxWebIo):
             inqCondTpCd1=inqCondTpCd1,
             inqCondTpCd2=inqCondTpCd2,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ETF_투자자별거래실적_개별종목_기간합계(KrxWebIo):
@@ -361,7 +361,7 @@ class ETF_투자자별거래실적_개별종목_기간합계(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ETF_투자자별거래실적_개별종목_일별추이(KrxWebIo):
@@ -403,7 +403,7 @@ class ETF_투자자별거래실적_개별종목_일별추이(KrxWebIo):
             strtDd=strtDd,
             endDd=endDd,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ETN_투자자별거래실적_개별종목_기간합계(KrxWebIo):
@@ -441,7 +441,7 @@ class ETN_투자자별거래실적_개별종목_기간합계(KrxWebIo):
         """  # pylint: disable=line-too-long # noqa: E501
 
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class ETN_투자자별거래실적_개별종목_일별추이(KrxWebIo):
@@ -480,7 +480,7 @@ class ETN_투자자별거래실적_개별종목_일별추이(KrxWebIo):
             strtDd=strtDd,
             endDd=endDd,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 if __name__ == "__main__":
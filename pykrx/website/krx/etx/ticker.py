@@ -1,3 +1,5 @@
+import threading
+
 import pandas as pd
 
 from pykrx.website.comm import dataframe_empty_handler, singleton
@@ -6,48 +8,111 @@ from pykrx.website.krx.etx.core import (
     ETF_전종목기본종목,
     ETN_전종목기본종목,
 )
+from pykrx.website.krx.master import load_master
 
+# 티커를 찾을 때 확인하는 순서 (종목 수가 가장 많은 ELW를 마지막에 조회)
+CATEGORIES = {
+    "ETF": ETF_전종목기본종목,
+    "ETN": ETN_전종목기본종목,
+    "ELW": ELW_전종목기본종목,
+}
 
-@singleton
-class EtxTicker:
-    def __init__(self):
-        self.df = self._get_tickers()
+# 분류를 지정하지 않은 조회에서는 이미 조회한 경우에만 확인하는 분류
+ON_DEMAND = ("ELW",)
 
-    @dataframe_empty_handler
-    def _get_tickers(self):
-        df_etf = ETF_전종목기본종목().fetch()
-        df_etf = df_etf[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_etf["CATEGORY"] = "ETF"
 
-        df_etn = ETN_전종목기본종목().fetch()
-        df_etn = df_etn[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_etn["CATEGORY"] = "ETN"
+@singleton
+class EtxTicker:
+    """ETF/ETN/ELW 티커 마스터
 
-        df_elw = ELW_전종목기본종목().fetch()
-        df_elw = df_elw[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
-        df_elw["CATEGORY"] = "ELW"
+    분류별 목록은 처음 필요할 때 해당 분류만 조회한다. ETF만 사용하는
+    경우에는 수천 종목의 ELW 목록을 받지 않는다. 분류를 지정하지 않은
+    조회에서 ETF/ETN에 없는 티커도 ELW 목록을 새로 받지 않는다.
+    """
 
-        df = pd.concat([df_etf, df_etn, df_elw])
+    def __init__(self):
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def load(self, *markets) -> None:
+        """분류별 목록을 미리 조회 (기본값: 전체 분류)"""
+        for market in markets or CATEGORIES:
+            self._frame(market)
+
+    def _frame(self, market: str) -> pd.DataFrame:
+        df = self._frames.get(market)
+        if df is None:
+            with self._lock:
+                df = self._frames.get(market)
+                if df is None:
+                    df = load_master(
+                        market.lower(),
+                        lambda: self._get_tickers(market),
+                        self._refreshed(market),
+                    )
+                    self._frames[market] = df
+        return df
+
+    def _refreshed(self, market: str):
+        # 백그라운드에서 갱신된 마스터로 교체한다.
+        def _update(df):
+            self._frames[market] = df
+
+        return _update
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """전체 분류의 목록 (모든 분류를 조회한다)"""
+        return pd.concat([self._frame(market) for market in CATEGORIES])
+
+    @staticmethod
+    @dataframe_empty_handler
+    def _get_tickers(market: str) -> pd.DataFrame:
+        columns = ["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]
+        df = CATEGORIES[market](columns).fetch()
+        df["CATEGORY"] = market
         df.columns = ["isin", "ticker", "종목명", "상장일", "시장"]
         df = df.replace("/", "", regex=True)
         return df.set_index("ticker")
 
+    def contains(self, ticker: str, market: str) -> bool:
+        """market 분류의 목록에 ticker가 있는지 여부 (해당 분류만 조회)"""
+        return ticker in self._frame(market).index
+
+    def _find(self, ticker: str, market: str | None = None) -> pd.Series:
+        # market이 주어지면 해당 분류를 먼저 확인한다.
+        order = [market] if market in CATEGORIES else []
+        order += [x for x in CATEGORIES if x not in order]
+        for category in order:
+            if (
+                category in ON_DEMAND
+                and category != market
+                and category not in self._frames
+            ):
+                continue
+            df = self._frame(category)
+            if ticker in df.index:
+                return df.loc[ticker]
+        raise KeyError(ticker)
+
     def get_ticker(self, market, date) -> list:
         if market == "ALL":
             return self.df.index.to_list()
-        cond1 = self.df["시장"] == market
-        cond2 = self.df["상장일"] <= date
-        return self.df[cond1 & cond2].index.to_list()
+        df = self._frame(market)
+        return df[df["상장일"] <= date].index.to_list()
+
+    def get_name(self, ticker, market=None) -> str:
+        return self._find(ticker, market)["종목명"]
 
-    def get_name(self, ticker) -> str:
-        return self.df.loc[ticker, "종목명"]
+    def get_isin(self, ticker, market=None) -> str:
+        return self._find(ticker, market)["isin"]
 
-    def get_market(self, ticker) -> str:
-        return self.df.loc[ticker].index["시장"]
+    def get_market(self, ticker, market=None) -> str:
+        return self._find(ticker, market)["시장"]
 
 
-def get_etx_name(ticker):
-    return EtxTicker().get_name(ticker)
+def get_etx_name(ticker, market: str | None = None):
+    return EtxTicker().get_name(ticker, market)
 
 
 def get_etx_ticker_list(date: str, market: str) -> list:
@@ -64,19 +129,19 @@ def get_etx_ticker_list(date: str, market: str) -> list:
 
 
 def is_etf(ticker):
-    return EtxTicker().df.loc[ticker, "시장"] == "ETF"
+    return EtxTicker().contains(ticker, "ETF")
 
 
 def is_etn(ticker):
-    return EtxTicker().df.loc[ticker, "시장"] == "ETN"
+    return EtxTicker().contains(ticker, "ETN")
 
 
 def is_elw(ticker):
-    return EtxTicker().df.loc[ticker, "시장"] == "ELW"
+    return EtxTicker().contains(ticker, "ELW")
 
 
-def get_etx_isin(ticker):
-    return EtxTicker().df.loc[ticker, "isin"]
+def get_etx_isin(ticker, market: str | None = None):
+    return EtxTicker().get_isin(ticker, market)
 
 
 if __name__ == "__main__":
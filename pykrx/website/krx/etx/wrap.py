@@ -3,6 +3,7 @@ import pandas as pd
 from pandas import DataFrame
 
 from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.krx.decode import parse_numeric
 from pykrx.website.krx.etx.core import (
     ETF_투자자별거래실적_개별종목_기간합계,
     ETF_투자자별거래실적_개별종목_일별추이,
@@ -39,11 +40,9 @@ def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
             2020-01-07  822605.0  8225  8225  8200  8220  238722  1960114040  180234.0
     """  # pylint: disable=line-too-long # noqa: E501
 
-    isin = get_etx_isin(ticker)
-    df = 개별종목시세_ETF().fetch(fromdate, todate, isin)
-
-    df = df[
-        [
+    isin = get_etx_isin(ticker, "ETF")
+    df = 개별종목시세_ETF(
+        columns=[
             "TRD_DD",
             "LST_NAV",
             "TDD_OPNPRC",
@@ -54,7 +53,7 @@ def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
             "ACC_TRDVAL",
             "OBJ_STKPRC_IDX",
         ]
-    ]
+    ).fetch(fromdate, todate, isin)
     df.columns = [
         "날짜",
         "NAV",
@@ -66,10 +65,9 @@ def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
         "거래대금",
         "기초지수",
     ]
-    df = df.replace(r"^-$", "0", regex=True)
-    df = df.replace(r",", "", regex=True)
     df = df.set_index("날짜")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "NAV": np.float64,
             "시가": np.uint32,
@@ -79,7 +77,7 @@ def get_etf_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFrame:
             "거래량": np.uint64,
             "거래대금": np.uint64,
             "기초지수": np.float64,
-        }
+        },
     )
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
@@ -106,9 +104,8 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
             278420    9145.45   9055   9150   9055    9105   1164    10598375   1234.03
     """  # pylint: disable=line-too-long # noqa: E501
 
-    df = 전종목시세_ETF().fetch(date)
-    df = df[
-        [
+    df = 전종목시세_ETF(
+        columns=[
             "ISU_SRT_CD",
             "NAV",
             "TDD_OPNPRC",
@@ -119,7 +116,7 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
             "ACC_TRDVAL",
             "OBJ_STKPRC_IDX",
         ]
-    ]
+    ).fetch(date)
     df.columns = [
         "티커",
         "NAV",
@@ -131,10 +128,9 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
         "거래대금",
         "기초지수",
     ]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
     df = df.set_index("티커")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "NAV": np.float64,
             "시가": np.uint32,
@@ -144,7 +140,7 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
             "거래량": np.uint64,
             "거래대금": np.uint64,
             "기초지수": np.float64,
-        }
+        },
     )
     return df
 
@@ -171,9 +167,8 @@ def get_etf_price_change_by_ticker(fromdate: str, todate: str) -> DataFrame:
             278420    9095    9385     290    3.19     9114     84463155
     """
 
-    df = 전종목등락률_ETF().fetch(fromdate, todate)
-    df = df[
-        [
+    df = 전종목등락률_ETF(
+        columns=[
             "ISU_SRT_CD",
             "BAS_PRC",
             "CLSPRC",
@@ -182,12 +177,11 @@ def get_etf_price_change_by_ticker(fromdate: str, todate: str) -> DataFrame:
             "ACC_TRDVOL",
             "ACC_TRDVAL",
         ]
-    ]
+    ).fetch(fromdate, todate)
     df.columns = ["티커", "시가", "종가", "변동폭", "등락률", "거래량", "거래대금"]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
     df = df.set_index("티커")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "시가": np.uint32,
             "종가": np.uint32,
@@ -195,7 +189,7 @@ def get_etf_price_change_by_ticker(fromdate: str, todate: str) -> DataFrame:
             "등락률": np.float32,
             "거래량": np.uint64,
             "거래대금": np.uint64,
-        }
+        },
     )
     return df
 
@@ -218,10 +212,9 @@ def get_etf_portfolio_deposit_file(date: str, ticker: str) -> DataFrame:
             255371	AMERICAN ELECTRIC POWER	15.61	0	0	0.0
     """
 
-    isin = get_etx_isin(ticker)
-    df = PDF().fetch(date, isin)
-    df = df[
-        [
+    isin = get_etx_isin(ticker, "ETF")
+    df = PDF(
+        columns=[
             "COMPST_ISU_CD",
             "COMPST_ISU_NM",
             "COMPST_ISU_CU1_SHRS",
@@ -229,24 +222,23 @@ def get_etf_portfolio_deposit_file(date: str, ticker: str) -> DataFrame:
             "COMPST_AMT",
             "COMPST_RTO",
         ]
-    ]
+    ).fetch(date, isin)
     df.columns = ["티커", "구성종목명", "계약수", "금액", "시가총액", "비중"]
 
     # NOTE: 웹 서버가 COMPST_ISU_CD에 ISIN과 축향형을 혼합해서 반환한다. Why?
     df["티커"] = df["티커"].apply(lambda x: x[3:9] if len(x) > 6 else x)
     df = df.set_index("티커")
-
-    df = df.replace(",", "", regex=True)
-    # - empty string은 int, float로 형변환 불가
-    #  -> 이 문제를 해결하기 위해 '-' 문자는 0으로 치환
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.astype(
+    df["구성종목명"] = (
+        df["구성종목명"].replace(",", "", regex=True).replace(r"\-$", "0", regex=True)
+    )
+    df = parse_numeric(
+        df,
         {
             "계약수": np.float64,
             "금액": np.int64,
             "시가총액": np.int64,
             "비중": np.float32,
-        }
+        },
     )
     df = df[(df.T != 0).any()]
     return df
@@ -273,14 +265,13 @@ def get_etf_price_deviation(fromdate: str, todate: str, ticker: str) -> DataFram
 
     """
 
-    isin = get_etx_isin(ticker)
-    df = 괴리율추이().fetch(fromdate, todate, isin)
-    df = df[["TRD_DD", "CLSPRC", "LST_NAV", "DIVRG_RT"]]
+    isin = get_etx_isin(ticker, "ETF")
+    df = 괴리율추이(columns=["TRD_DD", "CLSPRC", "LST_NAV", "DIVRG_RT"]).fetch(
+        fromdate, todate, isin
+    )
     df.columns = ["날짜", "종가", "NAV", "괴리율"]
     df = df.set_index("날짜")
-    df = df.replace(",", "", regex=True)
-
-    df = df.astype({"종가": np.uint32, "NAV": np.float64, "괴리율": np.float32})
+    df = parse_numeric(df, {"종가": np.uint32, "NAV": np.float64, "괴리율": np.float32})
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
 
@@ -305,13 +296,15 @@ def get_etf_tracking_error(fromdate: str, todate: str, ticker: str) -> DataFrame
             2020-01-08  7998.839844  1752.359985  0.320068
     """
 
-    isin = get_etx_isin(ticker)
-    df = 추적오차율추이().fetch(fromdate, todate, isin)
-    df = df[["TRD_DD", "LST_NAV", "OBJ_STKPRC_IDX", "TRACE_ERR_RT"]]
+    isin = get_etx_isin(ticker, "ETF")
+    df = 추적오차율추이(
+        columns=["TRD_DD", "LST_NAV", "OBJ_STKPRC_IDX", "TRACE_ERR_RT"]
+    ).fetch(fromdate, todate, isin)
     df.columns = ["날짜", "NAV", "지수", "추적오차율"]
     df = df.set_index("날짜")
-    df = df.replace(",", "", regex=True)
-    df = df.astype({"NAV": np.float64, "지수": np.float64, "추적오차율": np.float32})
+    df = parse_numeric(
+        df, {"NAV": np.float64, "지수": np.float64, "추적오차율": np.float32}
+    )
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
 
@@ -348,8 +341,8 @@ def get_trading_volume_and_value_by_investor(fromdate: str, todate: str) -> Data
         [["거래량", "거래대금"], ["매도", "매수", "순매수"]]
     )
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             ("거래량", "매도"): np.uint64,
             ("거래량", "매수"): np.uint64,
@@ -357,7 +350,7 @@ def get_trading_volume_and_value_by_investor(fromdate: str, todate: str) -> Data
             ("거래대금", "매도"): np.uint64,
             ("거래대금", "매수"): np.uint64,
             ("거래대금", "순매수"): np.int64,
-        }
+        },
     )
     return df
 
@@ -399,15 +392,15 @@ def get_trading_volume_and_value_by_date(
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "기관": np.int64,
             "기타법인": np.int64,
             "개인": np.int64,
             "외국인": np.int64,
             "전체": np.uint64,
-        }
+        },
     )
     return df.sort_index()
 
@@ -457,8 +450,8 @@ def get_indivisual_trading_volume_and_value_by_investor(
         [["거래량", "거래대금"], ["매도", "매수", "순매수"]]
     )
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             ("거래량", "매도"): np.uint64,
             ("거래량", "매수"): np.uint64,
@@ -466,7 +459,7 @@ def get_indivisual_trading_volume_and_value_by_investor(
             ("거래대금", "매도"): np.uint64,
             ("거래대금", "매수"): np.uint64,
             ("거래대금", "순매수"): np.int64,
-        }
+        },
     )
     return df
 
@@ -516,15 +509,15 @@ def get_indivisual_trading_volume_and_value_by_date(
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
 
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "기관": np.int64,
             "기타법인": np.int64,
             "개인": np.int64,
             "외국인": np.int64,
             "전체": np.uint64,
-        }
+        },
     )
     return df.sort_index()
 
@@ -1 +1,8 @@
 from .wrap import *
+
+__all__ = [
+    "파생상품검색",
+    "get_future_ticker_and_name",
+    "get_future_ticker_list",
+    "get_future_ohlcv_by_ticker",
+]
@@ -86,7 +86,7 @@ class 전종목기본정보(KrxWebIo):
             result = self.read(prodId=prodId, subProdId=subProdId, csvslx_isNo=False)
         else:
             result = self.read(prodId=prodId, csvslx_isNo=False)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전종목시세(KrxWebIo):
@@ -121,7 +121,7 @@ class 전종목시세(KrxWebIo):
                     12  KR4401S9VCS2   401S9VCS  코스피200 SP 2209-2412 (주간)          -          0             -          -         -         -   312.92     0.00          0                   0              -         FU
         """  # pylint: disable=line-too-long # noqa: E501
         result = self.read(trdDd=trdDd, prodId=prodId, mktTpCd="T", rghtTpCd="T")
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 if __name__ == "__main__":
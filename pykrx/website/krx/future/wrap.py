@@ -2,6 +2,7 @@ import numpy as np
 from pandas import DataFrame
 
 from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.krx.decode import parse_numeric
 from pykrx.website.krx.future.core import 전종목시세, 파생상품검색
 
 
@@ -40,9 +41,8 @@ def get_future_ohlcv_by_ticker(date: str, prod: str) -> DataFrame:
         401S9V6S  코스피200 SP 2209-2406 (주간)    0.00  0.00    0.00    0.00    0.00    0.00       0               0
         401S9VCS  코스피200 SP 2209-2412 (주간)    0.00  0.00    0.00    0.00    0.00    0.00       0               0
     """  # pylint: disable=line-too-long # noqa: E501
-    df = 전종목시세().fetch(date, prod)
-    df = df[
-        [
+    df = 전종목시세(
+        columns=[
             "ISU_SRT_CD",
             "ISU_NM",
             "TDD_CLSPRC",
@@ -54,7 +54,7 @@ def get_future_ohlcv_by_ticker(date: str, prod: str) -> DataFrame:
             "ACC_TRDVOL",
             "ACC_TRDVAL",
         ]
-    ]
+    ).fetch(date, prod)
     df.columns = [
         "종목코드",
         "종목명",
@@ -68,11 +68,15 @@ def get_future_ohlcv_by_ticker(date: str, prod: str) -> DataFrame:
         "거래대금",
     ]
     df = df.set_index("종목코드")
+    df["종목명"] = (
+        df["종목명"]
+        .replace(r"\-$", "0", regex=True)
+        .replace("", "0")
+        .replace(",", "", regex=True)
+    )
 
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "종가": np.float64,
             "대비": np.float64,
@@ -82,7 +86,7 @@ def get_future_ohlcv_by_ticker(date: str, prod: str) -> DataFrame:
             "현물가": np.float64,
             "거래량": np.int32,
             "거래대금": np.int64,
-        }
+        },
     )
     return df
 
@@ -48,7 +48,7 @@ class 전종목_시세_검색(KrxWebIo):
             money=money,
             csvxls_isNo=csvxls_isNo,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 개별종목_시세_추이(KrxWebIo):
@@ -77,7 +77,7 @@ class 개별종목_시세_추이(KrxWebIo):
             money="1",
             csvxls_isNo=False,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전종목_기본정보(KrxWebIo):
@@ -94,7 +94,7 @@ class 전종목_기본정보(KrxWebIo):
             DataFrame: 금 전종목 기본정보를 반환합니다.
         """
         result = self.read()
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 개별종목_종합정보(KrxWebIo):
@@ -123,7 +123,7 @@ class 개별종목_종합정보(KrxWebIo):
             isuCd=isuCd,
             csvxls_isNo=False,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 일자별시세(KrxWebIo):
@@ -149,7 +149,7 @@ class 일자별시세(KrxWebIo):
             isuCd=isuCd,
             csvxls_isNo=False,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 투자자별_거래실적(KrxWebIo):
@@ -197,7 +197,7 @@ class 투자자별_거래실적(KrxWebIo):
             csvxls_isNo=csvxls_isNo,
         )
 
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 협의대량거래실적_추이(KrxWebIo):
@@ -233,7 +233,7 @@ class 협의대량거래실적_추이(KrxWebIo):
             share=share,
             csvxls_isNo=csvxls_isNo,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 국제금시세_동향(KrxWebIo):
@@ -263,7 +263,7 @@ class 국제금시세_동향(KrxWebIo):
             share=share,
             csvxls_isNo=csvxls_isNo,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
-import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
+from pykrx.website.comm.cache import get_cache, make_cache_key
+from pykrx.website.comm.singleflight import SingleFlight
 from pykrx.website.comm.webio import Get, Post
+from pykrx.website.krx.decode import build_frame
 
 
 class KrxFutureIo(Get):
@@ -21,42 +24,91 @@ class KrxFutureIo(Get):
         return NotImplementedError
 
 
+_inflight = SingleFlight()
+
+
 class KrxWebIo(Post):
+    # 730일 단위로 분할된 기간 조회를 동시에 요청할 최대 스레드 수
+    max_workers = 4
+
+    def __init__(self, columns: list | None = None, headers=None):
+        """
+        Args:
+            columns (list, optional): fetch 결과에 포함할 컬럼 목록. None이면
+                                      응답의 전체 컬럼을 반환한다.
+        """
+        super().__init__(headers)
+        self.columns = columns
+
+    def decode(self, records: list) -> pd.DataFrame:
+        """응답 레코드를 DataFrame으로 변환 (columns 지정 시 해당 컬럼만)"""
+        return build_frame(records, self.columns)
+
     def read(self, **params):
         params.update(bld=self.bld)
         if "strtDd" in params and "endDd" in params:
-            dt_s = pd.to_datetime(params["strtDd"])
-            dt_e = pd.to_datetime(params["endDd"])
-            delta = pd.to_timedelta("730 days")
-
-            result = None
-            while dt_s + delta < dt_e:
-                dt_tmp = dt_s + delta
-                params["strtDd"] = dt_s.strftime("%Y%m%d")
-                params["endDd"] = dt_tmp.strftime("%Y%m%d")
-                dt_s += delta + pd.to_timedelta("1 days")
-                resp = super().read(**params)
-                if result is None:
-                    result = resp.json()
-                else:
-                    result["output"] += resp.json()["output"]
-
-                # 초당 2년 데이터 조회
-                time.sleep(1)
-
-            if dt_s <= dt_e:
-                params["strtDd"] = dt_s.strftime("%Y%m%d")
-                params["endDd"] = dt_e.strftime("%Y%m%d")
-                resp = super().read(**params)
-
-                if result is not None:
-                    result["output"] += resp.json()["output"]
-                else:
-                    result = resp.json()
+            windows = self._split_period(params["strtDd"], params["endDd"])
+            if not windows:
+                return None
+
+            if len(windows) == 1:
+                params.update(strtDd=windows[0][0], endDd=windows[0][1])
+                return self._read_json(params)
+
+            # 구간 요청 간격은 webio의 host 별 TokenBucket이 조절한다.
+            def _read_window(window):
+                return self._read_json(
+                    {**params, "strtDd": window[0], "endDd": window[1]}
+                )
+
+            workers = min(self.max_workers, len(windows))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_read_window, windows))
+
+            # 기간 순서대로 결과를 이어 붙인다.
+            result = dict(results[0])
+            result["output"] = [row for data in results for row in data["output"]]
             return result
         else:
-            resp = super().read(**params)
-            return resp.json()
+            return self._read_json(params)
+
+    @staticmethod
+    def _split_period(strtDd: str, endDd: str) -> list:
+        """조회 기간을 KRX가 허용하는 730일 단위 구간으로 분할
+
+        Returns:
+            list: [(strtDd, endDd), ...]
+        """
+        dt_s = pd.to_datetime(strtDd)
+        dt_e = pd.to_datetime(endDd)
+        delta = pd.to_timedelta("730 days")
+
+        windows = []
+        while dt_s + delta < dt_e:
+            windows.append((dt_s.strftime("%Y%m%d"), (dt_s + delta).strftime("%Y%m%d")))
+            dt_s += delta + pd.to_timedelta("1 days")
+        if dt_s <= dt_e:
+            windows.append((dt_s.strftime("%Y%m%d"), dt_e.strftime("%Y%m%d")))
+        return windows
+
+    def _read_json(self, params: dict) -> dict:
+        """캐시를 거쳐 단일 요청의 JSON 응답을 읽는다."""
+        cache = get_cache()
+        if cache is not None:
+            data = cache.get(self.bld, params)
+            if data is not None:
+                return data
+
+        read = super().read
+
+        def _fetch():
+            data = read(**params).json()
+            if cache is not None:
+                cache.set(self.bld, params, data)
+            return data
+
+        # 동시에 들어온 동일한 요청은 하나의 POST 결과를 공유한다.
+        return _inflight.do(make_cache_key(self.bld, params), _fetch)
 
     @property
     def url(self):
@@ -1,2 +1,77 @@
 from .ticker import *
 from .wrap import *
+
+__all__ = [
+    "전종목시세",
+    "상장종목검색",
+    "상폐종목검색",
+    "전체지수기본정보",
+    "StockTicker",
+    "get_stock_name",
+    "get_stock_ticker_isin",
+    "get_stock_ticekr_market",
+    "IndexTicker",
+    "PER_PBR_배당수익률_개별",
+    "PER_PBR_배당수익률_개별지수",
+    "PER_PBR_배당수익률_전종목",
+    "PER_PBR_배당수익률_전지수",
+    "개별종목_공매도_거래_개별추이",
+    "개별종목_공매도_거래_전종목",
+    "개별종목_공매도_잔고",
+    "개별종목_공매도_종합정보",
+    "개별종목시세",
+    "개별지수시세",
+    "공매도_거래상위_50종목",
+    "공매도_잔고상위_50종목",
+    "기업주요변동사항",
+    "업종분류현황",
+    "외국인보유량_개별추이",
+    "외국인보유량_전종목",
+    "전종목_공매도_잔고",
+    "전종목기본정보",
+    "전종목등락률",
+    "전체지수등락률",
+    "전체지수시세",
+    "지수구성종목",
+    "투자자별_거래실적_개별종목_기간합계",
+    "투자자별_거래실적_개별종목_일별추이_상세",
+    "투자자별_거래실적_개별종목_일별추이_일반",
+    "투자자별_거래실적_전체시장_기간합계",
+    "투자자별_거래실적_전체시장_일별추이_상세",
+    "투자자별_거래실적_전체시장_일별추이_일반",
+    "투자자별_공매도_거래",
+    "투자자별_순매수상위종목",
+    "get_market_ohlcv_by_date",
+    "get_market_ohlcv_by_ticker",
+    "get_market_cap_by_date",
+    "get_market_cap_by_ticker",
+    "get_market_fundamental_by_ticker",
+    "get_market_fundamental_by_date",
+    "get_market_ticker_and_name",
+    "get_market_price_change_by_ticker",
+    "get_exhaustion_rates_of_foreign_investment_by_date",
+    "get_exhaustion_rates_of_foreign_investment_by_ticker",
+    "get_market_trading_value_and_volume_on_ticker_by_investor",
+    "get_market_trading_value_and_volume_on_market_by_investor",
+    "get_market_trading_value_and_volume_on_market_by_date",
+    "get_market_trading_value_and_volume_on_ticker_by_date",
+    "get_market_net_purchases_of_equities_by_ticker",
+    "get_market_sector_classifications",
+    "get_index_ohlcv_by_date",
+    "get_index_ohlcv_by_ticker",
+    "get_index_listing_date",
+    "get_index_price_change_by_ticker",
+    "get_index_fundamental_by_ticker",
+    "get_index_fundamental_by_date",
+    "get_index_portfolio_deposit_file",
+    "get_shorting_status_by_date",
+    "get_shorting_trading_value_and_volume_by_date",
+    "get_shorting_trading_value_and_volume_by_ticker",
+    "get_shorting_investor_by_date",
+    "get_shorting_volume_top50",
+    "get_shorting_balance_top50",
+    "get_shorting_balance_by_ticker",
+    "get_shorting_balance_by_date",
+    "get_stock_major_changes",
+    "get_market_ohlcv_by_market",
+]
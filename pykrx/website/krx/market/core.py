@@ -37,7 +37,7 @@ class 상장종목검색(KrxWebIo):
         result = self.read(
             locale="ko_KR", mktsel=mktsel, searchText=searchText, typeNo=0
         )
-        return DataFrame(result["block1"])
+        return self.decode(result["block1"])
 
 
 class 상폐종목검색(KrxWebIo):
@@ -72,7 +72,7 @@ class 상폐종목검색(KrxWebIo):
                   코스닥        16
         """
         result = self.read(mktsel=mktsel, searchText=searchText, typeNo=0)
-        return DataFrame(result["block1"])
+        return self.decode(result["block1"])
 
 
 class 개별종목시세(KrxWebIo):
@@ -113,7 +113,7 @@ class 개별종목시세(KrxWebIo):
                 543,250,212,050,000  5,969,782,550
         """
         result = self.read(isuCd=isuCd, strtDd=strtDd, endDd=endDd, adjStkPrc=adjStkPrc)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전종목시세(KrxWebIo):
@@ -153,7 +153,7 @@ class 전종목시세(KrxWebIo):
                 31,950    142,780,675   91,264,138,975   20,394,221    KSQ
         """
         result = self.read(mktId=mktId, trdDd=trdDd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class PER_PBR_배당수익률_전종목(KrxWebIo):
@@ -192,7 +192,7 @@ class PER_PBR_배당수익률_전종목(KrxWebIo):
                   7,468  3.43   50    0.20
         """
         result = self.read(mktId=mktId, trdDd=trdDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class PER_PBR_배당수익률_개별(KrxWebIo):
@@ -226,7 +226,7 @@ class PER_PBR_배당수익률_개별(KrxWebIo):
                 5,997  7.59  28,126  1.62  850    1.87
         """
         result = self.read(mktId=mktId, strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전종목등락률(KrxWebIo):
@@ -260,7 +260,7 @@ class 전종목등락률(KrxWebIo):
                  -15.11   7,459,926   41,447,809,620       2
         """
         result = self.read(mktId=mktId, adjStkPrc=adjStkPrc, strtDd=strtDd, endDd=endDd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 외국인보유량_전종목(KrxWebIo):
@@ -302,7 +302,7 @@ class 외국인보유량_전종목(KrxWebIo):
                               10.80
         """
         result = self.read(searchType=1, mktId=mktId, trdDd=trdDd, isuLmtRto=isuLmtRto)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 외국인보유량_개별추이(KrxWebIo):
@@ -342,7 +342,7 @@ class 외국인보유량_개별추이(KrxWebIo):
                              55.68
         """
         result = self.read(searchType=2, strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 투자자별_거래실적_전체시장_기간합계(KrxWebIo):
@@ -382,7 +382,7 @@ class 투자자별_거래실적_전체시장_기간합계(KrxWebIo):
         result = self.read(
             strtDd=strtDd, endDd=endDd, mktId=mktId, etf=etf, etn=etn, elw=els
         )
-        return DataFrame(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)
+        return self.decode(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)
 
 
 class 투자자별_거래실적_전체시장_일별추이_일반(KrxWebIo):
@@ -444,7 +444,7 @@ class 투자자별_거래실적_전체시장_일별추이_일반(KrxWebIo):
             trdVolVal=trdVolVal,
             askBid=askBid,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 투자자별_거래실적_전체시장_일별추이_상세(KrxWebIo):
@@ -513,7 +513,7 @@ class 투자자별_거래실적_전체시장_일별추이_상세(KrxWebIo):
             askBid=askBid,
             detailView=1,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 투자자별_거래실적_개별종목_기간합계(KrxWebIo):
@@ -548,7 +548,7 @@ class 투자자별_거래실적_개별종목_기간합계(KrxWebIo):
         result = self.read(
             strtDd=strtDd, endDd=endDd, isuCd=isuCd, inqTpCd=1, trdVolVal=1, askBid=1
         )
-        return DataFrame(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)
+        return self.decode(result["output"]).drop("CONV_OBJ_TP_CD", axis=1)
 
 
 class 투자자별_거래실적_개별종목_일별추이_일반(KrxWebIo):
@@ -592,7 +592,7 @@ class 투자자별_거래실적_개별종목_일별추이_일반(KrxWebIo):
             trdVolVal=trdVolVal,
             askBid=askBid,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 투자자별_거래실적_개별종목_일별추이_상세(KrxWebIo):
@@ -647,7 +647,7 @@ class 투자자별_거래실적_개별종목_일별추이_상세(KrxWebIo):
             askBid=askBid,
             detailView=1,
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 투자자별_순매수상위종목(KrxWebIo):
@@ -698,7 +698,7 @@ class 투자자별_순매수상위종목(KrxWebIo):
                   110,663,211,500
         """
         result = self.read(strtDd=strtDd, endDd=endDd, mktId=mktId, invstTpCd=invstTpCd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전체지수기본정보(KrxWebIo):
@@ -734,7 +734,7 @@ class 전체지수기본정보(KrxWebIo):
                            100         5        042
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 주가지수검색(KrxWebIo):
@@ -766,7 +766,7 @@ class 주가지수검색(KrxWebIo):
                 marketName : ['KRX' 'KOSPI' 'KOSDAQ' '테마']
         """
         result = self.read(mktsel=market)
-        return DataFrame(result["block1"])
+        return self.decode(result["block1"])
 
 
 class 개별지수시세(KrxWebIo):
@@ -811,7 +811,7 @@ class 개별지수시세(KrxWebIo):
         result = self.read(
             indIdx2=ticker, indIdx=group_id, strtDd=fromdate, endDd=todate
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전체지수시세(KrxWebIo):
@@ -880,7 +880,7 @@ class 전체지수시세(KrxWebIo):
                     5,768,837,287,881  1,453,136,066,992,400
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd, trdDd=trdDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 전체지수등락률(KrxWebIo):
@@ -917,7 +917,7 @@ class 전체지수등락률(KrxWebIo):
                             251.38   12.28    288,959,592   29,886,192,965,797
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd, strtDd=strtDd, endDd=endDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class PER_PBR_배당수익률_전지수(KrxWebIo):
@@ -953,7 +953,7 @@ class PER_PBR_배당수익률_전지수(KrxWebIo):
                       -                  2.59   0.61
         """
         result = self.read(idxIndMidclssCd=idxIndMidclssCd, trdDd=trdDd)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class PER_PBR_배당수익률_개별지수(KrxWebIo):
@@ -992,7 +992,7 @@ class PER_PBR_배당수익률_개별지수(KrxWebIo):
         result = self.read(
             indTpCd=indTpCd, indTpCd2=indTpCd2, strtDd=strtDd, endDd=endDd
         )
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 지수구성종목(KrxWebIo):
@@ -1027,7 +1027,7 @@ class 지수구성종목(KrxWebIo):
                         1.60   57,327,924,855,000
         """
         result = self.read(indIdx2=ticker, indIdx=group_id, trdDd=date)
-        return DataFrame(result["output"])
+        return self.decode(result["output"])
 
 
 class 업종분류현황(KrxWebIo):
@@ -1050,7 +1050,7 @@ class 업종분류현황(KrxWebIo):
         937     000545      흥국화재우     KOSPI         보험       7,000           -30   -0.43      5,376,000,000          2
         938     003280        흥아해운     KOSPI      운수창고업    1,660            -5   -0.30    399,105,332,340          2
         """
-        return DataFrame(self.read(trdDd=trdDd, mktId=mktId)["block1"])
+        return self.decode(self.read(trdDd=trdDd, mktId=mktId)["block1"])
 
 
 # -----------------------------------------------------------------------------
@@ -1089,7 +1089,7 @@ class 개별종목_공매도_종합정보(KrxWebIo):
                     286,846,560,000
         """
         result = self.read(isuCd=isuCd, strtDd=strtDd, endDd=endDd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 개별종목_공매도_거래_전종목(KrxWebIo):
@@ -1132,7 +1132,7 @@ class 개별종목_공매도_거래_전종목(KrxWebIo):
                          0.16       10,635,610   6,658,032,800      0.16
         """
         result = self.read(trdDd=trdDd, mktId=mktId, inqCond="".join(secugrpId))
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 개별종목_공매도_거래_개별추이(KrxWebIo):
@@ -1170,7 +1170,7 @@ class 개별종목_공매도_거래_개별추이(KrxWebIo):
         """
 
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 투자자별_공매도_거래(KrxWebIo):
@@ -1228,7 +1228,7 @@ class 투자자별_공매도_거래(KrxWebIo):
         result = self.read(
             strtDd=strtDd, endDd=endDd, inqCondTpCd=inqCondTpCd, mktTpCd=mktTpCd
         )
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 공매도_거래상위_50종목(KrxWebIo):
@@ -1271,7 +1271,7 @@ class 공매도_거래상위_50종목(KrxWebIo):
                                       0.51                        4.91  -2.37
         """
         result = self.read(trdDd=trdDd, mktTpCd=mktTpCd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 공매도_잔고상위_50종목(KrxWebIo):
@@ -1314,7 +1314,7 @@ class 공매도_잔고상위_50종목(KrxWebIo):
                             2.74
         """
         result = self.read(trdDd=trdDd, mktTpCd=mktTpCd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 전종목_공매도_잔고(KrxWebIo):
@@ -1350,7 +1350,7 @@ class 전종목_공매도_잔고(KrxWebIo):
                     3,340,271,200  1,825,237,377,600    0.18
         """
         result = self.read(trdDd=trdDd, mktTpCd=mktTpCd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 개별종목_공매도_잔고(KrxWebIo):
@@ -1388,7 +1388,7 @@ class 개별종목_공매도_잔고(KrxWebIo):
                         331,322,931,525,000    0.09
         """
         result = self.read(strtDd=strtDd, endDd=endDd, isuCd=isuCd)
-        return DataFrame(result["OutBlock_1"])
+        return self.decode(result["OutBlock_1"])
 
 
 class 기업주요변동사항(KrxWebIo):
@@ -1416,7 +1416,7 @@ class 기업주요변동사항(KrxWebIo):
                 4  2000/01/20
         """
         result = self.read(isuCd=isuCd)
-        return DataFrame(result["block1"])
+        return self.decode(result["block1"])
 
 
 class 전종목기본정보(KrxWebIo):
@@ -1453,11 +1453,11 @@ class 전종목기본정보(KrxWebIo):
         """
         if mktId == "KSQ":
             result = self.read(mktId=mktId, segTpCd=segTpCd)
-            return DataFrame(result["OutBlock_1"])
+            return self.decode(result["OutBlock_1"])
 
         else:
             result = self.read(mktId=mktId)
-            return DataFrame(result["OutBlock_1"])
+            return self.decode(result["OutBlock_1"])
 
 
 if __name__ == "__main__":
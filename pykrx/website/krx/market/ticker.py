@@ -1,28 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
 from pykrx.website.comm import dataframe_empty_handler, singleton
+from pykrx.website.krx.krxio import KrxWebIo
 from pykrx.website.krx.market.core import 상장종목검색, 상폐종목검색, 전체지수기본정보
+from pykrx.website.krx.master import load_master
 
 
 @singleton
 class StockTicker:
+    # 조회 필드 -> 인덱스 배열의 컬럼 번호
+    FIELDS = {"종목": 0, "ISIN": 1, "시장": 2}
+
     def __init__(self):
-        self.listed = self.__fetch(상장종목검색)
-        self.delisted = self.__fetch(상폐종목검색)
+        self.listed = load_master(
+            "stock_listed",
+            lambda: self.__fetch(상장종목검색),
+            self.__refreshed("listed"),
+        )
+        self.delisted = load_master(
+            "stock_delisted",
+            lambda: self.__fetch(상폐종목검색),
+            self.__refreshed("delisted"),
+        )
+        self.__build_index()
+
+    def __refreshed(self, attr):
+        # 백그라운드에서 갱신된 마스터로 교체한다.
+        def _update(df):
+            setattr(self, attr, df)
+            self.__build_index()
+
+        return _update
 
     @dataframe_empty_handler
     def __fetch(self, what, market="전체"):
         market_dict = {"코스피": "STK", "코스닥": "KSQ", "코넥스": "KNX", "전체": "ALL"}
         market = market_dict.get(market, "ALL")
-        df = what().fetch(market)
-        df = df[["short_code", "codeName", "full_code", "marketName"]]
+        df = what(columns=["short_code", "codeName", "full_code", "marketName"]).fetch(
+            market
+        )
         df = df.replace("유가증권", "코스피")
         df.columns = ["티커", "종목", "ISIN", "시장"]
         df["시장"] = df["시장"].apply(lambda x: market_dict[x])
         df = df.set_index("티커")
         return df
 
+    def __build_index(self):
+        """티커 -> (종목, ISIN, 시장) 조회용 인덱스를 한 번만 만든다.
+
+        상장 종목을 우선하며, 상장폐지 종목에 같은 티커가 여러 개 있으면
+        ISIN 순으로 첫 번째 종목을 사용한다.
+            030270 에스마크	KR7030270003
+            030270 가희 11R	KRA030270151
+        """
+        frames = [
+            df.sort_values("ISIN", kind="stable")
+            for df in (self.listed, self.delisted)
+            if isinstance(df, DataFrame) and not df.empty
+        ]
+        if frames:
+            df = pd.concat(frames)
+            df = df[~df.index.duplicated(keep="first")]
+            values = df[list(self.FIELDS)].to_numpy(dtype=object)
+            position = dict(zip(df.index, range(len(df)), strict=True))
+        else:
+            values = np.empty((0, len(self.FIELDS)), dtype=object)
+            position = {}
+        # 조회 중인 스레드가 서로 다른 버전을 보지 않도록 한 번에 교체한다.
+        self._index = (position, values)
+
     def get(self, ticker):
         """입력된 종목(ticker)의 정보를 Series로 반환
 
@@ -36,36 +86,61 @@ class StockTicker:
                 ISIN    KR7005930003
                 시장          코스피
         """
-
-        df = self.listed
-        if ticker not in df.index:
-            df = self.delisted
-            if ticker not in df.index:
-                return None
-            # 030270 에스마크	KR7030270003
-            # 030270 가희 11R	KRA030270151
-            elif isinstance(df.loc[ticker], DataFrame):
-                # ISIN을 기준으로 sorting 후 첫 번째 데이터를 선택
-                df = df.loc[ticker].sort_values("ISIN").iloc[:1]
-        return df.loc[ticker]
+        position, values = self._index
+        i = position.get(ticker)
+        if i is None:
+            return None
+        return pd.Series(values[i], index=list(self.FIELDS), name=ticker)
+
+    def lookup(self, ticker, field: str):
+        """티커의 field(종목/ISIN/시장) 값을 반환 (없으면 None)"""
+        position, values = self._index
+        i = position.get(ticker)
+        return None if i is None else values[i, self.FIELDS[field]]
+
+    def resolve(self, tickers, field: str) -> list:
+        """티커 리스트의 field(종목/ISIN/시장) 값을 한 번에 조회 (없는 티커는 None)
+
+        >> StockTicker().resolve(["005930", "000660"], "ISIN")
+        ['KR7005930003', 'KR7000660001']
+        """
+        position, values = self._index
+        if len(values) == 0:
+            # 마스터를 받지 못했으면 모든 티커가 없는 티커다.
+            return [None] * len(tickers)
+        rows = np.fromiter(
+            (position.get(t, -1) for t in tickers), dtype=np.int64, count=len(tickers)
+        )
+        values = values[rows, self.FIELDS[field]]
+        values[rows < 0] = None
+        return values.tolist()
+
+
+def _lookup(ticker, field):
+    if isinstance(ticker, (list, tuple, pd.Index, np.ndarray)):
+        return StockTicker().resolve(list(ticker), field)
+    value = StockTicker().lookup(ticker, field)
+    if value is None:
+        raise KeyError(ticker)
+    return value
 
 
 @dataframe_empty_handler
 def get_stock_name(ticker):
-    s = StockTicker().get(ticker)
-    return s["종목"]
+    """티커(또는 티커 리스트)의 종목명"""
+    return _lookup(ticker, "종목")
 
 
 @dataframe_empty_handler
 def get_stock_ticker_isin(ticker):
-    s = StockTicker().get(ticker)
-    return s["ISIN"]
+    """티커(또는 티커 리스트)의 ISIN"""
+    return _lookup(ticker, "ISIN")
 
 
 @dataframe_empty_handler
 def get_stock_ticekr_market(ticker):
-    s = StockTicker().get(ticker)
-    return s["시장"]
+    """티커(또는 티커 리스트)의 시장"""
+    return _lookup(ticker, "시장")
 
 
 # ----------------------------------------------------------------------------------------------------
@@ -75,31 +150,50 @@ def get_stock_ticekr_market(ticker):
 
 @singleton
 class IndexTicker:
+    # 지수 분류 코드 -> 시장
+    MARKETS = {"01": "KRX", "02": "KOSPI", "03": "KOSDAQ", "04": "테마"}
+
     def __init__(self):
-        self.df = self.__fetch()
+        self.df = load_master("index", self.__fetch, self.__refreshed)
+        self.__build_index()
+
+    def __refreshed(self, df):
+        self.df = df
+        self.__build_index()
+
+    def __build_index(self):
+        # 티커 -> 지수명/시장 사전 (갱신 중에도 일관된 쌍을 보도록 한 번에 교체)
+        if self.df.empty:
+            self._index = ({}, {})
+            return
+        self._index = (
+            dict(zip(self.df.index, self.df["지수명"], strict=True)),
+            dict(zip(self.df.index, self.df["시장"], strict=True)),
+        )
+
+    @staticmethod
+    def __fetch_market(market):
+        df = 전체지수기본정보(
+            columns=["IDX_IND_CD", "IDX_NM", "BAS_TM_CONTN", "IND_TP_CD"]
+        ).fetch(market)
+        df.columns = ["티커", "지수명", "기준일", "그룹"]
+        df["시장"] = IndexTicker.MARKETS[market]
+        # 다른 지수에 같은 티커가 존재함. 중복 문제를 피하기 위해 코스피
+        # 1xxx 코스닥 2xxx로 내부에서 사용함
+        #    full_code short_code    codeName marketCode marketName
+        # 29         1        001      코스피        STK      KOSPI
+        # 75         2        001      코스닥        KSQ     KOSDAQ
+        df["티커"] = df["그룹"] + df["티커"]
+        return df.set_index("티커")
 
     @dataframe_empty_handler
     def __fetch(self):
-        # - 01 : KRX
-        # - 02 : KOSPI
-        # - 03 : KOSDAQ
-        # - 04 : 테마
-        data = []
-        for market in ["01", "02", "03", "04"]:
-            df = 전체지수기본정보().fetch(market)
-            df = df[["IDX_IND_CD", "IDX_NM", "BAS_TM_CONTN", "IND_TP_CD"]]
-            df.columns = ["티커", "지수명", "기준일", "그룹"]
-
-            code2market = {"01": "KRX", "02": "KOSPI", "03": "KOSDAQ", "04": "테마"}
-            df["시장"] = code2market[market]
-            # 다른 지수에 같은 티커가 존재함. 중복 문제를 피하기 위해 코스피
-            # 1xxx 코스닥 2xxx로 내부에서 사용함
-            #    full_code short_code    codeName marketCode marketName
-            # 29         1        001      코스피        STK      KOSPI
-            # 75         2        001      코스닥        KSQ     KOSDAQ
-            df["티커"] = df["그룹"] + df["티커"]
-            data.append(df.set_index("티커"))
-
+        # 네 분류(KRX/KOSPI/KOSDAQ/테마)를 동시에 요청한다. 요청 간격은 webio의
+        # host 별 TokenBucket이 조절한다.
+        markets = list(self.MARKETS)
+        workers = max(1, min(KrxWebIo.max_workers, len(markets)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            data = list(executor.map(self.__fetch_market, markets))
         return pd.concat(data).sort_index(ascending=True)
 
     def get_ticker(self, market, date):
@@ -107,10 +201,10 @@ class IndexTicker:
         return self.df[cond].index.tolist()
 
     def get_name(self, ticker):
-        return self.df.loc[ticker, "지수명"]
+        return self._index[0][ticker]
 
     def get_market(self, ticker):
-        return self.df.loc[ticker].index["시장"]
+        return self._index[1][ticker]
 
 
 if __name__ == "__main__":
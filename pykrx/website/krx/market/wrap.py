@@ -3,6 +3,7 @@ import pandas as pd
 from pandas import DataFrame, Series
 
 from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.krx.decode import parse_numeric
 from pykrx.website.krx.market.core import (
     PER_PBR_배당수익률_개별,
     PER_PBR_배당수익률_개별지수,
@@ -69,10 +70,8 @@ def get_market_ohlcv_by_date(
 
     isin = get_stock_ticker_isin(ticker)
     adjusted = 2 if adjusted else 1
-    df = 개별종목시세().fetch(fromdate, todate, isin, adjusted)
-
-    df = df[
-        [
+    df = 개별종목시세(
+        columns=[
             "TRD_DD",
             "TDD_OPNPRC",
             "TDD_HGPRC",
@@ -82,7 +81,7 @@ def get_market_ohlcv_by_date(
             "ACC_TRDVAL",
             "FLUC_RT",
         ]
-    ]
+    ).fetch(fromdate, todate, isin, adjusted)
     df.columns = [
         "날짜",
         "시가",
@@ -95,10 +94,8 @@ def get_market_ohlcv_by_date(
     ]
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "시가": np.int32,
             "고가": np.int32,
@@ -107,7 +104,7 @@ def get_market_ohlcv_by_date(
             "거래량": np.int32,
             "거래대금": np.int64,
             "등락률": np.float32,
-        }
+        },
     )
     return df.sort_index()
 
@@ -133,9 +130,8 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
 
     market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
 
-    df = 전종목시세().fetch(date, market2mktid[market])
-    df = df[
-        [
+    df = 전종목시세(
+        columns=[
             "ISU_SRT_CD",
             "TDD_OPNPRC",
             "TDD_HGPRC",
@@ -146,7 +142,7 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             "FLUC_RT",
             "MKTCAP",
         ]
-    ]
+    ).fetch(date, market2mktid[market])
     df.columns = [
         "티커",
         "시가",
@@ -158,11 +154,9 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
         "등락률",
         "시가총액",
     ]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
     df = df.set_index("티커")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "시가": np.int32,
             "고가": np.int32,
@@ -172,7 +166,7 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             "거래대금": np.int64,
             "등락률": np.float32,
             "시가총액": np.int64,
-        }
+        },
     )
     return df
 
@@ -201,15 +195,14 @@ def get_market_cap_by_date(
 
     isin = get_stock_ticker_isin(ticker)
     adjusted = 2 if adjusted else 1
-    df = 개별종목시세().fetch(fromdate, todate, isin, adjusted)
-    df = df[["TRD_DD", "MKTCAP", "ACC_TRDVOL", "ACC_TRDVAL", "LIST_SHRS"]]
+    df = 개별종목시세(
+        columns=["TRD_DD", "MKTCAP", "ACC_TRDVOL", "ACC_TRDVAL", "LIST_SHRS"]
+    ).fetch(fromdate, todate, isin, adjusted)
     df.columns = ["날짜", "시가총액", "거래량", "거래대금", "상장주식수"]
 
-    df = df.replace("/", "", regex=True)
-    df = df.replace(",", "", regex=True)
     df = df.set_index("날짜")
-    df = df.astype(np.int64)
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df = parse_numeric(df, np.int64)
+    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
 
 
@@ -238,16 +231,20 @@ def get_market_cap_by_ticker(
 
     market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
 
-    df = 전종목시세().fetch(date, market2mktid[market])
-    df = df[
-        ["ISU_SRT_CD", "TDD_CLSPRC", "MKTCAP", "ACC_TRDVOL", "ACC_TRDVAL", "LIST_SHRS"]
-    ]
+    df = 전종목시세(
+        columns=[
+            "ISU_SRT_CD",
+            "TDD_CLSPRC",
+            "MKTCAP",
+            "ACC_TRDVOL",
+            "ACC_TRDVAL",
+            "LIST_SHRS",
+        ]
+    ).fetch(date, market2mktid[market])
     df.columns = ["티커", "종가", "시가총액", "거래량", "거래대금", "상장주식수"]
 
     df = df.set_index("티커")
-    df = df.replace(r"\W", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(np.int64)
+    df = parse_numeric(df, np.int64)
     return df.sort_values("시가총액", ascending=ascending)
 
 
@@ -271,16 +268,14 @@ def get_market_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFr
     """
 
     market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
-    df = PER_PBR_배당수익률_전종목().fetch(date, market2mktid[market])
-
-    df = df[["ISU_SRT_CD", "BPS", "PER", "PBR", "EPS", "DVD_YLD", "DPS"]]
+    df = PER_PBR_배당수익률_전종목(
+        columns=["ISU_SRT_CD", "BPS", "PER", "PBR", "EPS", "DVD_YLD", "DPS"]
+    ).fetch(date, market2mktid[market])
     df.columns = ["티커", "BPS", "PER", "PBR", "EPS", "DIV", "DPS"]
     df.set_index("티커", inplace=True)
 
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "BPS": np.int32,
             "PER": np.float64,
@@ -288,7 +283,7 @@ def get_market_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFr
             "EPS": np.int32,
             "DIV": np.float64,
             "DPS": np.int32,
-        }
+        },
     )
     return df
 
@@ -318,16 +313,13 @@ def get_market_fundamental_by_date(
     isin = get_stock_ticker_isin(ticker)
     # market = get_stock_ticekr_market(ticker)
 
-    df = PER_PBR_배당수익률_개별().fetch(fromdate, todate, "ALL", isin)
-
-    df = df[["TRD_DD", "BPS", "PER", "PBR", "EPS", "DVD_YLD", "DPS"]]
+    df = PER_PBR_배당수익률_개별(
+        columns=["TRD_DD", "BPS", "PER", "PBR", "EPS", "DVD_YLD", "DPS"]
+    ).fetch(fromdate, todate, "ALL", isin)
     df.columns = ["날짜", "BPS", "PER", "PBR", "EPS", "DIV", "DPS"]
 
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("/", "", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "BPS": np.int32,
             "PER": np.float64,
@@ -338,7 +330,7 @@ def get_market_fundamental_by_date(
         },
     )
     df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
 
 
@@ -364,8 +356,9 @@ def get_market_ticker_and_name(date: str, market: str = "KOSPI") -> Series:
 
     market2code = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
 
-    df = 전종목시세().fetch(date, market2code[market])
-    df = df[["ISU_SRT_CD", "ISU_ABBRV"]]
+    df = 전종목시세(columns=["ISU_SRT_CD", "ISU_ABBRV"]).fetch(
+        date, market2code[market]
+    )
     df.columns = ["티커", "종목명"]
     df = df.set_index("티커")
     return df["종목명"]
@@ -390,9 +383,8 @@ def get_market_price_change_by_ticker(
 
     adjusted = 2 if adjusted else 1
 
-    df = 전종목등락률().fetch(fromdate, todate, market2mktid[market], adjusted)
-    df = df[
-        [
+    df = 전종목등락률(
+        columns=[
             "ISU_ABBRV",
             "ISU_SRT_CD",
             "BAS_PRC",
@@ -402,7 +394,7 @@ def get_market_price_change_by_ticker(
             "ACC_TRDVOL",
             "ACC_TRDVAL",
         ]
-    ]
+    ).fetch(fromdate, todate, market2mktid[market], adjusted)
     df.columns = [
         "종목명",
         "티커",
@@ -414,11 +406,15 @@ def get_market_price_change_by_ticker(
         "거래대금",
     ]
     df = df.set_index("티커")
+    df["종목명"] = (
+        df["종목명"]
+        .replace(r"[^-.\w]", "", regex=True)
+        .replace(r"\-$", "", regex=True)
+        .replace("", "0")
+    )
 
-    df = df.replace(r"[^-.\w]", "", regex=True)
-    df = df.replace(r"\-$", "", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "시가": np.int32,
             "종가": np.int32,
@@ -426,7 +422,7 @@ def get_market_price_change_by_ticker(
             "등락률": np.float64,
             "거래량": np.int64,
             "거래대금": np.int64,
-        }
+        },
     )
     return df
 
@@ -454,10 +450,8 @@ def get_exhaustion_rates_of_foreign_investment_by_date(
 
     isin = get_stock_ticker_isin(ticker)
 
-    df = 외국인보유량_개별추이().fetch(fromdate, todate, isin)
-
-    df = df[
-        [
+    df = 외국인보유량_개별추이(
+        columns=[
             "TRD_DD",
             "LIST_SHRS",
             "FORN_HD_QTY",
@@ -465,23 +459,21 @@ def get_exhaustion_rates_of_foreign_investment_by_date(
             "FORN_ORD_LMT_QTY",
             "FORN_LMT_EXHST_RT",
         ]
-    ]
+    ).fetch(fromdate, todate, isin)
     df.columns = ["날짜", "상장주식수", "보유수량", "지분율", "한도수량", "한도소진률"]
 
-    df = df.replace("/", "", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "상장주식수": np.int64,
             "보유수량": np.int64,
             "지분율": np.float16,
             "한도수량": np.int64,
             "한도소진률": np.float16,
-        }
+        },
     )
     df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
 
 
@@ -511,10 +503,8 @@ def get_exhaustion_rates_of_foreign_investment_by_ticker(
     market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
 
     balance_limit = 1 if balance_limit else 0
-    df = 외국인보유량_전종목().fetch(date, market2mktid[market], balance_limit)
-
-    df = df[
-        [
+    df = 외국인보유량_전종목(
+        columns=[
             "ISU_SRT_CD",
             "LIST_SHRS",
             "FORN_HD_QTY",
@@ -522,18 +512,17 @@ def get_exhaustion_rates_of_foreign_investment_by_ticker(
             "FORN_ORD_LMT_QTY",
             "FORN_LMT_EXHST_RT",
         ]
-    ]
+    ).fetch(date, market2mktid[market], balance_limit)
     df.columns = ["티커", "상장주식수", "보유수량", "지분율", "한도수량", "한도소진률"]
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "상장주식수": np.int64,
             "보유수량": np.int64,
             "지분율": np.float16,
             "한도수량": np.int64,
             "한도소진률": np.float16,
-        }
+        },
     )
     df = df.set_index("티커")
     return df.sort_index()
@@ -581,9 +570,7 @@ def get_market_trading_value_and_volume_on_ticker_by_investor(
     df.columns = pd.MultiIndex.from_product(
         [["거래량", "거래대금"], ["매도", "매수", "순매수"]]
     )
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    return df.astype(np.int64)
+    return parse_numeric(df, np.int64)
 
 
 @dataframe_empty_handler
@@ -656,9 +643,7 @@ def get_market_trading_value_and_volume_on_market_by_investor(
     df.columns = pd.MultiIndex.from_product(
         [["거래량", "거래대금"], ["매도", "매수", "순매수"]]
     )
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    return df.astype(np.int64)
+    return parse_numeric(df, np.int64)
 
 
 @dataframe_empty_handler
@@ -729,9 +714,7 @@ def get_market_trading_value_and_volume_on_market_by_date(
 
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(np.int64)
+    df = parse_numeric(df, np.int64)
     return df.sort_index()
 
 
@@ -794,9 +777,7 @@ def get_market_trading_value_and_volume_on_ticker_by_date(
 
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.replace(r"[^-\w]", "", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(np.int64)
+    df = parse_numeric(df, np.int64)
     return df.sort_index()
 
 
@@ -868,9 +849,9 @@ def get_market_net_purchases_of_equities_by_ticker(
         "매수거래대금",
         "순매수거래대금",
     ]
-    df = df.replace("/", "", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    df["종목명"] = df["종목명"].replace(r"[/,]", "", regex=True)
+    df = parse_numeric(
+        df,
         {
             "티커": str,
             "종목명": str,
@@ -880,7 +861,7 @@ def get_market_net_purchases_of_equities_by_ticker(
             "매수거래대금": np.int64,
             "매도거래대금": np.int64,
             "순매수거래대금": np.int64,
-        }
+        },
     )
     df["티커"] = df["티커"].apply(lambda x: x.zfill(6))
     return df.set_index("티커")
@@ -911,10 +892,8 @@ def get_market_sector_classifications(date: str, market: str) -> DataFrame:
         "KOSPI": "STK",
         "KOSDAQ": "KSQ",
     }
-    df = 업종분류현황().fetch(date, market2mktid[market])
-
-    df = df[
-        [
+    df = 업종분류현황(
+        columns=[
             "ISU_SRT_CD",
             "ISU_ABBRV",
             "IDX_IND_NM",
@@ -923,18 +902,23 @@ def get_market_sector_classifications(date: str, market: str) -> DataFrame:
             "FLUC_RT",
             "MKTCAP",
         ]
-    ]
+    ).fetch(date, market2mktid[market])
     df.columns = ["종목코드", "종목명", "업종명", "종가", "대비", "등락률", "시가총액"]
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0", regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.astype(
+    names = ["종목명", "업종명"]
+    df[names] = (
+        df[names]
+        .replace(r"\-$", "0", regex=True)
+        .replace("", "0")
+        .replace(",", "", regex=True)
+    )
+    df = parse_numeric(
+        df,
         {
             "종가": np.int32,
             "대비": np.float64,
             "등락률": np.float64,
             "시가총액": np.int64,
-        }
+        },
     )
     return df.set_index("종목코드")
 
@@ -961,9 +945,8 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFram
             2019-04-08  755.320007  756.159973  750.020020  751.919983  762374091  4321665707119
     """  # pylint: disable=line-too-long # noqa: E501
 
-    df = 개별지수시세().fetch(ticker[1:], ticker[0], fromdate, todate)
-    df = df[
-        [
+    df = 개별지수시세(
+        columns=[
             "TRD_DD",
             "OPNPRC_IDX",
             "HGPRC_IDX",
@@ -973,7 +956,7 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFram
             "ACC_TRDVAL",
             "MKTCAP",
         ]
-    ]
+    ).fetch(ticker[1:], ticker[0], fromdate, todate)
     df.columns = [
         "날짜",
         "시가",
@@ -985,11 +968,9 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFram
         "상장시가총액",
     ]
 
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
     df = df.set_index("날짜")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "시가": np.float64,
             "고가": np.float64,
@@ -998,9 +979,9 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFram
             "거래량": np.int64,
             "거래대금": np.int64,
             "상장시가총액": np.int64,
-        }
+        },
     )
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
 
 
@@ -1027,9 +1008,8 @@ def get_index_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
     """  # pylint: disable=line-too-long # noqa: E501
 
     market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = 전체지수시세().fetch(date, market2idx[market])
-    df = df[
-        [
+    df = 전체지수시세(
+        columns=[
             "IDX_NM",
             "OPNPRC_IDX",
             "HGPRC_IDX",
@@ -1039,7 +1019,7 @@ def get_index_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             "ACC_TRDVAL",
             "MKTCAP",
         ]
-    ]
+    ).fetch(date, market2idx[market])
     df.columns = [
         "지수명",
         "시가",
@@ -1050,11 +1030,15 @@ def get_index_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
         "거래대금",
         "상장시가총액",
     ]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
+    df["지수명"] = (
+        df["지수명"]
+        .replace(r"[^-\w\.]", "", regex=True)
+        .replace(r"\-$", "0", regex=True)
+        .replace("", "0")
+    )
     df = df.set_index("지수명")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "시가": np.float64,
             "고가": np.float64,
@@ -1063,7 +1047,7 @@ def get_index_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             "거래량": np.int64,
             "거래대금": np.int64,
             "상장시가총액": np.int64,
-        }
+        },
     )
     return df
 
@@ -1087,15 +1071,18 @@ def get_index_listing_date(market: str = "KOSPI") -> DataFrame:
     """
 
     market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = 전체지수기본정보().fetch(market2idx[market])
-    df = df[
-        ["IDX_NM", "BAS_TM_CONTN", "ANNC_TM_CONTN", "BAS_IDX_CONTN", "COMPST_ISU_CNT"]
-    ]
+    df = 전체지수기본정보(
+        columns=[
+            "IDX_NM",
+            "BAS_TM_CONTN",
+            "ANNC_TM_CONTN",
+            "BAS_IDX_CONTN",
+            "COMPST_ISU_CNT",
+        ]
+    ).fetch(market2idx[market])
     df.columns = ["지수명", "기준시점", "발표시점", "기준지수", "종목수"]
     df = df.set_index("지수명")
-    df = df.replace(",", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype({"기준지수": np.float64, "종목수": np.int16})
+    df = parse_numeric(df, {"기준지수": np.float64, "종목수": np.int16})
     return df
 
 
@@ -1125,9 +1112,8 @@ def get_index_price_change_by_ticker(
     """  # pylint: disable=line-too-long # noqa: E501
 
     market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = 전체지수등락률().fetch(fromdate, todate, market2idx[market])
-    df = df[
-        [
+    df = 전체지수등락률(
+        columns=[
             "IDX_IND_NM",
             "OPN_DD_INDX",
             "END_DD_INDX",
@@ -1135,20 +1121,18 @@ def get_index_price_change_by_ticker(
             "ACC_TRDVOL",
             "ACC_TRDVAL",
         ]
-    ]
+    ).fetch(fromdate, todate, market2idx[market])
     df.columns = ["지수명", "시가", "종가", "등락률", "거래량", "거래대금"]
     df = df.set_index("지수명")
-    df = df.replace(r"[^\w\.-]", "", regex=True)
-    df = df.replace("", 0)
-    df = df.replace("-", 0)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "시가": np.float64,
             "종가": np.float64,
             "등락률": np.float16,
             "거래량": np.int64,
             "거래대금": np.int64,
-        }
+        },
     )
     return df
 
@@ -1177,9 +1161,8 @@ def get_index_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFra
     """
 
     market2idx = {"KRX": "01", "KOSPI": "02", "KOSDAQ": "03", "테마": "04"}
-    df = PER_PBR_배당수익률_전지수().fetch(date, market2idx[market])
-    df = df[
-        [
+    df = PER_PBR_배당수익률_전지수(
+        columns=[
             "IDX_NM",
             "CLSPRC_IDX",
             "FLUC_RT",
@@ -1188,13 +1171,11 @@ def get_index_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFra
             "WT_STKPRC_NETASST_RTO",
             "DIV_YD",
         ]
-    ]
+    ).fetch(date, market2idx[market])
     df.columns = ["지수명", "종가", "등락률", "PER", "선행PER", "PBR", "배당수익률"]
     df = df.set_index("지수명")
-    df = df.replace("^-$", 0, regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "종가": np.float64,
             "등락률": np.float64,
@@ -1202,7 +1183,7 @@ def get_index_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFra
             "선행PER": np.float32,
             "PBR": np.float32,
             "배당수익률": np.float32,
-        }
+        },
     )
     return df
 
@@ -1230,24 +1211,28 @@ def get_index_fundamental_by_date(fromdate: str, todate: str, ticker: str) -> Da
             2021-11-26  1770.31   -1.61    13.73      0.0  1.26        1.99
     """
 
-    df = PER_PBR_배당수익률_개별지수().fetch(fromdate, todate, ticker[0], ticker[1:])
-    df = df[
-        ["TRD_DD", "CLSPRC_IDX", "FLUC_RT", "WT_PER", "WT_STKPRC_NETASST_RTO", "DIV_YD"]
-    ]
+    df = PER_PBR_배당수익률_개별지수(
+        columns=[
+            "TRD_DD",
+            "CLSPRC_IDX",
+            "FLUC_RT",
+            "WT_PER",
+            "WT_STKPRC_NETASST_RTO",
+            "DIV_YD",
+        ]
+    ).fetch(fromdate, todate, ticker[0], ticker[1:])
     df.columns = ["날짜", "종가", "등락률", "PER", "PBR", "배당수익률"]
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index)
-    df = df.replace("^-$", 0, regex=True)
-    df = df.replace(",", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "종가": np.float64,
             "등락률": np.float64,
             "PER": np.float32,
             "PBR": np.float32,
             "배당수익률": np.float32,
-        }
+        },
     )
     return df.sort_index()
 
@@ -1287,16 +1272,15 @@ def get_shorting_status_by_date(fromdate, todate, ticker):
     """
 
     isin = get_stock_ticker_isin(ticker)
-    df = 개별종목_공매도_종합정보().fetch(fromdate, todate, isin)
-    df = df[
-        [
+    df = 개별종목_공매도_종합정보(
+        columns=[
             "TRD_DD",
             "CVSRTSELL_TRDVOL",
             "STR_CONST_VAL1",
             "CVSRTSELL_TRDVAL",
             "STR_CONST_VAL2",
         ]
-    ]
+    ).fetch(fromdate, todate, isin)
     df.columns = ["날짜", "거래량", "잔고수량", "거래대금", "잔고금액"]
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
@@ -1306,15 +1290,14 @@ def get_shorting_status_by_date(fromdate, todate, ticker):
     idx = (df.iloc[:2] == "-").any(axis=1).sum()
     df = df.iloc[idx:]
 
-    df = df.replace(r"\D", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "거래량": np.int32,
             "잔고수량": np.int32,
             "거래대금": np.int64,
             "잔고금액": np.int64,
-        }
+        },
     )
     return df.sort_index()
 
@@ -1363,8 +1346,8 @@ def get_shorting_trading_value_and_volume_by_date(
     df.columns = pd.MultiIndex.from_product(
         [["거래량", "거래대금"], ["공매도", "매수", "비중"]]
     )
-    df = df.replace(r"[^-\w\.]", "", regex=True).replace("", "0")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             ("거래량", "공매도"): np.int64,
             ("거래량", "매수"): np.int64,
@@ -1372,7 +1355,7 @@ def get_shorting_trading_value_and_volume_by_date(
             ("거래대금", "공매도"): np.int64,
             ("거래대금", "매수"): np.int64,
             ("거래대금", "비중"): np.float32,
-        }
+        },
     )
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
@@ -1432,8 +1415,8 @@ def get_shorting_trading_value_and_volume_by_ticker(
     df.columns = pd.MultiIndex.from_product(
         [["거래량", "거래대금"], ["공매도", "매수", "비중"]]
     )
-    df = df.replace(r"[^-\w\.]", "", regex=True).replace("", "0")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             ("거래량", "공매도"): np.int64,
             ("거래량", "매수"): np.int64,
@@ -1441,7 +1424,7 @@ def get_shorting_trading_value_and_volume_by_ticker(
             ("거래대금", "공매도"): np.int64,
             ("거래대금", "매수"): np.int64,
             ("거래대금", "비중"): np.float32,
-        }
+        },
     )
     return df
 
@@ -1491,11 +1474,9 @@ def get_shorting_investor_by_date(
     )
 
     df.columns = ["날짜", "기관", "개인", "외국인", "기타", "합계"]
-    df = df.replace(r"[^\w\.]", "", regex=True)
-    df = df.replace("", 0)
     df = df.set_index("날짜")
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
-    return df.astype(np.int64).sort_index()
+    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
+    return parse_numeric(df, np.int64).sort_index()
 
 
 @dataframe_empty_handler
@@ -1521,10 +1502,8 @@ def get_shorting_volume_top50(date: str, market: str) -> DataFrame:
             227840   5         13784400    546597900        2.52               3084294                  4.47                     0.51              4.91       -2.37
     """  # pylint: disable=line-too-long # noqa: E501
     market2idx = {"KOSPI": 1, "KOSDAQ": 2, "KONEX": 3}
-    df = 공매도_거래상위_50종목().fetch(date, market2idx[market])
-
-    df = df[
-        [
+    df = 공매도_거래상위_50종목(
+        columns=[
             "RANK",
             "ISU_CD",
             "CVSRTSELL_TRDVAL",
@@ -1535,7 +1514,7 @@ def get_shorting_volume_top50(date: str, market: str) -> DataFrame:
             "VALU_PD_CMP_TDD_SRTSELL_RTO",
             "PRC_YD",
         ]
-    ]
+    ).fetch(date, market2idx[market])
     df.columns = [
         "순위",
         "티커",
@@ -1548,9 +1527,8 @@ def get_shorting_volume_top50(date: str, market: str) -> DataFrame:
         "주가수익률",
     ]
     df = df.set_index("티커")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "순위": np.int32,
             "공매도거래대금": np.int64,
@@ -1560,7 +1538,7 @@ def get_shorting_volume_top50(date: str, market: str) -> DataFrame:
             "직전40일공매도평균비중": np.float64,
             "공매도비중증가율": np.float64,
             "주가수익률": np.float64,
-        }
+        },
     )
     return df
 
@@ -1589,9 +1567,17 @@ def get_shorting_balance_top50(date: str, market: str) -> DataFrame:
     """  # pylint: disable=line-too-long # noqa: E501
 
     market2idx = {"KOSPI": 1, "KOSDAQ": 2, "KONEX": 3}
-    df = 공매도_잔고상위_50종목().fetch(date, market2idx[market])
-
-    df = df[["RANK", "ISU_CD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]]
+    df = 공매도_잔고상위_50종목(
+        columns=[
+            "RANK",
+            "ISU_CD",
+            "BAL_QTY",
+            "LIST_SHRS",
+            "BAL_AMT",
+            "MKTCAP",
+            "BAL_RTO",
+        ]
+    ).fetch(date, market2idx[market])
     df.columns = [
         "순위",
         "티커",
@@ -1602,9 +1588,8 @@ def get_shorting_balance_top50(date: str, market: str) -> DataFrame:
         "비중",
     ]
     df = df.set_index("티커")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "순위": np.int32,
             "공매도잔고": np.int64,
@@ -1612,7 +1597,7 @@ def get_shorting_balance_top50(date: str, market: str) -> DataFrame:
             "공매도금액": np.int64,
             "시가총액": np.float64,
             "비중": np.float16,
-        }
+        },
     )
     return df
 
@@ -1641,21 +1626,20 @@ def get_shorting_balance_by_ticker(date: str, market: str) -> DataFrame:
     """
 
     market2idx = {"KOSPI": 1, "KOSDAQ": 2, "KONEX": 3}
-    df = 전종목_공매도_잔고().fetch(date, market2idx[market])
-
-    df = df[["ISU_CD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]]
+    df = 전종목_공매도_잔고(
+        columns=["ISU_CD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]
+    ).fetch(date, market2idx[market])
     df.columns = ["티커", "공매도잔고", "상장주식수", "공매도금액", "시가총액", "비중"]
     df = df.set_index("티커")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "공매도잔고": np.int64,
             "상장주식수": np.int64,
             "공매도금액": np.int64,
             "시가총액": np.float64,
             "비중": np.float16,
-        }
+        },
     )
     return df
 
@@ -1685,24 +1669,28 @@ def get_shorting_balance_by_date(fromdate: str, todate: str, ticker: str) -> Dat
     """  # pylint: disable=line-too-long # noqa: E501
 
     isin = get_stock_ticker_isin(ticker)
-    df = 개별종목_공매도_잔고().fetch(fromdate, todate, isin)
-
-    df = df[
-        ["RPT_DUTY_OCCR_DD", "BAL_QTY", "LIST_SHRS", "BAL_AMT", "MKTCAP", "BAL_RTO"]
-    ]
+    df = 개별종목_공매도_잔고(
+        columns=[
+            "RPT_DUTY_OCCR_DD",
+            "BAL_QTY",
+            "LIST_SHRS",
+            "BAL_AMT",
+            "MKTCAP",
+            "BAL_RTO",
+        ]
+    ).fetch(fromdate, todate, isin)
     df.columns = ["날짜", "공매도잔고", "상장주식수", "공매도금액", "시가총액", "비중"]
     df = df.set_index("날짜")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace("", 0)
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.astype(
+    df = parse_numeric(
+        df,
         {
             "공매도잔고": np.int64,
             "상장주식수": np.int64,
             "공매도금액": np.int64,
             "시가총액": np.float64,
             "비중": np.float32,
-        }
+        },
     )
     return df.sort_index()
 
@@ -1780,9 +1768,8 @@ def get_market_ohlcv_by_market(market: str = "ALL") -> DataFrame:
     ]
     df = df.set_index("티커")
     df["액면가"] = df["액면가"].replace(r"[^-\w\.]", "", regex=True)
-    df["상장주식수"] = df["상장주식수"].replace(r"[^-\w\.]", "", regex=True)
     df["상장일"] = pd.to_datetime(df["상장일"], format="%Y/%m/%d")  # 상장일
-    df = df.astype({"상장주식수": np.int64})
+    df = parse_numeric(df, {"상장주식수": np.int64})
     return df.sort_index()
 
 
@@ -0,0 +1,163 @@
+import datetime
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from pandas import DataFrame
+
+from pykrx.website.comm.cache import KST
+
+__all__ = [
+    "MasterStore",
+    "get_master_store",
+    "set_master_store",
+]
+
+# 저장 형식이 바뀌면 올려서 이전 스냅샷을 무시한다.
+MASTER_VERSION = 1
+
+
+class MasterStore:
+    """티커 마스터(상장/상장폐지 종목, 지수, ETF/ETN/ELW 목록) 스냅샷 저장소
+
+    마스터별로 {path}/{name}.pkl 파일 하나에 DataFrame과 저장 시각, 형식
+    버전을 함께 저장한다. 스냅샷이 max_age 초보다 오래되면 background가
+    True인 경우 기존 스냅샷을 바로 반환하고 별도 스레드에서 다시 조회해
+    교체하며, False인 경우 다시 조회한 결과를 반환한다. 조회에 실패하면
+    기존 스냅샷을 그대로 사용한다.
+
+    >> set_master_store(MasterStore("~/.cache/pykrx/masters"))
+
+    Args:
+        path       (str           ): 스냅샷 디렉터리
+        max_age    (int,  optional): 스냅샷을 다시 조회하기까지의 시간(초)
+        background (bool, optional): 오래된 스냅샷을 백그라운드에서 갱신할지 여부
+    """
+
+    def __init__(self, path, max_age: int = 86400, background: bool = True):
+        self.path = Path(path).expanduser()
+        self.max_age = max_age
+        self.background = background
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def _file(self, name: str) -> Path:
+        return self.path / f"{name}.pkl"
+
+    def load(self, name: str):
+        """저장된 스냅샷을 읽는다.
+
+        Returns:
+            tuple: (DataFrame, 저장 시각(epoch)) 또는 스냅샷이 없으면 None
+        """
+        try:
+            with open(self._file(name), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != MASTER_VERSION:
+            return None
+        return entry["data"], entry["stored"]
+
+    def save(self, name: str, df: DataFrame) -> None:
+        stored = time.time()
+        entry = {
+            "version": MASTER_VERSION,
+            "stored": stored,
+            "date": datetime.datetime.fromtimestamp(stored, KST).isoformat(),
+            "data": df,
+        }
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._file(name))
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def get(self, name: str, fetch, on_refresh=None) -> DataFrame:
+        """스냅샷을 반환하고 필요하면 fetch로 다시 조회
+
+        Args:
+            name       (str     ): 마스터 이름
+            fetch      (callable): 마스터를 조회하는 함수 (실패 시 빈 DataFrame)
+            on_refresh (callable, optional): 백그라운드 갱신이 끝나면 새
+                DataFrame으로 호출된다.
+        """
+        snapshot = self.load(name)
+        if snapshot is None:
+            df = fetch()
+            if not df.empty:
+                self.save(name, df)
+            return df
+
+        df, stored = snapshot
+        if time.time() - stored < self.max_age:
+            return df
+        if self.background:
+            self._refresh_async(name, fetch, on_refresh)
+            return df
+
+        fresh = fetch()
+        if fresh.empty:
+            return df
+        self.save(name, fresh)
+        return fresh
+
+    def _refresh_async(self, name: str, fetch, on_refresh) -> None:
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+
+        def _refresh():
+            try:
+                df = fetch()
+                if df.empty:
+                    return
+                self.save(name, df)
+                if on_refresh is not None:
+                    on_refresh(df)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(name)
+
+        threading.Thread(
+            target=_refresh, name=f"pykrx-master-{name}", daemon=True
+        ).start()
+
+    def clear(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+# 환경 변수 PYKRX_CACHE_DIR 이 설정되어 있으면 {PYKRX_CACHE_DIR}/masters 에 저장한다.
+_store: MasterStore | None = (
+    MasterStore(Path(os.environ["PYKRX_CACHE_DIR"]).expanduser() / "masters")
+    if os.getenv("PYKRX_CACHE_DIR")
+    else None
+)
+
+
+def set_master_store(store: MasterStore | None) -> None:
+    """티커 마스터 스냅샷 저장소를 설정 (None이면 매번 조회)"""
+    global _store
+    _store = store
+
+
+def get_master_store() -> MasterStore | None:
+    """현재 설정된 티커 마스터 스냅샷 저장소를 반환"""
+    return _store
+
+
+def load_master(name: str, fetch, on_refresh=None) -> DataFrame:
+    """저장소가 설정되어 있으면 스냅샷을, 아니면 fetch() 결과를 반환"""
+    store = _store
+    if store is None:
+        return fetch()
+    return store.get(name, fetch, on_refresh)
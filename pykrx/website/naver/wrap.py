@@ -1,40 +1,147 @@
 import xml.etree.ElementTree as et
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from pykrx.website.krx.calendar import get_calendar
 from pykrx.website.naver.core import Sise
 
+# item data 속성의 필드 순서 (날짜|시가|고가|저가|종가|거래량)
+SISE_FIELDS = ["시가", "고가", "저가", "종가", "거래량"]
+# 한 번에 XML 파서에 넣는 문자 수
+FEED_CHUNK = 1 << 16
+
+# 이 날 이전에는 토요일에도 거래했으므로 평일 수가 거래일 수의 상한이 아니다.
+WEEKDAYS_ONLY_SINCE = np.datetime64("1998-12-07")
+
+
+def _count_bars(fromdate: datetime, today: datetime) -> int:
+    """fromdate부터 today까지의 거래일 수 상한 + 등락률 계산용 전일 1개
+
+    Naver 시세는 최근 거래일부터 count개를 거슬러 반환하므로 달력 일수 대신
+    거래일 수로 요청 개수를 줄인다. KRX 거래일 달력이 전일까지의 구간을 이미
+    알고 있으면 휴장일을 뺀 거래일 수(+ 당일)를 사용하고, 아니면 추가 요청
+    없이 평일 수로 추정한다.
+    """
+    start = np.datetime64(fromdate.date())
+    end = np.datetime64(today.date()) + 1
+    if start >= end:
+        return 1
+
+    yesterday = today.date() - timedelta(days=1)
+    calendar = get_calendar()
+    if fromdate.date() <= yesterday and calendar.covers(fromdate, yesterday):
+        # 전일까지의 거래일 + 당일 + 전일 종가
+        return len(calendar.days(fromdate, yesterday)) + 2
+    pivot = min(max(start, WEEKDAYS_ONLY_SINCE), end)
+    calendar_days = int((pivot - start) / np.timedelta64(1, "D"))
+    return calendar_days + int(np.busday_count(pivot, end)) + 1
+
+
+def _to_datetime64(yyyymmdd: np.ndarray) -> np.ndarray:
+    """YYYYMMDD 정수 배열을 datetime64[D] 배열로 변환"""
+    year, rest = np.divmod(yyyymmdd, 10000)
+    month, day = np.divmod(rest, 100)
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    return months.astype("datetime64[D]") + (day - 1)
+
+
+def _decode_sise(xml: str, fromdate: str, todate: str) -> tuple:
+    """Naver 시세 XML을 날짜/OHLCV numpy 배열로 디코딩
+
+    XML을 조각 단위로 파서에 넣으면서 item의 data 속성만 모으고, 조각마다
+    모은 레코드를 한 번에 int64로 변환해 미리 할당한 배열에 채운다. item은
+    날짜 순이므로 fromdate 직전 거래일(등락률 계산용)보다 앞선 item은 버리고,
+    todate 이후의 item을 만나면 파싱을 멈춘다.
+
+    Args:
+        xml      (str): Sise().fetch의 응답
+        fromdate (str): 조회 시작 일자 (YYYYMMDD)
+        todate   (str): 조회 종료 일자 (YYYYMMDD)
+
+    Returns:
+        tuple: (datetime64[D] 배열 (n,), int64 배열 (n, 5))
+    """
+    width = len(SISE_FIELDS) + 1
+    parser = et.XMLPullParser(events=("start",))
+    values = np.empty((0, width), dtype=np.int64)
+    size = 0
+    chartdata = None
+    prior = None  # fromdate 이전의 마지막 item
+    pending = []
+
+    def _flush():
+        nonlocal values, size
+        if not pending:
+            return
+        if prior is not None and size == 0:
+            pending.insert(0, prior)
+        block = np.fromstring("|".join(pending), dtype=np.int64, sep="|")
+        if block.size != len(pending) * width:
+            raise ValueError("시세 item의 형식이 올바르지 않습니다.")
+        block = block.reshape(-1, width)
+        if size + len(block) > len(values):
+            grown = np.empty((max(2 * len(values), size + len(block)), width), np.int64)
+            grown[:size] = values[:size]
+            values = grown
+        values[size : size + len(block)] = block
+        size += len(block)
+        pending.clear()
+
+    done = False
+    for i in range(0, len(xml), FEED_CHUNK):
+        parser.feed(xml[i : i + FEED_CHUNK])
+        for _, node in parser.read_events():
+            if node.tag == "chartdata":
+                # count 속성(응답 item 수)으로 배열을 미리 할당한다.
+                chartdata = node
+                count = int(node.get("count") or 0)
+                values = np.empty((count, width), dtype=np.int64)
+            elif node.tag == "item" and not done:
+                data = node.get("data")
+                day = data[:8]
+                if day < fromdate:
+                    prior = data
+                elif day > todate:
+                    done = True
+                else:
+                    pending.append(data)
+        _flush()
+        if done:
+            break
+        if chartdata is not None:
+            # 처리한 item을 트리에서 제거해 메모리 사용량을 일정하게 유지한다.
+            chartdata.clear()
+    else:
+        parser.close()
+
+    values = values[:size]
+    return _to_datetime64(values[:, 0]), values[:, 1:]
+
 
 # fromdate, todate, isin
 def get_market_ohlcv_by_date(fromdate, todate, ticker):
     strtd = pd.to_datetime(fromdate)
     lastd = pd.to_datetime(todate)
     today = datetime.now()
-    # additional requests for fluctuation rate
-    elapsed = today - strtd + pd.Timedelta(days=2)
 
-    xml = Sise().fetch(ticker, elapsed.days)
+    xml = Sise().fetch(ticker, _count_bars(strtd, today))
 
-    result = []
     try:
-        for node in et.fromstring(xml).iter(tag="item"):
-            row = node.get("data")
-            result.append(row.split("|"))
-
-        cols = ["날짜", "시가", "고가", "저가", "종가", "거래량"]
-        df = DataFrame(result, columns=cols)
-        df = df.set_index("날짜")
-        df.index = pd.to_datetime(df.index, format="%Y%m%d")
-        df = df.astype(np.int64)
-        close_1d = df["종가"].shift(1)
-        df["등락률"] = (df["종가"] - close_1d) / close_1d * 100
-        return df.loc[(strtd <= df.index) & (df.index <= lastd)]
+        dates, values = _decode_sise(
+            xml, strtd.strftime("%Y%m%d"), lastd.strftime("%Y%m%d")
+        )
     except et.ParseError:
         return DataFrame()
 
+    index = pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="날짜")
+    df = DataFrame(values, index=index, columns=SISE_FIELDS, copy=False)
+    close_1d = df["종가"].shift(1)
+    df["등락률"] = (df["종가"] - close_1d) / close_1d * 100
+    return df.loc[strtd <= df.index]
+
 
 if __name__ == "__main__":
     # df = get_market_ohlcv_by_date("20010101", "20190820", "005930")
@@ -7,6 +7,7 @@ import pytest
 import vcr as vcrpy
 import yaml
 
+from pykrx.website.comm import ratelimit as _ratelimit
 from pykrx.website.comm import webio as _webio
 
 IGNORED_DATE_KEYS = {
@@ -135,7 +136,58 @@ _global_vcr.register_matcher("body_ignore_dates", form_body_matcher)
 
 
 @pytest.fixture(scope="session", autouse=True)
-def init_singletons(tmp_path_factory):
+def replay_transport():
+    """Cassette 재생용 전송 설정
+
+    - 재생은 서버에 요청하지 않으므로 host 별 요청 한도를 해제한다.
+    - VCR의 cassette 재생은 스레드 안전하지 않으므로 기간 분할 조회와 티커
+      리스트 조회를 순차적으로 수행한다.
+    """
+    from pykrx.stock import _batch
+    from pykrx.website.krx.krxio import KrxWebIo
+
+    max_workers = KrxWebIo.max_workers
+    batch_workers = _batch.TICKER_BATCH_WORKERS
+    KrxWebIo.max_workers = 1
+    _batch.TICKER_BATCH_WORKERS = 1
+    for host in _ratelimit.DEFAULT_LIMITS:
+        _ratelimit.set_rate_limit(host, None)
+    yield
+    _ratelimit._limiters.clear()
+    KrxWebIo.max_workers = max_workers
+    _batch.TICKER_BATCH_WORKERS = batch_workers
+
+
+@pytest.fixture(autouse=True)
+def fresh_calendar():
+    """테스트마다 빈 거래일 달력을 사용
+
+    cassette 재생은 날짜 파라미터를 무시하므로 응답의 거래일이 요청 구간과
+    다를 수 있다. 다른 테스트에서 조회한 구간이 섞이지 않도록 매번 새로 만든다.
+    """
+    from pykrx.website.krx.calendar import TradingCalendar, set_calendar
+
+    set_calendar(TradingCalendar())
+    yield
+    set_calendar(None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_retry_state(monkeypatch):
+    """테스트마다 기본 재시도 정책과 닫힌 circuit breaker를 사용
+
+    앞선 테스트에서 열린 circuit이나 변경된 정책이 다음 테스트의 요청을
+    지연시키지 않도록 한다.
+    """
+    from pykrx.website.comm import retry
+
+    monkeypatch.setattr(retry, "_policy", retry.RetryPolicy())
+    monkeypatch.setattr(retry, "_breakers", {})
+    monkeypatch.setattr(retry, "_breaker_config", dict(retry._breaker_config))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def init_singletons(tmp_path_factory, replay_transport):
     """세션 시작 시 singleton을 common cassette로 미리 초기화.
 
     VCR은 중첩 카세트에서 가장 안쪽(innermost) 카세트만 사용하므로
@@ -174,7 +226,7 @@ def init_singletons(tmp_path_factory):
             from pykrx.website.krx.etx.ticker import EtxTicker
             from pykrx.website.krx.market.ticker import StockTicker
 
-            EtxTicker()
+            EtxTicker().load()
             StockTicker()
     finally:
         _webio.set_session(original_session)
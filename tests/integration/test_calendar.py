@@ -0,0 +1,109 @@
+import datetime
+
+import pandas as pd
+import pytest
+from pykrx.website.krx.calendar import TradingCalendar
+
+# pylint: disable-all
+# flake8: noqa
+
+TODAY = datetime.date(2021, 1, 8).toordinal()
+
+
+@pytest.fixture
+def requests_log(monkeypatch):
+    """2020-12-21 ~ 2021-01-08 의 KOSPI 거래일을 흉내 내고 요청 구간을 기록"""
+    days = pd.bdate_range("2020-12-21", "2021-01-08").drop(
+        pd.to_datetime(["2020-12-25", "2020-12-31", "2021-01-01"])
+    )
+    ordinals = [day.toordinal() for day in days]
+    log = []
+
+    def _fetch(start, end):
+        log.append((start, end))
+        return [x for x in ordinals if start <= x <= end]
+
+    monkeypatch.setattr(TradingCalendar, "_fetch", staticmethod(_fetch))
+    monkeypatch.setattr(TradingCalendar, "_today_ordinal", lambda self: TODAY)
+    return log
+
+
+class TestTradingCalendar:
+    def test_prev_and_next_fetch_once(self, requests_log):
+        cal = TradingCalendar()
+        assert cal.prev("20210101") == "20201230"
+        assert cal.next("20210101") == "20210104"
+        n = len(requests_log)
+        for _ in range(100):
+            assert cal.prev("20210103") == "20201230"
+            assert cal.is_trading_day("20201230")
+            assert not cal.is_trading_day("20201225")
+        assert len(requests_log) == n
+
+    def test_days_fetches_only_missing_range(self, requests_log):
+        cal = TradingCalendar()
+        cal.prev("20201231")  # 2020-12-24 ~ 2020-12-31
+        requests_log.clear()
+        days = cal.days("20201221", "20210107")
+        assert len(days) == 11
+        assert days[0] == pd.Timestamp("2020-12-21")
+        covered = datetime.date(2020, 12, 24).toordinal()
+        assert requests_log == [
+            (datetime.date(2020, 12, 21).toordinal(), covered - 1),
+            (datetime.date(2021, 1, 1).toordinal(), TODAY - 1),
+        ]
+
+    def test_today_is_refreshed_after_ttl(self, requests_log):
+        cal = TradingCalendar(ttl=0)
+        assert cal.prev() == "20210108"
+        assert cal.prev() == "20210108"
+        # 전일까지는 다시 조회하지 않고 당일만 다시 확인한다.
+        assert requests_log[-1] == (TODAY, TODAY)
+
+    def test_persisted_calendar_skips_network(self, tmp_path, requests_log):
+        path = tmp_path / "calendar.json"
+        TradingCalendar(path).build("20201221", "20210107")
+        requests_log.clear()
+
+        cal = TradingCalendar(path)
+        assert cal.prev("20210103") == "20201230"
+        assert len(cal.days("20201221", "20210107")) == 11
+        assert requests_log == []
+
+
+@pytest.fixture
+def krx_payload(monkeypatch):
+    """KRX 응답 형식으로 2020-12-30 하루만 거래일인 지수 시세를 돌려준다.
+
+    거래일이 없는 구간에는 KRX와 같이 빈 output을 돌려준다.
+    """
+    from pykrx.website.comm import webio
+
+    class _Response:
+        def __init__(self, params):
+            self.params = params
+
+        def json(self):
+            inside = self.params["strtDd"] <= "20201230" <= self.params["endDd"]
+            output = [{"TRD_DD": "2020/12/30"}] if inside else []
+            return {"output": output, "CURRENT_DATETIME": "2021.01.03 PM 01:00:00"}
+
+    monkeypatch.setattr(webio.Post, "read", lambda self, **params: _Response(params))
+    monkeypatch.setattr(
+        TradingCalendar,
+        "_today_ordinal",
+        lambda self: datetime.date(2021, 1, 3).toordinal(),
+    )
+
+
+class TestEmptyKrxResponse:
+    def test_holiday_window_has_no_trading_days(self, krx_payload):
+        cal = TradingCalendar()
+        assert not cal.is_trading_day("20210102")
+        assert len(cal.days("20210101", "20210103")) == 0
+
+    def test_prev_on_weekend_after_ttl(self, krx_payload):
+        cal = TradingCalendar(ttl=0)
+        assert cal.prev() == "20201230"
+        # ttl이 지나 당일(일요일)만 다시 조회해도 빈 응답을 거래일 없음으로 처리한다.
+        assert cal.prev() == "20201230"
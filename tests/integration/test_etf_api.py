@@ -64,6 +64,54 @@ class TestElwTickerList:
         assert isinstance(tickers, list)
 
 
+class TestEtxTickerLazyLoad:
+    def test_etf_lookup_loads_only_etf(self, monkeypatch):
+        from pykrx.website.krx.etx.ticker import EtxTicker
+
+        etx = EtxTicker()
+        frames = dict(etx._frames)
+        loaded = []
+
+        def _get_tickers(market):
+            loaded.append(market)
+            return frames[market]
+
+        monkeypatch.setattr(etx, "_frames", {})
+        monkeypatch.setattr(etx, "_get_tickers", _get_tickers)
+        assert stock.get_etf_isin("069500") == "KR7069500007"
+        assert len(stock.get_etf_ticker_list("20210104")) > 0
+        assert loaded == ["ETF"]
+
+        # ETF에 없는 티커는 다음 분류를 차례로 조회한다.
+        etn = frames["ETN"].index[0]
+        assert etx.get_market(etn) == "ETN"
+        assert loaded == ["ETF", "ETN"]
+
+        # 분류를 지정하지 않은 조회는 ELW 목록을 새로 받지 않는다.
+        with pytest.raises(KeyError):
+            etx.get_market("999999")
+        assert loaded == ["ETF", "ETN"]
+
+    def test_is_helpers_check_only_their_category(self, monkeypatch):
+        from pykrx.website.krx.etx.ticker import EtxTicker, is_etf, is_etn
+
+        etx = EtxTicker()
+        frames = dict(etx._frames)
+        loaded = []
+
+        def _get_tickers(market):
+            loaded.append(market)
+            return frames[market]
+
+        monkeypatch.setattr(etx, "_frames", {})
+        monkeypatch.setattr(etx, "_get_tickers", _get_tickers)
+        assert not is_etn("069500")
+        assert not is_etn("999999")
+        assert loaded == ["ETN"]
+        assert is_etf("069500")
+        assert loaded == ["ETN", "ETF"]
+
+
 class TestEtfOhlcvByDate:
     @pytest.mark.vcr
     def test_with_business_day(self):
@@ -44,6 +44,14 @@ class TestIndexTickerList:
         name = stock.get_index_ticker_name("1163")
         assert name == "코스피 고배당 50"
 
+    def test_index_market(self):
+        from pykrx.website import krx
+
+        ticker = krx.IndexTicker()
+        assert set(ticker.df["시장"]) == {"KRX", "KOSPI", "KOSDAQ", "테마"}
+        assert ticker.get_market("1001") == "KOSPI"
+        assert ticker.get_market("2001") == "KOSDAQ"
+
 
 class TestIndexPortfolioDepositFile:
     @pytest.mark.vcr
@@ -9,12 +9,17 @@ import numpy as np
 class TestStockBusinessDaysTest:
     @pytest.mark.vcr
     def test_every_month(self):
+        # 1980-01-01 ~ 2020-08-31 을 730일 단위로 나누어 한 번만 조회한다.
+        days = stock.get_previous_business_days(fromdate="19800101", todate="20200831")
+        assert days[0] == pd.Timestamp("1980-01-04")
+
         year = 2020
         for month in range(1, 13):
             days = stock.get_previous_business_days(year=year, month=month)
             assert len(days) != 0
             assert isinstance(days, list)
             assert isinstance(days[0], pd._libs.tslibs.timestamps.Timestamp)
+            assert all(day.month == month for day in days)
 
     @pytest.mark.vcr
     def test_days_for_a_specified_period_of_time(self):
@@ -22,6 +27,112 @@ class TestStockBusinessDaysTest:
         assert len(days) != 0
         assert isinstance(days, list)
         assert isinstance(days[0], pd._libs.tslibs.timestamps.Timestamp)
+        assert days[0] == pd.Timestamp("2020-01-02")
+        assert days[-1] == pd.Timestamp("2020-01-15")
+
+    def test_holidays_only(self, monkeypatch):
+        from pykrx.website.krx.calendar import TradingCalendar
+
+        days = pd.to_datetime(["2020-12-30", "2021-01-04"])
+        monkeypatch.setattr(
+            TradingCalendar,
+            "_fetch",
+            staticmethod(
+                lambda start, end: [
+                    day.toordinal() for day in days if start <= day.toordinal() <= end
+                ]
+            ),
+        )
+        # 2020-12-31 ~ 2021-01-03: 연말 휴장일, 신정, 주말
+        result = stock.get_previous_business_days(
+            fromdate="20201231", todate="20210103"
+        )
+        assert result == []
+
+
+class TestStockTickerIndex:
+    def test_bulk_resolution_matches_single_lookup(self):
+        from pykrx.website import krx
+
+        tickers = ["005930", "030270", "999999", "000660"]
+        isins = krx.get_stock_ticker_isin(tickers)
+        assert isins[2] is None
+        assert isins[0] == krx.get_stock_ticker_isin("005930") == "KR7005930003"
+        # 상장폐지 종목의 중복 티커는 ISIN 순으로 첫 번째 종목을 사용한다.
+        assert isins[1] == "KR7030270003"
+        assert krx.get_stock_name(["005930"]) == ["삼성전자"]
+        assert krx.StockTicker().get("005930")["시장"] == "STK"
+        assert krx.StockTicker().get("999999") is None
+
+    def test_empty_master_resolves_to_none(self, monkeypatch):
+        import numpy as np
+        from pykrx.website import krx
+
+        ticker = krx.StockTicker()
+        monkeypatch.setattr(ticker, "_index", ({}, np.empty((0, 3), dtype=object)))
+        assert ticker.resolve(["005930", "000660"], "ISIN") == [None, None]
+        assert krx.get_stock_name(["005930"]) == [None]
+
+
+class TestNaverOhlcvRange:
+    def test_count_is_bounded_by_weekdays(self):
+        from datetime import datetime
+
+        from pykrx.website.naver.wrap import _count_bars
+
+        today = datetime(2026, 1, 23)
+        # 2026-01-02(금) ~ 2026-01-23(금): 평일 16일 + 전일 1개
+        assert _count_bars(datetime(2026, 1, 2), today) == 17
+        # 1998-12-07 이전 구간은 토요일 거래가 있어 달력 일수로 센다.
+        assert _count_bars(datetime(1998, 12, 5), today) == (
+            2 + np.busday_count("1998-12-07", "2026-01-24") + 1
+        )
+        assert _count_bars(datetime(2026, 2, 1), today) == 1
+
+    def test_count_skips_known_krx_holidays(self, monkeypatch):
+        from datetime import date, datetime
+
+        from pykrx.website.krx.calendar import TradingCalendar, get_calendar
+        from pykrx.website.naver.wrap import _count_bars
+
+        # 2026-01-05(월)이 휴장일인 달력
+        holiday = date(2026, 1, 5).toordinal()
+        monkeypatch.setattr(
+            TradingCalendar,
+            "_fetch",
+            staticmethod(
+                lambda s, e: [
+                    x
+                    for x in range(s, e + 1)
+                    if x != holiday and date.fromordinal(x).weekday() < 5
+                ]
+            ),
+        )
+        today = datetime(2026, 1, 23)
+        # 달력을 모르면 요청 없이 평일 수로 추정한다.
+        assert _count_bars(datetime(2026, 1, 2), today) == 17
+        get_calendar().build("20260102", "20260122")
+        # 2026-01-02 ~ 01-22 거래일 14일 + 당일 + 전일 1개
+        assert _count_bars(datetime(2026, 1, 2), today) == 16
+
+    @pytest.mark.parametrize("chunk", [7, 1 << 16])
+    def test_only_requested_rows_are_decoded(self, monkeypatch, chunk):
+        from pykrx.website.naver import core, wrap
+
+        days = ["20210104", "20210105", "20210106", "20210107", "20210108"]
+        items = "".join(
+            f'<item data="{d}|{i}|{i}|{i}|{100 + i}|{i}" />' for i, d in enumerate(days)
+        )
+        xml = f"<protocol><chartdata>{items}</chartdata></protocol>"
+        monkeypatch.setattr(core.Sise, "fetch", lambda self, ticker, count: xml)
+        # 조각 경계가 item 중간에 걸려도 같은 결과를 얻는다.
+        monkeypatch.setattr(wrap, "FEED_CHUNK", chunk)
+
+        df = wrap.get_market_ohlcv_by_date("20210105", "20210107", "005930")
+        assert list(df.index.strftime("%Y%m%d")) == days[1:4]
+        # 첫 행의 등락률은 조회 구간 이전의 종가를 기준으로 한다.
+        assert df["등락률"].iloc[0] == pytest.approx(1 / 100 * 100)
+        assert df["종가"].dtype == np.int64
 
 
 class TestStockOhlcvByDateTest:
@@ -76,6 +187,23 @@ class TestStockOhlcvByDateTest:
         assert df.loc["2018-05-04"]["시가"] == 53000
 
 
+class TestStockOhlcvBatchByDate:
+    @pytest.fixture
+    def vcr_cassette_name(self):
+        # 단일 종목 조회 cassette을 재사용한다.
+        return "TestStockOhlcvByDateTest.test_ohlcv_with_not_adjusted"
+
+    @pytest.mark.vcr
+    def test_ticker_list_returns_panel(self):
+        df = stock.get_market_ohlcv_by_date(
+            "20180427", "20180504", ["005930", "999999"], adjusted=False
+        )
+        assert df.index.names == ["날짜", "티커"]
+        assert df.loc[("2018-04-27", "005930"), "시가"] == 2669000
+        assert df.loc[("2018-05-04", "005930"), "시가"] == 53000
+        assert list(df.attrs["errors"]) == ["999999"]
+
+
 class TestStockOhlcvByTickerTest:
     @pytest.mark.vcr
     def test_ohlcv_for_a_day(self):
@@ -123,6 +251,96 @@ class TestStockOhlcvByTickerTest:
         assert (df0 == df1).all(axis=None)
 
 
+class TestStockOhlcvPanel:
+    @pytest.fixture
+    def vcr_cassette_name(self):
+        # 지수 OHLCV(영업일)와 KOSPI 전종목 시세가 기록된 cassette을 재사용한다.
+        return "TestStockOhlcvByTickerTest.test_ohlcv_for_a_day_on_holiday1"
+
+    @pytest.mark.vcr(allow_playback_repeats=True)
+    def test_panel_from_daily_snapshots(self):
+        df = stock.get_market_ohlcv_panel("20210118", "20210122", "KOSPI")
+        assert df.index.names == ["날짜", "티커"]
+        assert list(df.columns) == [
+            "시가",
+            "고가",
+            "저가",
+            "종가",
+            "거래량",
+            "거래대금",
+            "등락률",
+        ]
+        days = df.index.get_level_values("날짜").unique()
+        assert len(days) == 5
+        s = df.xs("005930", level="티커")
+        assert isinstance(s.index, pd.DatetimeIndex)
+        assert len(s) == 5
+        assert df.attrs["errors"] == {}
+
+
+class TestQueryPlan:
+    def test_few_tickers_use_ticker_endpoint(self):
+        plan = stock.plan_query("ohlcv", "20210104", "20210108", ["005930", "000660"])
+        assert plan.strategy == "by_ticker"
+        assert plan.endpoint == "개별종목시세"
+        assert plan.costs == {"by_ticker": 2, "by_date": 6}
+
+    def test_many_tickers_use_snapshot_endpoint(self):
+        tickers = [f"{i:06d}" for i in range(100)]
+        plan = stock.plan_query("fundamental", "20200101", "20221231", tickers)
+        # 730일 단위로 2개 구간
+        assert plan.costs["by_ticker"] == 200
+        assert plan.strategy == "by_ticker"
+
+        plan = stock.plan_query("fundamental", "20210104", "20210108", tickers)
+        assert plan.strategy == "by_date"
+        assert plan.endpoint == "PER_PBR_배당수익률_전종목"
+        assert plan.requests == 6
+
+    def test_snapshot_not_available(self):
+        tickers = [f"{i:06d}" for i in range(100)]
+        plan = stock.plan_query("ohlcv", "20210104", "20210108", tickers, False)
+        assert plan.strategy == "by_ticker"
+
+    def test_adjusted_costs_one_naver_request_per_ticker(self):
+        tickers = [f"{i:06d}" for i in range(3)]
+        plan = stock.plan_query(
+            "ohlcv", "20100101", "20221231", tickers, False, adjusted=True
+        )
+        assert plan.strategy == "by_ticker"
+        assert plan.endpoint == "Sise"
+        assert plan.costs["by_ticker"] == 3
+
+    def test_batch_runs_snapshot_plan(self, monkeypatch):
+        from pykrx.website import krx
+        from pykrx.website.krx.calendar import TradingCalendar
+
+        days = pd.to_datetime(["2021-01-04", "2021-01-05"])
+        snapshot = pd.DataFrame(
+            {
+                "시가총액": [10, 20, 30],
+                "거래량": [1, 2, 3],
+                "거래대금": [4, 5, 6],
+                "상장주식수": [7, 8, 9],
+            },
+            index=pd.Index(["000001", "000002", "000003"], name="티커"),
+        )
+        monkeypatch.setattr(
+            TradingCalendar,
+            "_fetch",
+            staticmethod(lambda start, end: [day.toordinal() for day in days]),
+        )
+        monkeypatch.setattr(krx, "get_market_cap_by_ticker", lambda *args: snapshot)
+
+        tickers = ["000001", "000003", "999998", "999999"]
+        df = stock.get_market_cap_by_date("20210104", "20210105", tickers)
+        assert df.attrs["plan"].strategy == "by_date"
+        assert df.index.names == ["날짜", "티커"]
+        assert len(df) == 4
+        assert df.loc[("2021-01-05", "000003"), "시가총액"] == 30
+        assert list(df.attrs["errors"]) == ["999998", "999999"]
+
+
 class TestStockPriceChangeByTicker:
     @pytest.mark.vcr
     def test_with_valid_business_days(self):
@@ -139,6 +357,9 @@ class TestStockPriceChangeByTicker:
         assert isinstance(df, pd.DataFrame)
         temp = df.iloc[0:5, 1] == np.array([4615, 25150, 4895, 135500, 5680])
         assert temp.sum() == 5
+        # 종목명의 공백과 특수문자는 제거된다.
+        assert df.loc["033780", "종목명"] == "KTG"
+        assert df.loc["079160", "종목명"] == "CJCGV"
 
     @pytest.mark.vcr
     def test_with_holidays(self):
@@ -0,0 +1,251 @@
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from pykrx import stock
+from pykrx.stock import store as _store
+from pykrx.website import krx
+from pykrx.website.comm.cache import KST
+from pykrx.website.krx.calendar import TradingCalendar
+
+# pylint: disable-all
+# flake8: noqa
+
+
+@pytest.fixture
+def fake_krx(monkeypatch):
+    """거래일 2021-01-04 ~ 2021-01-08 의 전종목 OHLCV를 흉내 낸다.
+
+    확정 거래일을 구할 수 있도록 최근 한 달의 평일도 거래일로 둔다.
+    """
+    today = datetime.datetime.now(KST).date()
+    calendar = pd.bdate_range("2021-01-04", "2021-01-08").union(
+        pd.bdate_range(today - datetime.timedelta(days=30), today)
+    )
+    calls = []
+
+    def _days(start, end):
+        ordinals = [day.toordinal() for day in calendar]
+        return [x for x in ordinals if start <= x <= end]
+
+    def _ohlcv(date, market):
+        calls.append(date)
+        close = int(date[-2:])
+        return pd.DataFrame(
+            {"종가": [close, close * 10]},
+            index=pd.Index(["005930", "000660"], name="티커"),
+        )
+
+    monkeypatch.setattr(TradingCalendar, "_fetch", staticmethod(_days))
+    monkeypatch.setattr(krx, "get_market_ohlcv_by_ticker", _ohlcv)
+    return calls
+
+
+class TestMarketStore:
+    def test_sync_appends_only_new_days(self, tmp_path, fake_krx):
+        store = stock.MarketStore(tmp_path, ["ohlcv"])
+        with pytest.raises(ValueError):
+            store.sync(until="20210106")
+
+        assert store.sync(until="20210106", since="20210104") == {"ohlcv": 3}
+        assert store.sync(until="20210108") == {"ohlcv": 2}
+        assert store.sync(until="20210108") == {"ohlcv": 0}
+        assert fake_krx == ["20210104", "20210105", "20210106", "20210107", "20210108"]
+        assert store.last_date("ohlcv") == "20210108"
+
+    def test_read_filters_dates_and_tickers(self, tmp_path, fake_krx):
+        store = stock.MarketStore(tmp_path, ["ohlcv"])
+        store.sync(until="20210108", since="20210104")
+
+        df = store.read("ohlcv", "20210105", "20210107", ["000660"])
+        assert df.index.names == ["날짜", "티커"]
+        assert list(df["종가"]) == [50, 60, 70]
+
+    def test_failed_day_keeps_store_contiguous(self, tmp_path, fake_krx, monkeypatch):
+        store = stock.MarketStore(tmp_path, ["ohlcv"])
+        fetch, settle = _store.DATASETS["ohlcv"]
+
+        def _fail_on_6th(date):
+            if date == "20210106":
+                raise ConnectionError("boom")
+            return fetch(date)
+
+        monkeypatch.setitem(_store.DATASETS, "ohlcv", (_fail_on_6th, settle))
+        with pytest.raises(RuntimeError):
+            store.sync(until="20210108", since="20210104")
+        assert store.dates("ohlcv") == ["20210104", "20210105"]
+
+    def test_empty_days_are_not_stored(self, tmp_path, fake_krx, monkeypatch):
+        store = stock.MarketStore(tmp_path, ["ohlcv"])
+        fetch, settle = _store.DATASETS["ohlcv"]
+        empty = {"20210104", "20210107"}
+
+        def _empty(date):
+            return pd.DataFrame() if date in empty else fetch(date)
+
+        monkeypatch.setitem(_store.DATASETS, "ohlcv", (_empty, settle))
+        # 데이터 제공 이전의 빈 일자는 건너뛰고, 이후의 빈 일자에서 멈춘다.
+        assert store.sync(until="20210108", since="20210104") == {"ohlcv": 2}
+        assert store.dates("ohlcv") == ["20210105", "20210106"]
+
+        empty.clear()
+        assert store.sync(until="20210108") == {"ohlcv": 2}
+        assert store.last_date("ohlcv") == "20210108"
+
+    def test_settle_applies_to_recent_sessions(self, tmp_path, fake_krx, monkeypatch):
+        store = stock.MarketStore(tmp_path, ["ohlcv"])
+        fetch, _ = _store.DATASETS["ohlcv"]
+        monkeypatch.setitem(_store.DATASETS, "ohlcv", (fetch, 2))
+        assert store.sync(until="20210108", since="20210104") == {"ohlcv": 5}
+
+        # 당일 이전에 마감된 최근 2거래일은 저장하지 않는다.
+        today = datetime.datetime.now(KST).date()
+        since = today - datetime.timedelta(days=10)
+        days = pd.bdate_range(since, today - datetime.timedelta(days=1))
+        recent = stock.MarketStore(tmp_path / "recent", ["ohlcv"])
+        assert recent.sync(since=since.strftime("%Y%m%d")) == {"ohlcv": len(days) - 2}
+        assert recent.last_date("ohlcv") == days[-3].strftime("%Y%m%d")
+
+
+class TestPanelMatrix:
+    @pytest.fixture
+    def panel(self):
+        index = pd.MultiIndex.from_tuples(
+            [
+                (pd.Timestamp("2021-01-04"), "005930"),
+                (pd.Timestamp("2021-01-04"), "000660"),
+                (pd.Timestamp("2021-01-05"), "005930"),
+                (pd.Timestamp("2021-01-06"), "000660"),
+                (pd.Timestamp("2021-01-06"), "005930"),
+            ],
+            names=["날짜", "티커"],
+        )
+        return pd.DataFrame(
+            {
+                "종가": np.array([83000, 140000, 83900, 138000, 82200], np.int32),
+                "등락률": np.array([2.5, 4.4, 1.1, -1.4, -2.0], np.float32),
+                "종목명": [
+                    "삼성전자",
+                    "SK하이닉스",
+                    "삼성전자",
+                    "SK하이닉스",
+                    "삼성전자",
+                ],
+            },
+            index=index,
+        )
+
+    def test_save_and_slice(self, tmp_path, panel):
+        stock.PanelMatrix.save(panel, tmp_path)
+        m = stock.PanelMatrix(tmp_path)
+        assert list(m.fields) == ["종가", "등락률"]
+        assert list(m.tickers) == ["000660", "005930"]
+
+        close = m.values("종가", "20210105", "20210106")
+        assert isinstance(close, np.memmap)
+        assert close.dtype == np.int32
+        assert close.tolist() == [[0, 83900], [138000, 82200]]
+        assert m.mask("20210105", "20210105").tolist() == [[False, True]]
+
+        df = m.frame("등락률", tickers=["005930"])
+        assert df.index.name == "날짜"
+        assert df["005930"].tolist() == pytest.approx([2.5, 1.1, -2.0])
+
+    def test_open_reader_keeps_its_build(self, tmp_path, panel):
+        old = stock.PanelMatrix.save(panel, tmp_path)
+
+        # 앞쪽으로 정렬되는 티커가 추가된 패널로 다시 저장한다.
+        extra = panel.iloc[:1].rename(index={"005930": "000020"}, level=1)
+        rebuilt = pd.concat([panel, extra]).sort_index()
+        for _ in range(3):
+            stock.PanelMatrix.save(rebuilt, tmp_path)
+
+        assert list(old.tickers) == ["000660", "005930"]
+        assert old.frame("종가").shape == (3, 2)
+        assert old.values("종가", tickers=["005930"])[:, 0].tolist() == [
+            83000,
+            83900,
+            82200,
+        ]
+        assert list(stock.PanelMatrix(tmp_path).tickers) == [
+            "000020",
+            "000660",
+            "005930",
+        ]
+
+    def test_build_follows_umask(self, tmp_path, panel):
+        umask = os.umask(0o022)
+        try:
+            stock.PanelMatrix.save(panel, tmp_path)
+        finally:
+            os.umask(umask)
+        (build,) = tmp_path.glob("build-*")
+        assert build.stat().st_mode & 0o777 == 0o755
+        assert (build / "mask.npy").stat().st_mode & 0o777 == 0o644
+        assert (tmp_path / "meta.json").stat().st_mode & 0o777 == 0o644
+        assert not list(tmp_path.glob(".*"))
+
+    def test_build_from_store(self, tmp_path, fake_krx):
+        store = stock.MarketStore(tmp_path, ["ohlcv"])
+        store.sync(until="20210108", since="20210104")
+        store.build_matrix("ohlcv")
+        m = store.matrix("ohlcv")
+        assert len(m.dates) == 5
+        assert m.values("종가", tickers=["000660"])[:, 0].tolist() == [
+            40,
+            50,
+            60,
+            70,
+            80,
+        ]
+
+
+class TestUniverseIndex:
+    @pytest.fixture
+    def store(self, tmp_path, fake_krx, monkeypatch):
+        # 091990: 01-07 코스닥 -> 코스피 이전, 123456: 01-05 상장, 01-07 상장폐지
+        listings = {
+            "KOSPI": lambda day: ["005930"] + (["091990"] if day >= 7 else []),
+            "KOSDAQ": lambda day: (
+                (["091990"] if day < 7 else []) + (["123456"] if 5 <= day <= 6 else [])
+            ),
+            "KONEX": lambda day: [],
+        }
+
+        def _names(date, market):
+            tickers = listings[market](int(date[-2:]))
+            return pd.Series(tickers, index=pd.Index(tickers, name="티커"))
+
+        monkeypatch.setattr(krx, "get_market_ticker_and_name", _names)
+        store = stock.MarketStore(tmp_path, ["universe"])
+        store.sync(until="20210108", since="20210104")
+        return store
+
+    def test_point_in_time_tickers(self, store, monkeypatch):
+        index = store.universe()
+        assert index.tickers("20210105", "KOSDAQ") == ["091990", "123456"]
+        assert index.tickers("20210107", "KOSPI") == ["005930", "091990"]
+        assert index.tickers("20210108") == ["005930", "091990"]
+        assert not index.covers("20210103")
+
+        members = index.members(pd.bdate_range("2021-01-04", "2021-01-11"))
+        assert list(members.columns) == ["005930", "091990", "123456"]
+        assert members["123456"].tolist() == [False, True, True, False, False, False]
+        assert members["005930"].tolist() == [True] * 5 + [False]
+
+        # 새 일자가 없으면 저장된 인덱스를 그대로 사용한다.
+        monkeypatch.setattr(store, "read", None)
+        assert store.universe().tickers("20210105", "KOSPI") == ["005930"]
+
+    def test_ticker_list_answered_locally(self, store, monkeypatch):
+        stock.set_universe(store.universe())
+        monkeypatch.setattr(krx, "get_market_ticker_and_name", None)
+        try:
+            assert stock.get_market_ticker_list("20210106", "KOSDAQ") == [
+                "091990",
+                "123456",
+            ]
+        finally:
+            stock.set_universe(None)
@@ -0,0 +1,375 @@
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pykrx.website.comm import cache as _cache
+from pykrx.website.comm.cache import DiskCache, make_cache_key
+from pykrx.website.comm.ratelimit import TokenBucket
+from pykrx.website.krx.krxio import KrxWebIo
+
+# pylint: disable-all
+# flake8: noqa
+
+BLD = "dbms/MDC/STAT/standard/MDCSTAT01501"
+
+
+class TestDiskCache:
+    def test_key_ignores_param_order_and_type(self):
+        k1 = make_cache_key(BLD, {"trdDd": "20210122", "mktId": "ALL"})
+        k2 = make_cache_key(BLD, {"mktId": "ALL", "trdDd": 20210122, "bld": BLD})
+        assert k1 == k2
+        assert k1 != make_cache_key(BLD, {"trdDd": "20210125", "mktId": "ALL"})
+
+    def test_past_date_is_immutable(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl=0)
+        params = {"trdDd": "20210122", "mktId": "ALL"}
+        cache.set(BLD, params, {"OutBlock_1": [{"ISU_SRT_CD": "005930"}]})
+        assert cache.get(BLD, params) == {"OutBlock_1": [{"ISU_SRT_CD": "005930"}]}
+
+    def test_today_uses_ttl(self, tmp_path):
+        today = datetime.datetime.now(_cache.KST).strftime("%Y%m%d")
+        params = {"trdDd": today, "mktId": "ALL"}
+
+        cache = DiskCache(tmp_path, ttl=0)
+        cache.set(BLD, params, {"OutBlock_1": []})
+        assert cache.get(BLD, params) is None
+
+        cache = DiskCache(tmp_path, ttl=60)
+        cache.set(BLD, params, {"OutBlock_1": []})
+        assert cache.get(BLD, params) == {"OutBlock_1": []}
+
+    def test_adjusted_prices_expire(self, tmp_path):
+        bld = "dbms/MDC/STAT/standard/MDCSTAT01701"
+        params = {"strtDd": "20210104", "endDd": "20210122", "adjStkPrc": 2}
+        data = {"output": [{"TRD_DD": "2021/01/22"}]}
+
+        DiskCache(tmp_path, adjusted_ttl=0).set(bld, params, data)
+        assert DiskCache(tmp_path).get(bld, params) is None
+        cache = DiskCache(tmp_path, adjusted_ttl=60)
+        cache.set(bld, params, data)
+        assert cache._load(make_cache_key(bld, params))["expires"] is not None
+        # 단순 종가 조회는 만료 없이 저장한다.
+        params["adjStkPrc"] = 1
+        cache.set(bld, params, data)
+        assert cache._load(make_cache_key(bld, params))["expires"] is None
+
+    def test_shorting_balance_waits_for_settlement(self, tmp_path, monkeypatch):
+        from pykrx.website.krx.calendar import TradingCalendar
+
+        bld = "dbms/MDC/STAT/srt/MDCSTAT30501"
+        today = datetime.datetime.now(_cache.KST).date()
+
+        def _day(n):
+            return (today - datetime.timedelta(days=n)).strftime("%Y%m%d")
+
+        # 이틀 전이 휴장일인 달력: 마감된 최근 2거래일은 1일 전과 3일 전이다.
+        holiday = (today - datetime.timedelta(days=2)).toordinal()
+        monkeypatch.setattr(
+            TradingCalendar,
+            "_fetch",
+            staticmethod(lambda s, e: [x for x in range(s, e + 1) if x != holiday]),
+        )
+        cache = DiskCache(tmp_path, ttl=0)
+
+        # 전일 잔고는 아직 공시 전이므로 확정으로 보지 않는다.
+        yesterday = _day(1)
+        assert not cache.is_immutable(bld, {"trdDd": yesterday})
+        assert cache.is_immutable(BLD, {"trdDd": yesterday})
+        assert not cache.is_immutable(bld, {"trdDd": _day(3)})
+        assert cache.is_immutable(bld, {"trdDd": _day(4)})
+        cache.set(bld, {"trdDd": yesterday, "mktId": "STK"}, {"OutBlock_1": []})
+        assert cache.get(bld, {"trdDd": yesterday, "mktId": "STK"}) is None
+        # 공시가 끝난 과거 잔고는 만료 없이 저장한다.
+        params = {"trdDd": "20210122", "mktId": "STK"}
+        cache.set(bld, params, {"OutBlock_1": [{"ISU_SRT_CD": "005930"}]})
+        assert cache.get(bld, params) is not None
+
+    def test_read_skips_network_on_hit(self, tmp_path, monkeypatch):
+        from pykrx.website.krx.market.core import 전종목시세
+
+        params = {"trdDd": "20210122", "mktId": "ALL"}
+        cache = DiskCache(tmp_path)
+        cache.set(BLD, params, {"OutBlock_1": [{"ISU_SRT_CD": "005930"}]})
+        monkeypatch.setattr(_cache, "_cache", cache)
+
+        def _fail(*args, **kwargs):
+            pytest.fail("network request on cache hit")
+
+        monkeypatch.setattr("pykrx.website.comm.webio.Post.read", _fail)
+        df = 전종목시세().fetch("20210122", "ALL")
+        assert df["ISU_SRT_CD"].tolist() == ["005930"]
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=20, burst=3)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        # 3개는 즉시, 나머지 2개는 1/20초 간격으로 허용된다.
+        assert 0.08 <= time.monotonic() - start < 0.5
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: bucket.acquire(), range(11)))
+        # 8개 스레드가 경쟁해도 첫 요청 이후 10개는 1/50초 간격으로 허용된다.
+        assert time.monotonic() - start >= 0.18
+
+
+class TestPeriodSplit:
+    def test_split_into_730_day_windows(self):
+        windows = KrxWebIo._split_period("20000101", "20051231")
+        assert windows[0] == ("20000101", "20011231")
+        assert windows[1][0] == "20020101"
+        assert windows[-1][1] == "20051231"
+        assert len(windows) == 3
+
+    def test_single_window(self):
+        assert KrxWebIo._split_period("20210104", "20210108") == [
+            ("20210104", "20210108")
+        ]
+
+
+class TestConnectionPool:
+    def test_session_shared_per_host(self):
+        from pykrx.website.comm import webio
+
+        krx_0 = webio.get_pooled_session("https://data.krx.co.kr/a.cmd")
+        krx_1 = webio.get_pooled_session("https://data.krx.co.kr/b.cmd")
+        naver = webio.get_pooled_session("http://fchart.stock.naver.com/sise.nhn")
+        assert krx_0 is krx_1
+        assert krx_0 is not naver
+
+        webio.configure_http(pool_size=4)
+        try:
+            assert webio.get_pooled_session("https://data.krx.co.kr/a.cmd") is not krx_0
+        finally:
+            webio.configure_http(pool_size=16)
+
+    def test_login_session_follows_new_settings(self):
+        import requests
+        from pykrx.website.comm import webio
+
+        session = webio.ensure_pool(requests.Session())
+        adapter = session.get_adapter("https://data.krx.co.kr")
+        assert webio.ensure_pool(session).get_adapter("https://x") is adapter
+
+        webio.configure_http(pool_size=4, keep_alive=False)
+        try:
+            webio.ensure_pool(session)
+            assert session.get_adapter("https://data.krx.co.kr") is not adapter
+            assert session.get_adapter("https://x")._pool_maxsize == 4
+            assert session.headers["Connection"] == "close"
+        finally:
+            webio.configure_http(pool_size=16, keep_alive=True)
+        webio.ensure_pool(session)
+        assert session.headers["Connection"] == "keep-alive"
+
+
+class TestLazyLogin:
+    def test_login_once_on_first_krx_request(self, monkeypatch):
+        from pykrx.website.comm import auth, webio
+
+        class FakeSession:
+            def is_valid(self):
+                return True
+
+        calls = []
+
+        def _build(login_id, login_pw):
+            calls.append(login_id)
+            time.sleep(0.05)
+            return FakeSession()
+
+        monkeypatch.setenv("KRX_ID", "id")
+        monkeypatch.setenv("KRX_PW", "pw")
+        monkeypatch.setattr(auth, "build_krx_session", _build)
+        monkeypatch.setattr(auth, "_auth_session", None)
+
+        # Naver 요청은 KRX 로그인을 유발하지 않는다.
+        assert webio.get_session("http://fchart.stock.naver.com/sise.nhn") is None
+        assert calls == []
+
+        url = "https://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(lambda _: webio.get_session(url), range(8)))
+        assert len(calls) == 1
+        assert all(s is sessions[0] for s in sessions)
+
+
+class TestLazyExports:
+    def test_exports_match_subpackages(self):
+        import importlib
+
+        from pykrx.website import krx
+
+        for sub, names in krx._EXPORTS.items():
+            module = importlib.import_module(f"pykrx.website.krx.{sub}")
+            assert names == tuple(module.__all__)
+            for name in names:
+                assert getattr(krx, name) is getattr(module, name)
+        with pytest.raises(AttributeError):
+            krx.not_a_function
+
+
+class TestBuildFrame:
+    def test_selects_columns_like_list_of_dicts(self):
+        from pandas import DataFrame
+        from pykrx.website.krx.decode import build_frame
+
+        records = [
+            {"ISU_SRT_CD": "005930", "TDD_CLSPRC": "82,200", "MKT_ID": "STK"},
+            {"ISU_SRT_CD": "035720", "TDD_CLSPRC": "471,500"},
+        ]
+        columns = ["TDD_CLSPRC", "MKT_ID"]
+        df = build_frame(records, columns)
+        assert df.equals(DataFrame(records)[columns])
+        assert build_frame([], columns).empty
+        with pytest.raises(KeyError):
+            build_frame(records, ["ISU_ABBRV"])
+
+
+class TestParseNumber:
+    def test_krx_formatted_numbers(self):
+        import numpy as np
+        from pykrx.website.krx.decode import parse_number
+
+        values = ["1,234", "-", "", "-1.90", "12 %"]
+        assert parse_number(values, np.float32).tolist() == pytest.approx(
+            [1234.0, 0.0, 0.0, -1.9, 12.0]
+        )
+        assert parse_number(values[:3], np.int64).tolist() == [1234, 0, 0]
+
+
+class TestRetry:
+    URL = "https://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+
+    class FakeResponse:
+        def __init__(self, status, body):
+            self.status_code = status
+            self.ok = status < 400
+            self.content = body
+            self.headers = {}
+
+    @pytest.fixture
+    def fast_retry(self, monkeypatch):
+        from pykrx.website.comm import retry
+
+        monkeypatch.setattr(retry, "_policy", retry.RetryPolicy(3, backoff=0))
+        monkeypatch.setattr(retry, "_breakers", {})
+        monkeypatch.setattr(retry, "_breaker_config", {"threshold": 2, "cooldown": 0.1})
+
+    def test_non_json_body_is_not_retried(self, fast_retry):
+        from pykrx.website.comm.retry import get_circuit_breaker
+        from pykrx.website.comm.webio import send_with_retry
+
+        responses = iter(
+            [
+                self.FakeResponse(503, b""),
+                self.FakeResponse(200, b"<html>error</html>"),
+                self.FakeResponse(200, b'{"output": []}'),
+            ]
+        )
+        resp = send_with_retry(self.URL, lambda: next(responses))
+        assert resp.content == b"<html>error</html>"
+        assert not get_circuit_breaker("data.krx.co.kr").is_open
+
+    def test_retry_after_is_capped(self, fast_retry, monkeypatch):
+        from pykrx.website.comm import retry, webio
+
+        monkeypatch.setattr(retry, "_policy", retry.RetryPolicy(2, max_backoff=0.05))
+        busy = self.FakeResponse(429, b"")
+        busy.headers["Retry-After"] = "3600"
+        responses = iter([busy, self.FakeResponse(200, b"{}")])
+
+        start = time.monotonic()
+        resp = webio.send_with_retry(self.URL, lambda: next(responses))
+        assert resp.status_code == 200
+        assert time.monotonic() - start < 1
+
+    def test_raise_after_max_attempts(self, fast_retry):
+        import requests
+        from pykrx.website.comm.retry import TransportError, get_circuit_breaker
+        from pykrx.website.comm.webio import send_with_retry
+
+        calls = []
+
+        def _send():
+            calls.append(time.monotonic())
+            raise requests.exceptions.ConnectionError("reset")
+
+        with pytest.raises(TransportError):
+            send_with_retry(self.URL, _send)
+        assert len(calls) == 3
+        # 연속 2회 실패로 circuit이 열려 세 번째 시도는 cooldown 이후에 보낸다.
+        assert calls[2] - calls[1] >= 0.09
+        assert get_circuit_breaker("data.krx.co.kr").is_open
+
+
+class TestSingleFlight:
+    def test_identical_requests_share_one_post(self, monkeypatch):
+        import threading
+
+        from pykrx.website.krx.market.core import 전종목시세
+
+        calls = []
+        barrier = threading.Barrier(8)
+
+        class FakeResponse:
+            def json(self):
+                return {"OutBlock_1": [{"ISU_SRT_CD": "005930"}]}
+
+        def _read(self, **params):
+            calls.append(params)
+            time.sleep(0.2)
+            return FakeResponse()
+
+        monkeypatch.setattr("pykrx.website.comm.webio.Post.read", _read)
+
+        def _fetch(_):
+            barrier.wait()
+            return 전종목시세().fetch("20210122", "ALL")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            dfs = list(executor.map(_fetch, range(8)))
+        assert len(calls) == 1
+        assert all(df["ISU_SRT_CD"].tolist() == ["005930"] for df in dfs)
+
+
+class TestMasterStore:
+    def test_snapshot_skips_fetch_until_stale(self, tmp_path):
+        import threading
+
+        import pandas as pd
+        from pykrx.website.krx.master import MasterStore
+
+        fetched = []
+
+        def _fetch():
+            fetched.append(1)
+            return pd.DataFrame({"종목": ["삼성전자"]}, index=["005930"])
+
+        store = MasterStore(tmp_path, max_age=60)
+        assert store.get("stock_listed", _fetch).loc["005930", "종목"] == "삼성전자"
+        assert store.get("stock_listed", _fetch) is not None
+        assert len(fetched) == 1
+
+        # 오래된 스냅샷은 바로 반환하고 백그라운드에서 갱신한다.
+        store.max_age = 0
+        refreshed = threading.Event()
+        df = store.get("stock_listed", _fetch, lambda df: refreshed.set())
+        assert not df.empty
+        assert refreshed.wait(5)
+        assert len(fetched) == 2
+
+    def test_failed_refresh_keeps_snapshot(self, tmp_path):
+        import pandas as pd
+        from pykrx.website.krx.master import MasterStore
+
+        store = MasterStore(tmp_path, max_age=0, background=False)
+        store.save("index", pd.DataFrame({"지수명": ["코스피"]}, index=["1001"]))
+        df = store.get("index", pd.DataFrame)
+        assert df.loc["1001", "지수명"] == "코스피"